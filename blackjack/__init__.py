@@ -1,4 +1,4 @@
 from blackjack.card import Card
-from blackjack.hand import Hand, DealerHand, PlayerHand
+from blackjack.hand import Hand, DealerHand, PlayerHand, HandPool
 from blackjack.deck import Deck
 from blackjack.player import Player
@@ -1,5 +1,223 @@
-from blackjack import blackjack_main
+"""
+This module is the package's command-line entry point: 'python -m blackjack [command] [options]'.
+
+Commands
+--------
+play
+    The interactive game ('blackjack_main.run'); the default when no command is given.
+simulate
+    A headless simulation of one set of table rules (see 'blackjack.simulation_job.SimulationJob'), optionally
+    checkpointed so that a killed job resumes where it left off.
+sweep
+    A cached, parallel sweep over combinations of table rules (see 'blackjack.sweep.run_sweep').
+replay
+    Plays the shoes of a shoe library file (see 'blackjack.shoe_library') with basic strategy.
+
+Headless commands print their results as JSON on stdout. Schedulers launch many short jobs, so each command imports
+only the modules it needs when it runs: e.g. 'simulate' never imports NumPy or multiprocessing, which only 'sweep' (and
+the interactive game's optional advisor) use.
+
+Any command can be profiled: '--profile PATH' (before the command) samples the game's hot functions while it runs (see
+'blackjack.profiling.HotPathProfiler'), writes the sampled stacks to PATH for a flame graph and prints each function's
+call count and cumulative time to stderr.
+"""
+import argparse
+
+
+def main(argv=None):
+    """
+    Parses the command-line arguments and runs the command.
+
+    Parameters
+    ----------
+    argv : list of str
+        The arguments, excluding the program name. Defaults to None: 'sys.argv[1:]'.
+    """
+    args = build_parser().parse_args(argv)
+    if args.profile is None:
+        args.command_function(args)
+        return
+
+    import sys
+    from blackjack.profiling import HotPathProfiler
+
+    profiler = HotPathProfiler(args.profile_interval)
+    try:
+        with profiler:
+            args.command_function(args)
+    finally:
+        profiler.write_folded(args.profile)
+        print(profiler.summary(), file=sys.stderr)
+
+
+def build_parser():
+    """Returns the argument parser, with a sub-parser for each command."""
+    parser = argparse.ArgumentParser(prog="python -m blackjack", description="Play or simulate blackjack.")
+    parser.set_defaults(command_function=play_command, render=False, advise=False)
+    parser.add_argument(
+        "--profile", metavar="PATH", help="profile the hot functions, writing sampled stacks (folded format) to PATH"
+    )
+    parser.add_argument(
+        "--profile-interval", type=int, default=100, help="time one in this many calls when profiling (default: 100)"
+    )
+    commands = parser.add_subparsers(title="commands")
+
+    play_parser = commands.add_parser("play", help="play the interactive game (the default)")
+    play_parser.add_argument("--render", action="store_true", help="draw each round as a table updated in place")
+    play_parser.add_argument("--advise", action="store_true", help="suggest a Kelly bet at the start of each round")
+    play_parser.set_defaults(command_function=play_command)
+
+    simulate_parser = commands.add_parser("simulate", help="simulate rounds of one set of table rules")
+    _add_rules_arguments(simulate_parser, multiple=False)
+    simulate_parser.add_argument("--rounds", type=int, required=True, help="the maximum number of rounds")
+    simulate_parser.add_argument("--seed", type=int, default=0, help="seeds the shoe's shuffles")
+    simulate_parser.add_argument("--bet", type=int, default=100, help="the bet per round, in minor currency units")
+    simulate_parser.add_argument(
+        "--target-half-width", type=float, help="stop early once the 95%% interval for EV is this tight"
+    )
+    simulate_parser.add_argument("--checkpoint", help="checkpoint file: the job resumes from it if it exists")
+    simulate_parser.add_argument("--checkpoint-interval", type=int, default=10000, help="rounds between checkpoints")
+    simulate_parser.set_defaults(command_function=simulate_command)
+
+    sweep_parser = commands.add_parser("sweep", help="simulate every combination of table rules, with a result cache")
+    _add_rules_arguments(sweep_parser, multiple=True)
+    sweep_parser.add_argument("--rounds", type=int, required=True, help="the number of rounds per combination")
+    sweep_parser.add_argument("--seed", type=int, default=0, help="seeds every combination's shoe")
+    sweep_parser.add_argument("--bet", type=int, default=100, help="the bet per round, in minor currency units")
+    sweep_parser.add_argument("--cache-dir", required=True, help="directory of cached results")
+    sweep_parser.add_argument("--processes", type=int, help="worker processes (default: one per CPU)")
+    sweep_parser.set_defaults(command_function=sweep_command)
+
+    replay_parser = commands.add_parser("replay", help="play the shoes of a shoe library with basic strategy")
+    _add_rules_arguments(replay_parser, multiple=False, deck_count=False)
+    replay_parser.add_argument("library", help="the shoe library file")
+    replay_parser.add_argument("--first-shoe", type=int, default=0, help="index of the first shoe played")
+    replay_parser.add_argument("--shoes", type=int, help="the number of shoes played (default: to the last shoe)")
+    replay_parser.add_argument("--bet", type=int, default=100, help="the bet per round, in minor currency units")
+    replay_parser.set_defaults(command_function=replay_command)
+    return parser
+
+
+def play_command(args):
+    """Runs the interactive game."""
+    from blackjack import blackjack_main
+
+    renderer = None
+    if args.render:
+        from blackjack.renderer import TableRenderer
+
+        renderer = TableRenderer()
+    advisor = None
+    if args.advise:
+        from blackjack.kelly import KellyAdvisor
+
+        advisor = KellyAdvisor()
+    blackjack_main.run(renderer=renderer, advisor=advisor)
+
+
+def simulate_command(args):
+    """Runs a simulation job and prints its statistics."""
+    from blackjack.simulation_job import SimulationJob
+
+    job = SimulationJob(
+        args.rounds,
+        args.seed,
+        checkpoint_path=args.checkpoint,
+        checkpoint_interval=args.checkpoint_interval,
+        rules=_rules_from_args(args),
+        bet=args.bet,
+        target_half_width=args.target_half_width,
+    )
+    _print_json(job.run().summary())
+
+
+def sweep_command(args):
+    """Runs a rules sweep and prints each combination's rules and statistics."""
+    from blackjack.sweep import rules_grid, run_sweep
+
+    rules_list = rules_grid(
+        deck_count=args.decks,
+        deck_length_limit=args.deck_length_limit,
+        dealer_hits_soft_17=[soft_17 == "hit" for soft_17 in args.soft_17],
+        natural_payout=args.natural_payout,
+    )
+    sweep_results = run_sweep(
+        rules_list, args.rounds, args.seed, args.cache_dir, bet=args.bet, processes=args.processes
+    )
+    _print_json([{"rules": rules.as_dict(), **statistics.summary()} for rules, statistics in sweep_results])
+
+
+def replay_command(args):
+    """Plays shoes from a shoe library and prints the statistics of every round."""
+    from blackjack.deck import Deck
+    from blackjack.running_stats import RoundStatistics
+    from blackjack.shoe_library import ShoeLibrary
+    from blackjack.simulation import play_shoe
+
+    round_statistics = RoundStatistics()
+    with ShoeLibrary(args.library) as shoe_library:
+        args.decks = shoe_library.get_deck_count()
+        rules = _rules_from_args(args)
+        shoe_count = len(shoe_library) - args.first_shoe if args.shoes is None else args.shoes
+        live_deck = Deck(rules.get_deck_count())
+        live_deck.attach_shoe_library(shoe_library, args.first_shoe)
+        for _ in range(shoe_count):
+            for round_result in play_shoe(live_deck, rules=rules, bet=args.bet):
+                round_statistics.update(*round_result)
+            live_deck.new_deck()  # Loads the library's next shoe
+        live_deck.detach_shoe_library()  # Releases the deck's view onto the library before it is closed
+    _print_json({"shoes": shoe_count, **round_statistics.summary()})
+
+
+def _add_rules_arguments(parser, multiple, deck_count=True):
+    """Adds the table rules options to a parser: one value each, or (for a sweep) a list of values to combine."""
+    list_args = {"nargs": "+"} if multiple else {}
+
+    def default(value):
+        return [value] if multiple else value
+
+    if deck_count:
+        parser.add_argument("--decks", type=int, default=default(6), help="52-card decks per shoe", **list_args)
+    parser.add_argument(
+        "--deck-length-limit", type=int, default=default(60), help="cards left when the shoe is replaced", **list_args
+    )
+    parser.add_argument(
+        "--soft-17", choices=("stand", "hit"), default=default("stand"), help="the dealer's play on soft 17",
+        **list_args
+    )
+    parser.add_argument(
+        "--natural-payout", type=_payout_ratio, default=default((3, 2)), help="odds paid on naturals, e.g. 6:5",
+        **list_args
+    )
+
+
+def _payout_ratio(text):
+    """Parses payout odds written as 'winnings:stake' (e.g. '3:2') into a tuple of int."""
+    try:
+        winnings, stake = (int(part) for part in text.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid payout odds (expected e.g. 3:2): {text}")
+    return winnings, stake
+
+
+def _rules_from_args(args):
+    """Returns the table rules given by a command's single-valued rules options."""
+    from blackjack.rules import Rules
+
+    return Rules(
+        deck_count=args.decks,
+        deck_length_limit=args.deck_length_limit,
+        dealer_hits_soft_17=args.soft_17 == "hit",
+        natural_payout=args.natural_payout,
+    )
+
+
+def _print_json(results):
+    """Prints a command's results as JSON."""
+    import json
+
+    print(json.dumps(results, indent=2))
 
 
 if __name__ == "__main__":
-    blackjack_main.run()
+    main()
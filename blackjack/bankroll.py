@@ -0,0 +1,245 @@
+"""
+This module exports the 'BankrollReport' class, the 'simulate_bankrolls' and 'payout_distribution' functions and the
+betting policies 'flat_bet' and 'proportional_bet'.
+
+A bankroll simulation follows many players' balances at once, round by round, as they bet against a fixed per-round
+payout distribution (from 'RoundStatistics' histograms or an exact calculation). Rounds are never replayed card by card:
+each round of every trajectory is a single draw from the distribution, and all trajectories still playing are advanced
+together as NumPy arrays. As in 'blackjack_main.run', a player starts with £500 and their session ends when their
+balance reaches zero (they are ruined) or the round limit is reached.
+
+All amounts are whole minor currency units (see 'blackjack.player.Player'): balances and bets are int64 arrays.
+
+Attributes
+----------
+default_percentiles : tuple of int
+    The percentiles of final balance and session length reported by default.
+"""
+import numpy as np
+
+default_percentiles = (5, 25, 50, 75, 95)
+
+
+class BankrollReport:
+    """
+    A class holding the outcome of a bankroll simulation: the final balance and session length of every trajectory.
+    """
+
+    def __init__(self, final_balances, session_lengths, round_limit):
+        """
+        Initialises a report. Use 'simulate_bankrolls' rather than calling this directly.
+
+        Parameters
+        ----------
+        final_balances : numpy.ndarray
+            The balance of each trajectory when its session ended, in minor currency units.
+        session_lengths : numpy.ndarray
+            The number of rounds played in each trajectory.
+        round_limit : int
+            The maximum number of rounds any trajectory could play.
+        """
+        self._final_balances = final_balances  # int64 array: one final balance per trajectory
+        self._session_lengths = session_lengths  # int64 array: one session length per trajectory
+        self._round_limit = round_limit  # Sessions reaching this length ended without ruin
+
+    def __len__(self):
+        """Allows len() to be used on reports, returning the number of trajectories simulated."""
+        return len(self._final_balances)
+
+    def get_final_balances(self):
+        """Returns the final balance of every trajectory as an int64 array, in minor currency units."""
+        return self._final_balances
+
+    def get_session_lengths(self):
+        """Returns the number of rounds played in every trajectory as an int64 array."""
+        return self._session_lengths
+
+    def risk_of_ruin(self):
+        """Returns the fraction of trajectories whose balance reached zero within the round limit."""
+        return float(np.mean(self._final_balances <= 0))
+
+    def final_balance_percentiles(self, percentiles=default_percentiles):
+        """
+        Returns percentiles of the final balance over all trajectories.
+
+        Parameters
+        ----------
+        percentiles : tuple of int
+            The percentiles to report, each between 0 and 100.
+
+        Returns
+        -------
+        dict
+            Maps each percentile to the final balance at that percentile, in minor currency units.
+        """
+        return dict(zip(percentiles, np.percentile(self._final_balances, percentiles).tolist()))
+
+    def session_length_percentiles(self, percentiles=default_percentiles):
+        """
+        Returns percentiles of the session length (in rounds) over all trajectories.
+
+        Parameters
+        ----------
+        percentiles : tuple of int
+            The percentiles to report, each between 0 and 100.
+
+        Returns
+        -------
+        dict
+            Maps each percentile to the session length at that percentile.
+        """
+        return dict(zip(percentiles, np.percentile(self._session_lengths, percentiles).tolist()))
+
+    def session_length_histogram(self, bin_count=20):
+        """
+        Returns the distribution of session lengths as a histogram.
+
+        Parameters
+        ----------
+        bin_count : int
+            The number of equal-width bins between zero and the round limit.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The number of trajectories in each bin and the bin edges (as returned by 'numpy.histogram').
+        """
+        return np.histogram(self._session_lengths, bins=bin_count, range=(0, self._round_limit))
+
+    def summary(self):
+        """Returns the key results as a dict: trajectories, risk of ruin and mean and median final balance and length."""
+        return {
+            "trajectories": len(self),
+            "risk_of_ruin": self.risk_of_ruin(),
+            "mean_final_balance": float(np.mean(self._final_balances)),
+            "median_final_balance": float(np.median(self._final_balances)),
+            "mean_session_length": float(np.mean(self._session_lengths)),
+            "median_session_length": float(np.median(self._session_lengths)),
+        }
+
+
+def flat_bet(bet):
+    """
+    Returns a betting policy that bets the same amount every round (or the whole balance, once it falls below 'bet').
+
+    Parameters
+    ----------
+    bet : int
+        The amount bet each round, in minor currency units.
+
+    Returns
+    -------
+    callable
+        The betting policy: maps an int64 array of balances to an int64 array of bets.
+    """
+    assert (isinstance(bet, int)) and (bet > 0), "'bet' must be a positive integer number of minor currency units!"
+    return lambda balances: np.minimum(balances, bet)
+
+
+def proportional_bet(fraction, minimum_bet=1):
+    """
+    Returns a betting policy that bets a fixed fraction of the current balance each round.
+
+    Parameters
+    ----------
+    fraction : float
+        The fraction of the balance bet each round, e.g. 0.02.
+    minimum_bet : int
+        The smallest bet allowed, in minor currency units (a player with less than this bets their whole balance).
+
+    Returns
+    -------
+    callable
+        The betting policy: maps an int64 array of balances to an int64 array of bets.
+    """
+    assert 0 < fraction <= 1, "'fraction' must be greater than 0 and at most 1!"
+    return lambda balances: np.minimum(
+        balances, np.maximum((balances * fraction).astype(np.int64), minimum_bet)
+    )
+
+
+def payout_distribution(round_statistics):
+    """
+    Returns the per-round payout distribution observed in a simulation, for use with 'simulate_bankrolls'.
+
+    Parameters
+    ----------
+    round_statistics : blackjack.running_stats.RoundStatistics
+        Statistics of simulated rounds, all played with the same bet.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The distinct net results (int64, minor currency units at the simulation's bet) and the fraction of rounds giving
+        each of them.
+    """
+    histogram = round_statistics.get_histogram()
+    net_results = np.fromiter(histogram.keys(), dtype=np.int64, count=len(histogram))
+    round_counts = np.fromiter(histogram.values(), dtype=np.float64, count=len(histogram))
+    return net_results, round_counts / round_counts.sum()
+
+
+def simulate_bankrolls(
+    net_results,
+    probabilities,
+    betting_policy,
+    reference_bet=100,
+    trajectory_count=10000,
+    round_limit=1000,
+    starting_balance=50000,
+    seed=None,
+):
+    """
+    Simulates many bankroll trajectories at once and returns their final balances and session lengths.
+
+    Each round, every trajectory still playing draws a net result from the payout distribution, scaled from the
+    'reference_bet' it was measured at to the bet chosen by 'betting_policy'. Scaled winnings are rounded down to a whole
+    minor currency unit, as in 'blackjack.rules.payout_amount'.
+
+    Parameters
+    ----------
+    net_results : array_like of int
+        The distinct net results of a round at the reference bet, in minor currency units.
+    probabilities : array_like of float
+        The probability of each net result; must sum to 1.
+    betting_policy : callable
+        Maps an int64 array of current balances to an int64 array of bets, e.g. from 'flat_bet' or 'proportional_bet'.
+        Bets must be positive and no larger than the balance.
+    reference_bet : int
+        The bet at which 'net_results' were measured, in minor currency units. Defaults to 100 (the simulation default).
+    trajectory_count : int
+        The number of independent trajectories simulated.
+    round_limit : int
+        The maximum number of rounds in a session.
+    starting_balance : int
+        Every trajectory's balance before the first round, in minor currency units. Defaults to 50000 (£500).
+    seed : int
+        Seeds the random generator. Defaults to None (fresh entropy from the operating system).
+
+    Returns
+    -------
+    blackjack.bankroll.BankrollReport
+        The final balance and session length of every trajectory.
+    """
+    net_results = np.asarray(net_results, dtype=np.int64)
+    probabilities = np.asarray(probabilities, dtype=np.float64)
+    assert len(net_results) == len(probabilities), "Every net result needs a probability!"
+    assert abs(probabilities.sum() - 1) < 1e-9, "Probabilities must sum to 1!"
+
+    rng = np.random.default_rng(seed)
+    balances = np.full(trajectory_count, starting_balance, dtype=np.int64)
+    session_lengths = np.zeros(trajectory_count, dtype=np.int64)
+    playing = np.arange(trajectory_count)  # Indices of trajectories whose sessions have not ended
+
+    for _ in range(round_limit):
+        if len(playing) == 0:
+            break
+        live_balances = balances[playing]
+        bets = np.asarray(betting_policy(live_balances), dtype=np.int64)
+        assert np.all((bets > 0) & (bets <= live_balances)), "Bets must be positive and no larger than the balance!"
+        round_nets = net_results[rng.choice(len(net_results), size=len(playing), p=probabilities)]
+        balances[playing] = live_balances + (bets * round_nets) // reference_bet
+        session_lengths[playing] += 1
+        playing = playing[balances[playing] > 0]
+
+    return BankrollReport(balances, session_lengths, round_limit)
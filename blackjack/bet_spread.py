@@ -0,0 +1,223 @@
+"""
+This module exports the 'HiLoCounter' and 'BetRamp' classes and the 'play_counted_shoes' and 'evaluate_ramps' functions:
+automated, count-driven betting.
+
+A counter wraps a deck and keeps the Hi-Lo running count of every card dealt from the current shoe. The 'true count' is
+the running count per deck remaining in the shoe. A bet ramp maps the true count to a bet through a table of bets, one
+per whole true count, clamped at both ends of the table.
+
+The player's actions never depend on their bet, so a sequence of shoes only needs to be played once: each round's true
+count and its net result at a reference bet are recorded, and the result of any ramp is then the reference result
+scaled by the ramp's bet at that count. Evaluating a batch of ramps is a single array lookup (every ramp's bet at every
+recorded count) followed by integer array arithmetic.
+
+Attributes
+----------
+hi_lo_tags : tuple of int
+    The Hi-Lo tag of each card, indexed by its strategy value (see 'blackjack.strategy.upcard_value'): +1 for 2 to 6,
+    0 for 7 to 9 and -1 for tens and aces.
+"""
+import math
+import random
+import numpy as np
+from blackjack import Player
+from blackjack.deck import Deck
+from blackjack.rules import default_rules
+from blackjack.simulation import new_hand_pools, play_round, simulated_player_name
+from blackjack.strategy import BasicStrategy, upcard_value
+
+hi_lo_tags = (0, 0, 1, 1, 1, 1, 1, 0, 0, 0, -1, -1)
+
+
+class HiLoCounter:
+    """
+    A class wrapping a deck to keep the Hi-Lo count of the cards dealt from it.
+
+    A counter can be used anywhere its deck is dealt from (e.g. 'blackjack.simulation.play_round'): cards are dealt by
+    the wrapped deck and counted as they pass through. Starting a new shoe with 'new_deck' resets the count.
+    """
+
+    def __init__(self, live_deck):
+        """
+        Initialises a counter for a freshly shuffled deck.
+
+        Parameters
+        ----------
+        live_deck : blackjack.deck.Deck
+            The deck dealt from and counted.
+        """
+        self._live_deck = live_deck
+        self._running_count = 0  # Sum of the Hi-Lo tags of every card dealt from the current shoe
+
+    def __len__(self):
+        """Returns the number of cards left in the wrapped deck."""
+        return len(self._live_deck)
+
+    def deal_card(self):
+        """Deals a card from the wrapped deck, adding its Hi-Lo tag to the running count."""
+        card = self._live_deck.deal_card()
+        self._running_count += hi_lo_tags[upcard_value(card)]
+        return card
+
+    def return_cards(self, cards):
+        """Passes discarded cards back to the wrapped deck; they have already been counted."""
+        self._live_deck.return_cards(cards)
+
+    def new_deck(self):
+        """Replaces the wrapped deck's cards with a new shoe and resets the running count."""
+        self._live_deck.new_deck()
+        self._running_count = 0
+
+    def get_running_count(self):
+        """Returns the Hi-Lo running count of the current shoe."""
+        return self._running_count
+
+    def true_count(self):
+        """Returns the running count per deck remaining, rounded down to a whole number (as used by bet ramps)."""
+        decks_remaining = max(len(self._live_deck), 1) / 52
+        return math.floor(self._running_count / decks_remaining)
+
+
+class BetRamp:
+    """
+    A class defining a bet ramp: a table of bets indexed by whole true counts.
+    """
+
+    def __init__(self, bets, min_true_count=0):
+        """
+        Initialises a bet ramp.
+
+        Parameters
+        ----------
+        bets : list of int
+            The bet at each true count from 'min_true_count' upwards, in minor currency units. Lower counts take the
+            first bet and higher counts take the last, e.g. [100, 100, 200, 400, 800] from a true count of 0 bets £1 at
+            counts of 1 or less and £8 at counts of 4 or more.
+        min_true_count : int
+            The true count of the first bet in 'bets'.
+        """
+        assert all(
+            (isinstance(bet, int)) and (bet > 0) for bet in bets
+        ), "Bets must be positive integer numbers of minor currency units!"
+        self._bets = tuple(bets)
+        self._min_true_count = min_true_count
+
+    def __repr__(self):
+        return f"BetRamp({list(self._bets)!r}, min_true_count={self._min_true_count})"
+
+    def get_bets(self):
+        """Returns the ramp's table of bets, in order of increasing true count."""
+        return self._bets
+
+    def get_min_true_count(self):
+        """Returns the true count of the first bet in the ramp's table."""
+        return self._min_true_count
+
+    def bet_for(self, true_count):
+        """
+        Returns the bet placed at a true count.
+
+        Parameters
+        ----------
+        true_count : int
+            The whole true count, e.g. from 'HiLoCounter.true_count'.
+        """
+        bet_idx = min(max(true_count - self._min_true_count, 0), len(self._bets) - 1)
+        return self._bets[bet_idx]
+
+
+def play_counted_shoes(shoe_count, rules=None, strategy=None, reference_bet=100, seed=None):
+    """
+    Plays whole shoes headlessly and records the true count before, and the net result of, every round.
+
+    Parameters
+    ----------
+    shoe_count : int
+        The number of shoes to play. Each shoe is played until fewer cards remain than the rules' deck length limit.
+    rules : blackjack.rules.Rules
+        The table rules. Defaults to None: 'blackjack.rules.default_rules'.
+    strategy : blackjack.strategy.Strategy
+        Chooses the player's actions. Defaults to None: basic strategy is played.
+    reference_bet : int
+        The bet placed every round, in minor currency units.
+    seed : int
+        Seeds the shuffle of the shoes.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The true count before each round and the net result of each round at the reference bet (both int64).
+    """
+    if rules is None:
+        rules = default_rules
+    if strategy is None:
+        strategy = BasicStrategy()
+    counter = HiLoCounter(Deck(rules.get_deck_count(), rng=random.Random(seed)))
+    hand_pools = new_hand_pools(Player(simulated_player_name), rules)
+    deck_length_limit = rules.get_deck_length_limit()
+    true_counts, net_results = [], []
+    for shoe_idx in range(shoe_count):
+        if shoe_idx > 0:
+            counter.new_deck()
+        while len(counter) >= deck_length_limit:
+            true_counts.append(counter.true_count())
+            net_results.append(play_round(counter, strategy, reference_bet, hand_pools=hand_pools)[0])
+    return np.array(true_counts, dtype=np.int64), np.array(net_results, dtype=np.int64)
+
+
+def evaluate_ramps(
+    ramp_bets, true_counts, net_results, min_true_count=0, reference_bet=100, risk_of_ruin=0.05, batch_size=256
+):
+    """
+    Evaluates a batch of bet ramps over the same recorded rounds (see 'play_counted_shoes').
+
+    Parameters
+    ----------
+    ramp_bets : array_like of int
+        The ramps to evaluate, shape (ramp count, count levels): row i is the table of bets of ramp i (as in
+        'BetRamp.get_bets'), all starting at 'min_true_count'.
+    true_counts : numpy.ndarray
+        The true count before each recorded round.
+    net_results : numpy.ndarray
+        The net result of each recorded round at the reference bet, in minor currency units.
+    min_true_count : int
+        The true count of the first column of 'ramp_bets'.
+    reference_bet : int
+        The bet at which 'net_results' were recorded. Scaled winnings are rounded down to a whole minor currency unit.
+    risk_of_ruin : float
+        The acceptable chance of losing the whole bankroll, used to size the bankroll requirement.
+    batch_size : int
+        The number of ramps evaluated per array operation; bounds peak memory use for large batches of ramps.
+
+    Returns
+    -------
+    dict of numpy.ndarray
+        One value per ramp: 'ev_per_100' (mean net result per 100 rounds), 'sd_per_100' (standard deviation of the net
+        result over 100 rounds), 'mean_bet' and 'bankroll' (the bankroll giving 'risk_of_ruin' under a normal
+        approximation, -variance * ln(risk_of_ruin) / (2 * EV) per round; infinite for ramps without a positive EV).
+        All amounts are in minor currency units.
+    """
+    ramp_bets = np.atleast_2d(np.asarray(ramp_bets, dtype=np.int64))
+    count_idx = np.clip(true_counts - min_true_count, 0, ramp_bets.shape[1] - 1)
+    round_count = len(net_results)
+    net_totals = np.empty(len(ramp_bets), dtype=np.int64)
+    net_squared_totals = np.empty(len(ramp_bets), dtype=np.float64)
+    bet_totals = np.empty(len(ramp_bets), dtype=np.int64)
+    for first_ramp in range(0, len(ramp_bets), batch_size):
+        batch = slice(first_ramp, first_ramp + batch_size)
+        round_bets = ramp_bets[batch, count_idx]  # The single lookup: every ramp's bet in every round
+        ramp_nets = (round_bets * net_results) // reference_bet
+        net_totals[batch] = ramp_nets.sum(axis=1)
+        net_squared_totals[batch] = np.einsum("ij,ij->i", ramp_nets, ramp_nets, dtype=np.float64)
+        bet_totals[batch] = round_bets.sum(axis=1)
+
+    ev = net_totals / round_count
+    variance = (net_squared_totals - net_totals * ev) / max(round_count - 1, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bankroll = np.where(ev > 0, -variance * math.log(risk_of_ruin) / (2 * ev), np.inf)
+    return {
+        "ev_per_100": 100 * ev,
+        "sd_per_100": 10 * np.sqrt(variance),
+        "mean_bet": bet_totals / round_count,
+        "bankroll": bankroll,
+    }
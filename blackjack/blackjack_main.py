@@ -9,26 +9,25 @@ e.g. a single round, are defined in their own functions to improve readability:
 
 Attributes
 ----------
-number_of_decks : int
-    The number of 52-card decks that are shuffled into the dealer's deck object. This applies to the initial deck
-    created at the start of the game and any subsequent decks created when the previous decks runs out of cards.
-    Casinos normally use 6 decks at a time.
-deck_length_limit : int
-    When the number of cards in the deck falls below this limit, a new deck of card objects is created and shuffled.
+game_rules : blackjack.rules.Rules
+    The table rules for the game. These set: the number of 52-card decks shuffled into the dealer's deck object
+    (applying to the initial deck and any subsequent decks created when the previous deck runs out of cards); the
+    deck length limit, below which a new deck of card objects is created and shuffled; the dealer's drawing rule; and
+    the payouts for naturals and other winning hands.
 exit_string : str
     If this string is entered by the user, the user exits the game.
 """
 
-from blackjack import Player, Deck, DealerHand, PlayerHand
+from blackjack import Player, Deck, DealerHand, PlayerHand, HandPool
+from blackjack.rules import Rules
 import sys
 import time
 
-number_of_decks = 6
-deck_length_limit = 60
+game_rules = Rules()
 exit_string = "quit"
 
 
-def run():
+def run(renderer=None, advisor=None):
     """
     Controls the flow of the blackjack game based on user actions and outcomes. Call 'blackjack_main.py' to execute.
 
@@ -36,33 +35,46 @@ def run():
     A deck is then created; the while loop continues to invoke single rounds of blackjack: one after another. If the
     player's balance reaches zero, the loop is escaped and the game ends with a game over message. The while loop also
     checks the number of cards left in the deck before initiating another round: if the number of cards drops below a
-    threshold value, a new deck is shuffled for use in subsequent rounds.
+    threshold value, a new deck is shuffled for use in subsequent rounds. Each seat's hands are drawn from a small pool
+    of reusable hand objects, so no hand objects are created once the game is under way.
+
+    Parameters
+    ----------
+    renderer : blackjack.renderer.TableRenderer
+        If given, each round is drawn as a table updated in place (see 'single_round'). Defaults to None: hands are
+        printed after every action.
+    advisor : blackjack.kelly.KellyAdvisor
+        If given, a bet is suggested to the player at the start of each round. Defaults to None: no suggestion.
     """
     print_welcome_message()
     player_one = Player()
-    game_deck = Deck(number_of_decks)
+    game_deck = Deck(game_rules.get_deck_count())
+    player_hands = HandPool(PlayerHand, player_one)
+    dealer_hands = HandPool(DealerHand, game_rules)
     while player_one.get_balance() > 0:
         time.sleep(1)
-        if len(game_deck) < deck_length_limit:
+        if len(game_deck) < game_rules.get_deck_length_limit():
             game_deck.new_deck()
             print_new_deck_message()
         else:
             print_new_round_message()
 
         single_round(
-            game_deck, player_one
-        )  # This starts the first round of the game, providing the above deck and player objects as input args
+            game_deck, player_one, player_hands, dealer_hands, renderer=renderer, advisor=advisor
+        )  # This starts the first round of the game, providing the above deck, player and hand pools as input args
 
     print_game_over_message(player_one)
 
 
-def single_round(live_deck, player_one):
+def single_round(
+    live_deck, player_one, player_hands=None, dealer_hands=None, side_bets=None, renderer=None, advisor=None
+):
     """
     Steps through a single round of blackjack: accepting user inputs as actions and manipulating objects as required.
 
-    Defining a new hand object for each participant every round removes the need tidy-up hand statuses; clear out
-    cards, etc. By reassigning the same reference to the fresh hands, we rely on Python to garbage collect old
-    inaccessible hand objects.
+    Each participant's hand is acquired from a pool of reusable hands: acquiring a hand resets it, clearing out its
+    cards, statuses and bet, so the round starts from empty hands without allocating new hand objects. Without pools,
+    fresh hand objects are created for the round.
 
     Parameters
     ----------
@@ -72,18 +84,45 @@ def single_round(live_deck, player_one):
         The player competing against the dealer in this round. The PlayerHand object defined below will belong to this
         player who will bet against it from their game balance. In future, this argument may be expanded to import a
         collection of players to the round.
+    player_hands : blackjack.hand.HandPool
+        A pool of the player's hand objects. Defaults to None: a new hand object is created for the player.
+    dealer_hands : blackjack.hand.HandPool
+        A pool of the dealer's hand objects. Defaults to None: a new hand object is created for the dealer.
+    side_bets : list of tuple
+        Side bets placed by the player this round, as (blackjack.side_bets.SideBet, amount in minor currency units).
+        Each is staked after the main bet, if the player's balance covers it, and settled on the initial deal. Defaults
+        to None: no side bets.
+    renderer : blackjack.renderer.TableRenderer
+        If given, once bets are placed the round is drawn as a table and only the cells that change (e.g. a card drawn,
+        the message or the balance) are rewritten; the table is closed before anything else is printed. Defaults to
+        None: both hands are printed in full after every action.
+    advisor : blackjack.kelly.KellyAdvisor
+        If given, recommends a bet from the composition of 'live_deck', shown as the player places their bet. Defaults
+        to None: no bet is suggested.
     """
     # Initialise hands
-    players_hand = PlayerHand(player_one)  # Initialises a hand object for the player
+    if player_hands is None:
+        player_hands = HandPool(PlayerHand, player_one, pool_size=1)
+    if dealer_hands is None:
+        dealer_hands = HandPool(DealerHand, game_rules, pool_size=1)
+    players_hand = player_hands.acquire()  # An empty hand object for the player
     dealers_hand = (
-        DealerHand()
-    )  # Initialises a hand object for the computer-controlled dealer
+        dealer_hands.acquire()
+    )  # An empty hand object for the computer-controlled dealer
 
     # Record player balance at start of the round
     round_start_balance = player_one.get_balance()
 
     # Bets are placed
-    player_one.place_bet(players_hand)
+    suggested_bet = None
+    if advisor is not None:
+        suggested_bet = advisor.recommend_bet(live_deck, player_one.get_balance())
+    player_one.place_bet(players_hand, suggested_bet)
+    placed_side_bets = []
+    for side_bet, side_bet_amount in side_bets or ():
+        if 0 < side_bet_amount <= player_one.get_balance():
+            player_one.update_balance(-side_bet_amount)
+            placed_side_bets.append((side_bet, side_bet_amount))
 
     # Draws two cards each for the player and the dealer
     players_hand.draw_card(live_deck)
@@ -91,38 +130,68 @@ def single_round(live_deck, player_one):
     players_hand.draw_card(live_deck)
     dealers_hand.draw_card(live_deck)
 
-    # Hands are printed before play commences
-    dealers_hand.print_hand()  # Prints the dealer's hand
-    players_hand.print_hand()  # Prints the player's hand
+    # Hands are printed (or the table is drawn) before play commences
+    if renderer is None:
+        dealers_hand.print_hand()  # Prints the dealer's hand
+        players_hand.print_hand()  # Prints the player's hand
+    else:
+        renderer.open()
+        renderer.show_hands(dealers_hand, players_hand)
+        renderer.show_balance(player_one, players_hand.get_bet())
+
+    # Side bets are settled on the player's first two cards and the dealer's face-up card
+    side_bet_messages = [
+        settle_side_bet(side_bet, side_bet_amount, players_hand, dealers_hand, player_one)
+        for side_bet, side_bet_amount in placed_side_bets
+    ]
+    if renderer is None:
+        for side_bet_message in side_bet_messages:
+            print(side_bet_message)
+    elif side_bet_messages:
+        renderer.show_message("   ".join(side_bet_messages))
+        renderer.show_balance(player_one, players_hand.get_bet())
 
     # Detects and settles any naturals drawn by the dealer or player; if round is fully resolved, exits 'single_round'
+    if renderer is not None and dealers_hand.natural_multiplier(players_hand) is not None:
+        renderer.close()  # Naturals are announced in print
     round_complete = dealers_hand.settle_naturals(players_hand, player_one)
     if round_complete:
+        live_deck.return_cards([*players_hand, *dealers_hand])
         print_balance_difference(player_one, round_start_balance)
         return
 
     # While loop prompts the user for actions until they 'stand' or go bust
     while players_hand.is_active():
-        single_player_action(live_deck, players_hand)
-        dealers_hand.print_hand()
-        players_hand.print_hand()
+        single_player_action(live_deck, players_hand, renderer)
+        if renderer is None:
+            dealers_hand.print_hand()
+            players_hand.print_hand()
+        else:
+            renderer.show_hands(dealers_hand, players_hand)
 
     time.sleep(1)
 
     # If-Else blocks resolve the round by comparing player and dealer hand values and paying-out to players if required
     if players_hand.is_bust():
         # Player immediately loses bet (discarded with their hand); exit this round without resolving dealers hand
-        print("You've gone bust!")
+        if renderer is None:
+            print("You've gone bust!")
+        else:
+            renderer.show_message("You've gone bust!")
         time.sleep(1)
     else:
         player_score_message = f"Your score = {players_hand.best_hand_value()}"
-        dealers_hand.resolve_hand(live_deck, players_hand, player_score_message)
+        dealers_hand.resolve_hand(live_deck, players_hand, player_score_message, renderer)
         dealers_hand.settle_bet(players_hand, player_one)
 
+    live_deck.return_cards([*players_hand, *dealers_hand])  # Discards go back into a continuous shuffling machine
+    if renderer is not None:
+        renderer.show_balance(player_one)
+        renderer.close()
     print_balance_difference(player_one, round_start_balance)
 
 
-def single_player_action(live_deck, live_player_hand):
+def single_player_action(live_deck, live_player_hand, renderer=None):
     """
     Processes one action from the player, currently: a choice between 'hit' (take a card) or 'stand' (no more cards).
 
@@ -135,14 +204,23 @@ def single_player_action(live_deck, live_player_hand):
         The game's 'live' deck object. If player action requires a card to be dealt, it will be dealt from this deck.
     live_player_hand : blackjack.hand.PlayerHand
         The player's 'live' hand object. The output action (hit/stand) will be applied to this hand.
+    renderer : blackjack.renderer.TableRenderer
+        If given, the open table the player is prompted in. Defaults to None: the prompt is printed.
     """
+    invalid_action_message = "Invalid action: please enter 'h' to hit or 's' to stand..."
     while True:
-        action_key = input("\nHit [h] or Stand [s]: ")
+        if renderer is None:
+            action_key = input("\nHit [h] or Stand [s]: ")
+        else:
+            action_key = renderer.prompt("Hit [h] or Stand [s]: ")
         if action_key.lower() == exit_string:
             sys.exit()
         elif action_key.lower() == "h" or action_key.lower() == "s":
             break
-        print("Invalid action: please enter 'h' to hit or 's' to stand...")
+        if renderer is None:
+            print(invalid_action_message)
+        else:
+            renderer.show_message(invalid_action_message)
 
     if action_key.lower() == "h":
         live_player_hand.draw_card(live_deck)
@@ -150,6 +228,41 @@ def single_player_action(live_deck, live_player_hand):
         live_player_hand.stand()
 
 
+def settle_side_bet(side_bet, side_bet_amount, live_player_hand, live_dealer_hand, player_obj):
+    """
+    Settles a side bet on the initial deal, paying any winnings to the player, and returns a message of its outcome.
+
+    Parameters
+    ----------
+    side_bet : blackjack.side_bets.SideBet
+        The side bet to settle.
+    side_bet_amount : int
+        The amount staked on the side bet (already taken from the player's balance), in minor currency units.
+    live_player_hand : blackjack.hand.PlayerHand
+        The player's 'live' hand object, holding the two cards of the initial deal.
+    live_dealer_hand : blackjack.hand.DealerHand
+        The dealer's 'live' hand object; its first card is face-up.
+    player_obj : blackjack.player.Player
+        The player who placed the side bet.
+
+    Returns
+    -------
+    str
+        The outcome of the side bet, e.g. '21+3: flush! (+ £25.00)'.
+    """
+    from blackjack.side_bets import initial_deal_cards  # Imports NumPy, only needed by games with side bets
+
+    deal_cards = initial_deal_cards(live_player_hand, live_dealer_hand)
+    side_bet_payout = side_bet.payout(deal_cards, side_bet_amount)
+    if side_bet_payout == 0:
+        return f"{side_bet.get_name()}: no win"
+    player_obj.update_balance(side_bet_payout)
+    return (
+        f"{side_bet.get_name()}: {side_bet.outcome(deal_cards)}! "
+        f"(+ {player_obj.format_amount(side_bet_payout - side_bet_amount)})"
+    )
+
+
 def print_welcome_message():
     """Prints a welcome message when the user starts the game."""
     print(
@@ -198,17 +311,15 @@ def print_balance_difference(player_obj, round_start_balance):
     ----------
     player_obj : blackjack.player.Player
         The player object for which change in balance across the round is calculated/printed.
-    round_start_balance : float
-        The balance associated with 'player_obj' at the start of the current round.
+    round_start_balance : int
+        The balance associated with 'player_obj' at the start of the current round, in minor currency units.
     """
     round_balance_diff = player_obj.get_balance() - round_start_balance
     if round_balance_diff < 0:
         diff_sign = "-"
     else:
         diff_sign = "+"
-    print(
-        f"\n({diff_sign} {player_obj.get_currency()}{abs(round_balance_diff):.{player_obj.get_precision()}f})"
-    )
+    print(f"\n({diff_sign} {player_obj.format_amount(abs(round_balance_diff))})")
 
 
 if __name__ == "__main__":
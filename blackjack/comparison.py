@@ -0,0 +1,175 @@
+"""
+This module exports the 'StrategyComparison' class and the 'compare_strategies' function: head-to-head comparison of
+strategies with common random numbers.
+
+Every strategy plays every round from exactly the same cards. Each shoe is encoded once as rank/suit byte pairs (see
+'Deck.encode_card'); at the start of each round, every strategy is dealt from its own fork of the shoe, loaded without
+copying at the current position (see 'Deck.load_shoe'). Forks agree card for card until the first decision where the
+strategies differ, so any difference in their results is caused by that decision alone. The shoe then advances by the
+cards used by the first (baseline) strategy.
+
+Strategies are forked once per round, at its start, rather than at the first decision where they differ: the cards
+dealt before that decision are the same in every fork, so the results are identical, and replaying the few cards of
+the shared start of a round costs less than capturing and restoring the round at each decision.
+
+Because the strategies' results are strongly correlated, the difference in EV is estimated from the per-round
+differences (a paired comparison). Its variance is far smaller than that of two independent runs, so close strategies
+are separated in far fewer rounds.
+"""
+import random
+from blackjack import Player
+from blackjack.deck import Deck
+from blackjack.rules import default_rules
+from blackjack.running_stats import RoundStatistics
+from blackjack.simulation import new_hand_pools, play_round, simulated_player_name
+
+
+class StrategyComparison:
+    """
+    A class holding the results of a head-to-head comparison: each strategy's round statistics and the statistics of
+    each strategy's per-round difference from the baseline (the first strategy).
+    """
+
+    def __init__(self, strategy_statistics, difference_statistics):
+        """
+        Initialises a comparison. Use 'compare_strategies' rather than calling this directly.
+
+        Parameters
+        ----------
+        strategy_statistics : list of blackjack.running_stats.RoundStatistics
+            The statistics of each strategy, baseline first.
+        difference_statistics : list of blackjack.running_stats.RoundStatistics
+            For each strategy, the statistics of its net result minus the baseline's, round by round. Outcomes are
+            recorded as 'same' or 'different'.
+        """
+        self._strategy_statistics = strategy_statistics
+        self._difference_statistics = difference_statistics
+
+    def __len__(self):
+        """Returns the number of rounds each strategy played."""
+        return len(self._strategy_statistics[0])
+
+    def get_strategy_statistics(self, strategy_idx):
+        """Returns the round statistics of the strategy at 'strategy_idx'."""
+        return self._strategy_statistics[strategy_idx]
+
+    def get_difference_statistics(self, strategy_idx):
+        """Returns the statistics of the strategy's per-round differences from the baseline."""
+        return self._difference_statistics[strategy_idx]
+
+    def ev_difference(self, strategy_idx):
+        """Returns the strategy's EV per round minus the baseline's EV per round, in minor currency units."""
+        return self._difference_statistics[strategy_idx].mean()
+
+    def difference_interval(self, strategy_idx, z_score=1.96):
+        """
+        Returns the paired confidence interval for the strategy's EV minus the baseline's EV.
+
+        Parameters
+        ----------
+        strategy_idx : int
+            The index of the strategy compared with the baseline.
+        z_score : float
+            The number of standard errors either side of the mean. Defaults to 1.96 (a 95% interval).
+
+        Returns
+        -------
+        tuple of float
+            The lower and upper bounds of the interval, in minor currency units per round.
+        """
+        return self._difference_statistics[strategy_idx].confidence_interval(z_score)
+
+    def variance_reduction(self, strategy_idx):
+        """
+        Returns how many times more rounds two independent runs would need to match the paired interval's precision.
+
+        This is the variance of the difference between independent runs (the sum of the two strategies' variances)
+        divided by the variance of the paired differences; infinite if the strategies never differ.
+        """
+        paired_variance = self._difference_statistics[strategy_idx].variance()
+        independent_variance = (
+            self._strategy_statistics[0].variance() + self._strategy_statistics[strategy_idx].variance()
+        )
+        if paired_variance == 0:
+            return float("inf")
+        return independent_variance / paired_variance
+
+    def summary(self, z_score=1.96):
+        """
+        Returns one dict per strategy compared with the baseline: the EV difference, its interval bounds, the fraction
+        of rounds with different results and the variance reduction.
+        """
+        summaries = []
+        for strategy_idx in range(1, len(self._strategy_statistics)):
+            lower_bound, upper_bound = self.difference_interval(strategy_idx, z_score)
+            summaries.append(
+                {
+                    "ev_difference": self.ev_difference(strategy_idx),
+                    "difference_lower": lower_bound,
+                    "difference_upper": upper_bound,
+                    "different_rate": self._difference_statistics[strategy_idx].outcome_rate("different"),
+                    "variance_reduction": self.variance_reduction(strategy_idx),
+                }
+            )
+        return summaries
+
+
+def compare_strategies(strategies, round_limit, rules=None, bet=100, seed=None):
+    """
+    Plays every strategy on the same sequence of shuffled shoes and compares each one with the first.
+
+    Parameters
+    ----------
+    strategies : list of blackjack.strategy.Strategy
+        The strategies to compare; the first is the baseline and sets how far the shoe advances each round.
+    round_limit : int
+        The number of rounds each strategy plays.
+    rules : blackjack.rules.Rules
+        The table rules. A new shoe is shuffled whenever fewer cards remain than the rules' deck length limit. Defaults
+        to None: 'blackjack.rules.default_rules'.
+    bet : int
+        The amount bet each round, in minor currency units.
+    seed : int
+        Seeds the shuffle of the shoes.
+
+    Returns
+    -------
+    blackjack.comparison.StrategyComparison
+        The statistics of each strategy and of each strategy's paired difference from the baseline.
+    """
+    assert len(strategies) >= 2, "At least two strategies are needed for a comparison!"
+    if rules is None:
+        rules = default_rules
+    shuffled_deck = Deck(rules.get_deck_count(), rng=random.Random(seed))
+    forks = [Deck(rules.get_deck_count(), shoe_buffer=b"") for _ in strategies]  # One per strategy, on the shared shoe
+    player_obj = Player(simulated_player_name)
+    hand_pools = [new_hand_pools(player_obj, rules) for _ in strategies]
+    strategy_statistics = [RoundStatistics() for _ in strategies]
+    difference_statistics = [RoundStatistics() for _ in strategies]
+    deck_length_limit = rules.get_deck_length_limit()
+
+    shoe_view = memoryview(b"")
+    shoe_position = 0  # Byte offset of the top card of the shared shoe
+    for _ in range(round_limit):
+        if (len(shoe_view) - shoe_position) // 2 < deck_length_limit:
+            shuffled_deck.new_deck()
+            shoe_view = memoryview(b"".join(Deck.encode_card(card) for card in shuffled_deck))
+            shoe_position = 0
+
+        round_nets = []
+        for fork, strategy, fork_pools, round_statistics in zip(
+            forks, strategies, hand_pools, strategy_statistics
+        ):
+            fork.load_shoe(shoe_view[shoe_position:])
+            net_result, outcome = play_round(fork, strategy, bet, hand_pools=fork_pools)
+            round_statistics.update(net_result, outcome)
+            round_nets.append(net_result)
+        shoe_position = len(shoe_view) - 2 * len(forks[0])  # Advances past the cards the baseline used
+
+        for net_result, round_differences in zip(round_nets, difference_statistics):
+            net_difference = net_result - round_nets[0]
+            round_differences.update(net_difference, "same" if net_difference == 0 else "different")
+
+    for fork in forks:
+        fork.release_shoe()  # Drops each fork's view of the shared shoe
+    return StrategyComparison(strategy_statistics, difference_statistics)
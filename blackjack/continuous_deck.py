@@ -0,0 +1,105 @@
+"""
+This module exports the 'ContinuousShufflingDeck' and 'InfiniteDeck' classes: alternatives to a standard shoe.
+
+Both can be used anywhere a 'Deck' is dealt from ('Hand.draw_card' only needs 'deal_card'; game loops also use len()
+and new_deck()). Neither ever needs reshuffling: their length never falls below a deck length limit by more than the
+cards currently on the table, and they deal each card in constant time and constant memory.
+
+Attributes
+----------
+infinite_deck_length : int
+    The length reported by an infinite deck: large enough that it never falls below a deck length limit.
+"""
+import random
+import sys
+from blackjack.deck import Deck, rank_names, suit_names
+
+infinite_deck_length = sys.maxsize
+
+
+class ContinuousShufflingDeck(Deck):
+    """
+    A subclass of deck modelling a continuous shuffling machine (CSM).
+
+    Discards are fed back into the machine at the end of every round (via 'return_cards'), so the shoe never runs down.
+    Each card dealt is picked uniformly at random from the cards currently in the machine: one step of a Fisher-Yates
+    shuffle, in constant time. The machine holds a fixed set of card objects, so memory use is constant.
+    """
+
+    def __init__(self, input_deck_count, rng=None):
+        """
+        Initialises a shuffling machine loaded with one or more 52-card sets.
+
+        Parameters
+        ----------
+        input_deck_count : int
+            The number of 52-card sets loaded into the machine.
+        rng : random.Random
+            The random generator used to pick cards. Defaults to None: Python's shared 'random' generator.
+        """
+        super().__init__(input_deck_count, rng=rng, lazy_shuffle=True)
+
+    def return_cards(self, cards):
+        """
+        Feeds discarded cards back into the machine, face-up, at random positions.
+
+        Parameters
+        ----------
+        cards : iterable of blackjack.card.Card
+            The discarded cards: the cards of every hand in the finished round.
+        """
+        for card in cards:
+            if not card.is_face_up():
+                card.flip_card()
+            self._live_deck.append(card)
+            self._count_card(card, 1)
+        self._unshuffled = True  # Returned cards are mixed in: the order of the machine is random again
+
+
+class InfiniteDeck:
+    """
+    A class modelling an infinite deck: the limit of a continuous shuffling machine loaded with infinitely many decks.
+
+    Every card is drawn independently, with each of the 52 rank/suit combinations equally likely, so the probability of
+    each rank never changes however many cards are dealt. This gives a fast analytical baseline for simulation: an
+    infinite deck holds no cards at all, only a random generator.
+    """
+
+    def __init__(self, rng=None):
+        """
+        Initialises an infinite deck.
+
+        Parameters
+        ----------
+        rng : random.Random
+            The random generator used to draw cards. Defaults to None: Python's shared 'random' generator.
+        """
+        self._rng = random if rng is None else rng
+
+    def __len__(self):
+        """Returns 'infinite_deck_length': an infinite deck never runs low."""
+        return infinite_deck_length
+
+    def __repr__(self):
+        return "InfiniteDeck()"
+
+    def new_deck(self):
+        """Does nothing: an infinite deck never needs replacing."""
+
+    def shuffle_deck(self):
+        """Does nothing: every card drawn from an infinite deck is already independent of the others."""
+
+    def return_cards(self, cards):
+        """Does nothing: discards make no difference to an infinite deck."""
+
+    def deal_card(self):
+        """
+        Returns a new face-up card with a rank and suit drawn uniformly at random. Called by hand objects.
+
+        Returns
+        -------
+        blackjack.card.Card
+            The card dealt.
+        """
+        card_idx = self._rng.randrange(len(rank_names) * len(suit_names))
+        return Deck.decode_card(card_idx % len(rank_names), card_idx // len(rank_names))
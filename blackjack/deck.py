@@ -1,8 +1,48 @@
 """
-This module exports the 'Deck' class and related methods.
+This module exports the 'Deck' class and related methods, and the 'validate_deck_count' and 'composition_hash' functions.
 """
 from blackjack import Card
-from random import shuffle
+import random
+
+suit_names = ("Spades", "Hearts", "Clubs", "Diamonds")  # The four suits found in a pack of cards
+rank_names = (
+    "Ace",
+    "Two",
+    "Three",
+    "Four",
+    "Five",
+    "Six",
+    "Seven",
+    "Eight",
+    "Nine",
+    "Ten",
+    "Jack",
+    "Queen",
+    "King",
+)  # The thirteen ranks of card within each suit
+rank_short_names = (
+    "A",
+    "2",
+    "3",
+    "4",
+    "5",
+    "6",
+    "7",
+    "8",
+    "9",
+    "10",
+    "J",
+    "Q",
+    "K",
+)  # Equivalent tuple of shortened rank names (useful for displaying as text to player)
+rank_values = ((1, 11), 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10)  # The 13 card values in blackjack
+rank_value_classes = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9, 9)  # Value class of each rank: ace, two to nine, ten-value
+value_class_count = 10  # The number of value classes counted in a deck's composition
+composition_keys = []  # Zobrist keys: a random 64-bit key per value class and card count (see 'composition_hash')
+_composition_key_rng = random.Random(
+    0x5EED
+)  # Generates 'composition_keys'; fixed seed, so hashes are stable between runs and processes
+_value_class_by_rank = dict(zip(rank_names, rank_value_classes))
 
 
 class Deck:
@@ -15,7 +55,7 @@ class Deck:
     the new_deck() method.
     """
 
-    def __init__(self, input_deck_count):
+    def __init__(self, input_deck_count, rng=None, lazy_shuffle=False, shoe_buffer=None):
         """
         Initialises a shuffled deck object.
 
@@ -23,65 +63,46 @@ class Deck:
         ----------
         input_deck_count : int
             The number of 52-card sets to be shuffled into a deck object on initialisation.
+        rng : random.Random
+            The random generator used to shuffle the deck. Defaults to None: Python's shared 'random' generator is
+            used. Passing a seeded generator makes the order of every shoe reproducible.
+        lazy_shuffle : bool
+            If True, new decks are not shuffled up-front: each call to deal_card() instead picks the next card uniformly
+            at random from the cards remaining (an incremental Fisher-Yates shuffle). The deal order is distributed
+            exactly as for a full shuffle, but the random work is proportional to the number of cards dealt. Defaults
+            to False.
+        shoe_buffer : bytes-like
+            If given, the deck starts by dealing from this pre-shuffled shoe (see 'load_shoe'): no card objects are
+            created or shuffled. An empty buffer gives an empty deck, e.g. for a worker that only loads shared shoes.
+            Defaults to None: a full shoe of card objects is created and shuffled.
         """
         self._live_deck = (
             []
         )  # The list of card objects making up the deck: populated on initialisation by new_deck()
-        self._suit_names = (
-            "Spades",
-            "Hearts",
-            "Clubs",
-            "Diamonds",
-        )  # The four suits found in a pack of cards
-        self._rank_names = (
-            "Ace",
-            "Two",
-            "Three",
-            "Four",
-            "Five",
-            "Six",
-            "Seven",
-            "Eight",
-            "Nine",
-            "Ten",
-            "Jack",
-            "Queen",
-            "King",
-        )  # The thirteen ranks of card within each suit
-        self._rank_short = (
-            "A",
-            "2",
-            "3",
-            "4",
-            "5",
-            "6",
-            "7",
-            "8",
-            "9",
-            "10",
-            "J",
-            "Q",
-            "K",
-        )  # Equivalent tuple of shortened rank names (useful for displaying as text to player)
-        self._rank_values = (
-            (1, 11),
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            10,
-            10,
-            10,
-        )  # The 13 card values in blackjack
-
-        self._validate_deck_count(input_deck_count)
+        self._suit_names = suit_names  # The four suits found in a pack of cards
+        self._rank_names = rank_names  # The thirteen ranks of card within each suit
+        self._rank_short = rank_short_names  # Equivalent shortened rank names (useful for displaying as text)
+        self._rank_values = rank_values  # The 13 card values in blackjack
+        self._shoe_buffer = None  # Rank/suit byte pairs of a pre-shuffled shoe being dealt from; otherwise None
+        self._shoe_position = 0  # Offset (in bytes) of the next card to be dealt from '_shoe_buffer'
+        self._shoe_library = None  # An attached 'ShoeLibrary' supplying shoes to new_deck(); otherwise None
+        self._next_shoe_index = 0  # Index of the library shoe that the next call to new_deck() will load
+        self._rng = random if rng is None else rng  # The random generator used to shuffle the deck
+        self._shoe_rng_state = None  # State of '_rng' immediately before the current shoe was shuffled
+        self._cards_dealt = 0  # The number of cards dealt since the current shoe was created
+        self._lazy_shuffle = lazy_shuffle  # Whether new decks are shuffled incrementally as cards are dealt
+        self._unshuffled = False  # True while the remaining cards of a lazily shuffled deck are still in order
+
+        self._composition = None  # Cards left in the deck per value class; None until counted (see 'composition')
+        self._composition_hash = 0  # Zobrist hash of '_composition', updated incrementally as cards are dealt
+
+        validate_deck_count(input_deck_count)
         self._deck_count = input_deck_count
-        self.new_deck()
+        _extend_composition_keys(16 * input_deck_count)
+        if shoe_buffer is None:
+            self.new_deck()
+        else:
+            self.load_shoe(shoe_buffer)
 
     def __iter__(self):
         """
@@ -90,8 +111,20 @@ class Deck:
         Yields
         ------
             card : blackjack.card.Card
-                The next card in the deck (within the deck object's '_live_deck' attribute).
+                The next card in the deck (within the deck object's '_live_deck' attribute, or decoded from the
+                remaining bytes of '_shoe_buffer' when dealing from a pre-shuffled shoe).
+
+        Iterating over a lazily shuffled deck (see '__init__') first shuffles its remaining cards: once the order of the
+        deck has been observed, it is fixed and cards are dealt in that order.
         """
+        if self._shoe_buffer is not None:
+            for position in range(self._shoe_position, len(self._shoe_buffer), 2):
+                yield self.decode_card(
+                    self._shoe_buffer[position], self._shoe_buffer[position + 1]
+                )
+            return
+        if self._unshuffled:
+            self.shuffle_deck()
         for card in self._live_deck:
             yield card
 
@@ -108,6 +141,8 @@ class Deck:
 
     def __len__(self):
         """Allows len() to be used on deck objects, returning the number of cards in the deck as the object 'length'."""
+        if self._shoe_buffer is not None:
+            return (len(self._shoe_buffer) - self._shoe_position) // 2
         return len(self._live_deck)
 
     def new_deck(self):
@@ -116,8 +151,21 @@ class Deck:
 
         The game deck is populated with an integer number of full 52-card sets, set by the '_deck_count' attribute.
         Once the game deck has been created, another 'Deck' method: 'shuffle_deck' is called to randomly order the
-        card objects within the list, giving a shuffled deck to start or continue the game.
+        card objects within the list, giving a shuffled deck to start or continue the game. For a lazily shuffled deck
+        (see '__init__'), shuffling is deferred: cards are picked at random as they are dealt.
+
+        If a shoe library is attached (see 'attach_shoe_library'), the next pre-shuffled shoe is loaded from the library
+        instead: no card objects are created up-front and no shuffling takes place.
         """
+        if self._shoe_library is not None:
+            shoe_index = self._next_shoe_index % len(self._shoe_library)
+            self._next_shoe_index = shoe_index + 1
+            self.load_shoe(self._shoe_library.shoe(shoe_index))
+            return
+
+        self._shoe_buffer = None
+        self._cards_dealt = 0
+        self._shoe_rng_state = self._rng.getstate()
         self._live_deck.clear()  # This line clears any existing elements from the '_live_deck' list - only required
         # when calling the method against an existing 'Deck' object, e.g.: " some_deck_object.new_deck() " would
         # effectively clear-out the existing deck, replacing it with a fresh one
@@ -129,11 +177,18 @@ class Deck:
                     self._live_deck.append(
                         Card(suit, rank, rank_short, rank_value, deck_number,)
                     )
-        self.shuffle_deck()  # Calls the 'shuffle_deck' method against the current Deck object
+        self._composition = [4 * self._deck_count] * value_class_count
+        self._composition[-1] = 16 * self._deck_count  # Tens, jacks, queens and kings share a value class
+        self._composition_hash = composition_hash(self._composition)
+        if self._lazy_shuffle:
+            self._unshuffled = True  # Cards are picked at random as they are dealt
+        else:
+            self.shuffle_deck()  # Calls the 'shuffle_deck' method against the current Deck object
 
     def shuffle_deck(self):
         """Applies a new random ordering to the card objects contained within a deck object."""
-        shuffle(self._live_deck)
+        self._rng.shuffle(self._live_deck)
+        self._unshuffled = False
 
     def deal_card(self):
         """
@@ -144,7 +199,180 @@ class Deck:
         blackjack.card.Card
             The top card from the deck object is returned: it has been removed from the deck.
         """
-        return self._live_deck.pop(0)
+        if self._shoe_buffer is not None:
+            position = self._shoe_position
+            assert position < len(self._shoe_buffer), "Cannot deal a card: the shoe is empty."
+            self._shoe_position = position + 2
+            self._cards_dealt += 1
+            rank_idx = self._shoe_buffer[position]
+            if self._composition is not None:
+                self._update_composition(rank_value_classes[rank_idx], -1)
+            return self.decode_card(rank_idx, self._shoe_buffer[position + 1])
+        self._cards_dealt += 1
+        if self._unshuffled:
+            # One step of a Fisher-Yates shuffle: swap a randomly chosen remaining card to the end and deal it from there
+            chosen_idx = self._rng.randrange(len(self._live_deck))
+            self._live_deck[chosen_idx], self._live_deck[-1] = self._live_deck[-1], self._live_deck[chosen_idx]
+            card = self._live_deck.pop()
+        else:
+            card = self._live_deck.pop(0)
+        self._count_card(card, -1)
+        return card
+
+    def composition(self):
+        """
+        Returns the number of cards left in the deck in each value class: aces, two to nine, then ten-value cards.
+
+        Kept up to date as cards are dealt. After 'load_shoe', the loaded shoe is counted on the first call (one pass
+        over its bytes), so forks that never ask for their composition never pay for it.
+
+        Returns
+        -------
+        tuple of int
+            Ten card counts, indexed as 'rank_value_classes' (and 'blackjack.probability.shoe_composition').
+        """
+        if self._composition is None:
+            self._count_composition()
+        return tuple(self._composition)
+
+    def composition_hash(self):
+        """
+        Returns a 64-bit Zobrist hash of the deck's composition (see 'composition'), e.g. to key memo tables.
+
+        Decks with equal compositions have equal hashes, regardless of the order of their cards or how they were dealt.
+        The hash is updated with two XORs per card dealt, so reading it costs nothing.
+        """
+        if self._composition is None:
+            self._count_composition()
+        return self._composition_hash
+
+    def _count_card(self, card, count_change):
+        """Adds a card object to (count_change = 1) or removes it from (-1) the deck's composition, if counted."""
+        if self._composition is not None:
+            self._update_composition(_value_class_by_rank[card._rank], count_change)
+
+    def _update_composition(self, class_idx, count_change):
+        """Adds 'count_change' cards to a value class of the deck's composition, updating its hash incrementally."""
+        class_keys = composition_keys[class_idx]
+        class_count = self._composition[class_idx]
+        self._composition_hash ^= class_keys[class_count] ^ class_keys[class_count + count_change]
+        self._composition[class_idx] = class_count + count_change
+
+    def _count_composition(self):
+        """Counts the composition of the cards left in the deck from scratch, e.g. after a shoe is loaded."""
+        self._composition = [0] * value_class_count
+        if self._shoe_buffer is not None:
+            for position in range(self._shoe_position, len(self._shoe_buffer), 2):
+                self._composition[rank_value_classes[self._shoe_buffer[position]]] += 1
+        else:
+            for card in self._live_deck:
+                self._composition[_value_class_by_rank[card._rank]] += 1
+        self._composition_hash = composition_hash(self._composition)
+
+    def return_cards(self, cards):
+        """
+        Called with the cards of finished hands at the end of each round. A standard shoe keeps discards out of play
+        until new_deck() is called, so this does nothing; decks modelling a continuous shuffling machine override it.
+
+        Parameters
+        ----------
+        cards : iterable of blackjack.card.Card
+            The discarded cards.
+        """
+
+    def get_shoe_state(self):
+        """
+        Returns the minimal state needed to recreate the deck exactly as it is now (see 'restore_shoe_state').
+
+        Rather than recording the order of every remaining card, the state records the random generator's state from
+        just before the current shoe was shuffled and the number of cards dealt since.
+
+        Returns
+        -------
+        tuple
+            The generator state (as returned by 'random.Random.getstate') and the number of cards dealt.
+
+        Raises
+        ------
+        AssertionError
+            Raised when the deck is dealing from a pre-shuffled shoe (see 'load_shoe').
+        """
+        assert self._shoe_buffer is None, "Cannot record the state of a deck dealing from a pre-shuffled shoe."
+        return self._shoe_rng_state, self._cards_dealt
+
+    def restore_shoe_state(self, shoe_state):
+        """
+        Recreates the deck from a state returned by 'get_shoe_state': the same shoe is reshuffled and the cards that had
+        already been dealt are discarded. The random generator is left exactly as it was when the state was recorded.
+
+        Parameters
+        ----------
+        shoe_state : tuple
+            The generator state and number of cards dealt, as returned by 'get_shoe_state'.
+        """
+        rng_state, cards_dealt = shoe_state
+        self._shoe_library = None
+        self._rng.setstate(rng_state)
+        self.new_deck()
+        for _ in range(cards_dealt):
+            self.deal_card()
+
+    def load_shoe(self, shoe_buffer):
+        """
+        Replaces the deck's cards with a pre-shuffled shoe encoded as rank/suit byte pairs; cards are dealt in order.
+
+        The buffer is not copied: cards are decoded from it one at a time as they are dealt. Each card is stored as two
+        bytes: an index into 'rank_names' followed by an index into 'suit_names'. Any object supporting the buffer
+        protocol can be used, e.g. a slice of a memory-mapped shoe library or a row of a NumPy array.
+
+        Parameters
+        ----------
+        shoe_buffer : bytes-like
+            The encoded shoe, top card first. Must hold an even number of bytes.
+        """
+        shoe_view = memoryview(shoe_buffer).cast("B")
+        assert len(shoe_view) % 2 == 0, "'shoe_buffer' must hold whole rank/suit byte pairs!"
+        self._live_deck.clear()
+        self._shoe_buffer = shoe_view
+        self._shoe_position = 0
+        self._composition = None  # Counted on demand: see 'composition'
+
+    def attach_shoe_library(self, shoe_library, shoe_index=0):
+        """
+        Deals from a library of pre-shuffled shoes: the shoe at 'shoe_index' is loaded immediately and each subsequent
+        call to new_deck() loads the following shoe (wrapping back to the first shoe after the last).
+
+        Parameters
+        ----------
+        shoe_library : blackjack.shoe_library.ShoeLibrary
+            An open shoe library holding shoes of the same number of 52-card sets as this deck.
+        shoe_index : int
+            Index of the first library shoe to be dealt. Defaults to 0.
+        """
+        assert (
+            shoe_library.get_deck_count() == self._deck_count
+        ), "Shoe library deck count does not match the deck count of this deck object."
+        self._shoe_library = shoe_library
+        self._next_shoe_index = shoe_index
+        self.new_deck()
+
+    def detach_shoe_library(self):
+        """Stops dealing from an attached shoe library and replaces the deck with a freshly shuffled one."""
+        self._shoe_library = None
+        self._shoe_buffer = None
+        self.new_deck()
+
+    def release_shoe(self):
+        """
+        Stops dealing from a loaded pre-shuffled shoe (see 'load_shoe'), dropping the deck's view of its buffer so that
+        the memory behind it (e.g. a shared memory block) can be closed. Unlike 'detach_shoe_library', no new shoe is
+        created: the deck is left empty until new_deck() or load_shoe() is called.
+        """
+        self._shoe_buffer = None
+        self._shoe_position = 0
+        self._live_deck.clear()
+        self._unshuffled = False
+        self._composition = None  # Counted on demand: see 'composition'
 
     def print_deck(self):
         """
@@ -162,15 +390,88 @@ class Deck:
         return empty_string
 
     @staticmethod
-    def _validate_deck_count(input_deck_count):
+    def encode_card(card):
         """
-        Asserts that 'input_deck_count' is a positive integer when initialising a deck object.
+        Returns the rank/suit byte pair identifying a card object, as used by 'load_shoe' and shoe libraries.
 
         Parameters
         ----------
-        input_deck_count : int
-            The number of 52-card sets to be shuffled into a deck object on initialisation
+        card : blackjack.card.Card
+            The card to encode.
+
+        Returns
+        -------
+        bytes
+            Two bytes: the card's index in 'rank_names' followed by its index in 'suit_names'.
         """
-        assert (isinstance(input_deck_count, int)) and (
-            input_deck_count > 0
-        ), "'input_deck_count' must be a positive integer!"
+        return bytes((rank_names.index(card._rank), suit_names.index(card._suit)))
+
+    @staticmethod
+    def decode_card(rank_idx, suit_idx):
+        """
+        Creates a face-up card object from a rank/suit byte pair (the inverse of 'encode_card').
+
+        Parameters
+        ----------
+        rank_idx : int
+            The card's index in 'rank_names'.
+        suit_idx : int
+            The card's index in 'suit_names'.
+
+        Returns
+        -------
+        blackjack.card.Card
+            A new card object (with a deck number of 1: encoded cards do not record which 52-card set they came from).
+        """
+        return Card(
+            suit_names[suit_idx],
+            rank_names[rank_idx],
+            rank_short_names[rank_idx],
+            rank_values[rank_idx],
+            0,
+        )
+
+
+def validate_deck_count(input_deck_count):
+    """
+    Asserts that 'input_deck_count' is a positive integer when initialising a deck object (or any other shoe).
+
+    Parameters
+    ----------
+    input_deck_count : int
+        The number of 52-card sets to be shuffled into a deck object on initialisation
+    """
+    assert (isinstance(input_deck_count, int)) and (
+        input_deck_count > 0
+    ), "'input_deck_count' must be a positive integer!"
+
+
+def composition_hash(composition):
+    """
+    Returns the 64-bit Zobrist hash of a deck composition: the XOR of the key of each value class' card count.
+
+    Parameters
+    ----------
+    composition : sequence of int
+        The number of cards in each value class (see 'Deck.composition').
+
+    Returns
+    -------
+    int
+        The hash, equal to 'Deck.composition_hash' for a deck with this composition.
+    """
+    _extend_composition_keys(max(composition))
+    hash_value = 0
+    for class_keys, class_count in zip(composition_keys, composition):
+        hash_value ^= class_keys[class_count]
+    return hash_value
+
+
+def _extend_composition_keys(max_count):
+    """Generates Zobrist keys for card counts up to 'max_count' in every value class, if not generated already."""
+    if not composition_keys:
+        composition_keys.extend([] for _ in range(value_class_count))
+    # Keys are generated count by count across all classes, so each key is the same however the table was extended
+    while len(composition_keys[0]) <= max_count:
+        for class_keys in composition_keys:
+            class_keys.append(_composition_key_rng.getrandbits(64))
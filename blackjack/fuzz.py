@@ -0,0 +1,652 @@
+"""
+This module exports the 'FuzzFailure' class, the 'run_fuzz' and 'shrink_case' functions and the built-in checks of a
+differential fuzz harness: randomised cases are played through a reference (the object model, 'Hand' and 'DealerHand',
+or a literal implementation of the rules) and through every fast path, and any disagreement is shrunk to a minimal
+reproducer.
+
+A case is a sequence of byte pairs (cards, as rank/suit byte pairs as in 'Deck.encode_card', unless a check reads them
+otherwise) and a tuple of options. A check plays a case and returns None if every fast path agrees with the reference,
+otherwise a message describing the mismatch. Cases the reference itself cannot play (e.g. a round that runs out of
+cards) are not mismatches. The built-in checks:
+
+'hand'
+    Cards are drawn one by one into a player's hand until they run out or the hand stops being active, so the
+    reference statuses come from 'Hand._verify_hand_status'. The hand's value, softness, length and statuses are
+    compared with the packed hand codec ('blackjack.hand_codec') and with the exact calculator's outcome for a player
+    who stands on the hand ('OutcomeCalculator.player_distribution').
+'round'
+    A full round is played from the cards with a threshold strategy: the reference plays and settles it by the
+    literal rules of the game (see '_reference_round'), sharing none of the settlement and dealer drawing code of the
+    game or the simulations. Its net result and the cards used are compared with the headless round engine
+    ('blackjack.simulation.play_round'), which every simulation is built on. Options: the table rules' index in
+    'fuzz_rules', the strategy's standing value and the bet.
+'rank_shoe'
+    Each byte pair is a random draw for a 'blackjack.rank_shoe.RankShoe': the value class of each card it deals and its
+    composition (count, per-class counts and Zobrist hash) after each deal are compared with a literal shoe, a list of
+    the value class of every card left. Options: the number of decks.
+'ev'
+    The cards are a small shoe (five or six cards). The exact calculator's EV for a round dealt from it
+    ('OutcomeCalculator.initial_ev') is compared with a brute-force enumeration of every order its cards can be dealt
+    in, each round played by the reference of the 'round' check. Options: as for 'round', without the bet.
+'side_bet'
+    The cards are initial deals of three cards. Each deal's net result from a side bet's batch settlement
+    ('SideBet.batch_net_results', over an array of card types) is compared with classifying its cards by the side
+    bet's literal rules and paytable. Options: the side bet (0: Perfect Pairs, 1: 21+3) and the bet.
+'statistics'
+    Each byte pair is a round's net result and outcome. 'RoundStatistics.update_batch', fed the rounds in batches, is
+    compared with 'RoundStatistics.update', fed them one at a time. Options: the batch size, the bet and whether
+    outcomes are passed as counts.
+
+A mismatch is shrunk by repeatedly removing cards and lowering ranks and suits, keeping each change that still gives a
+mismatch, until no single change does.
+
+Attributes
+----------
+fuzz_rules : tuple of blackjack.rules.Rules
+    The table rules that round cases are played under.
+fuzz_checks : dict
+    Each built-in check's name mapped to its pair of functions: (case generator, check).
+"""
+import math
+import random
+from blackjack import Player, DealerHand, PlayerHand
+from blackjack.deck import Deck, composition_hash, rank_names, rank_value_classes, suit_names, value_class_count
+from blackjack.hand_codec import decode_hand, encode_hand, hand_values
+from blackjack.probability import OutcomeCalculator, bust_outcome, natural_outcome
+from blackjack.rank_shoe import RankShoe
+from blackjack.rules import Rules
+from blackjack.running_stats import RoundStatistics
+from blackjack.simulation import outcome_names, play_round, simulated_player_name
+from blackjack.strategy import ThresholdStrategy
+
+fuzz_rules = (
+    Rules(),
+    Rules(dealer_hits_soft_17=True),
+    Rules(natural_payout=(6, 5)),
+    Rules(dealer_target=16, win_payout=(3, 2)),
+)
+_round_card_count = 24  # Cards in a generated round case: more than any round uses in practice
+_enumerated_bet = 10  # The bet of the rounds enumerated by 'check_ev': every payout in 'fuzz_rules' is a whole number
+_red_suits = ("Hearts", "Diamonds")
+_class_rank_indexes = tuple(rank_value_classes.index(class_idx) for class_idx in range(value_class_count))
+_standing_calculator = OutcomeCalculator(strategy=ThresholdStrategy(stand_on=0))  # Never hits: evaluates the hand given
+_nominal_upcard = Deck.decode_card(0, 0)  # Any face-up card: the standing strategy ignores it
+
+
+class FuzzFailure:
+    """
+    A class holding a mismatch found by the fuzz harness: the minimal case reproducing it and the original case.
+    """
+
+    def __init__(self, check_name, card_bytes, options, message, original_card_bytes):
+        """
+        Initialises a failure. Created by 'run_fuzz'.
+
+        Parameters
+        ----------
+        check_name : str
+            The name of the check that failed (a key of 'fuzz_checks').
+        card_bytes : bytes
+            The cards of the shrunk case.
+        options : tuple
+            The options of the case.
+        message : str
+            The check's description of the mismatch for the shrunk case.
+        original_card_bytes : bytes
+            The cards of the case as generated, before shrinking.
+        """
+        self._check_name = check_name
+        self._card_bytes = card_bytes
+        self._options = options
+        self._message = message
+        self._original_card_bytes = original_card_bytes
+
+    def __repr__(self):
+        """Returns a reproducer: the failing check call, then the mismatch, e.g. 'check_round(b"...", (0, 17, 100))'."""
+        return f"check_{self._check_name}({self._card_bytes!r}, {self._options!r})  # {self._message}"
+
+    def get_check_name(self):
+        """Returns the name of the check that failed."""
+        return self._check_name
+
+    def get_card_bytes(self):
+        """Returns the cards of the shrunk case, as rank/suit byte pairs."""
+        return self._card_bytes
+
+    def get_options(self):
+        """Returns the options of the case."""
+        return self._options
+
+    def get_message(self):
+        """Returns the check's description of the mismatch."""
+        return self._message
+
+    def get_original_card_bytes(self):
+        """Returns the cards of the case before shrinking, as rank/suit byte pairs."""
+        return self._original_card_bytes
+
+
+def random_hand_case(rng):
+    """Returns a random 'hand' case: up to twelve cards, half of them drawn from the low ranks to reach long hands."""
+    card_count = rng.randint(1, 12)
+    low_ranks = rank_names.index("Four") + 1
+    return (
+        bytes(
+            byte
+            for _ in range(card_count)
+            for byte in (
+                rng.randrange(low_ranks if rng.random() < 0.5 else len(rank_names)),
+                rng.randrange(len(suit_names)),
+            )
+        ),
+        (),
+    )
+
+
+def random_round_case(rng):
+    """Returns a random 'round' case: a short shoe, a set of table rules, a standing value and a bet."""
+    card_bytes = bytes(
+        byte
+        for _ in range(_round_card_count)
+        for byte in (rng.randrange(len(rank_names)), rng.randrange(len(suit_names)))
+    )
+    return card_bytes, (rng.randrange(len(fuzz_rules)), rng.randint(12, 21), rng.randint(1, 1000))
+
+
+def random_rank_shoe_case(rng):
+    """Returns a random 'rank_shoe' case: the random draws of up to 120 deals, as byte pairs, and a shoe size."""
+    return _random_bytes(rng, 2 * rng.randint(1, 120)), (rng.randint(1, 2),)
+
+
+def random_ev_case(rng):
+    """Returns a random 'ev' case: a shoe of five or six cards, a set of table rules and a standing value."""
+    card_bytes = bytes(
+        byte
+        for _ in range(rng.randint(5, 6))
+        for byte in (rng.randrange(len(rank_names)), rng.randrange(len(suit_names)))
+    )
+    return card_bytes, (rng.randrange(len(fuzz_rules)), rng.randint(12, 21))
+
+
+def random_side_bet_case(rng):
+    """Returns a random 'side_bet' case: up to eight initial deals of three cards, a side bet and a bet."""
+    card_bytes = bytes(
+        byte
+        for _ in range(3 * rng.randint(1, 8))
+        for byte in (rng.randrange(len(rank_names)), rng.randrange(len(suit_names)))
+    )
+    return card_bytes, (rng.randrange(2), rng.randint(1, 1000))
+
+
+def random_statistics_case(rng):
+    """Returns a random 'statistics' case: up to 40 rounds' results as byte pairs, a batch size, a bet and a form."""
+    options = (rng.randint(1, 10), rng.choice((1, 100, 10**15)), rng.random() < 0.5)
+    return _random_bytes(rng, 2 * rng.randint(1, 40)), options
+
+
+def check_hand(card_bytes, options=()):
+    """
+    Compares a hand's reference value and statuses with the fast paths. Returns None if all agree, else a message.
+
+    Parameters
+    ----------
+    card_bytes : bytes
+        The cards drawn into the hand (drawing stops once the hand is no longer active).
+    options : tuple
+        Unused: hand cases have no options.
+    """
+    live_deck = Deck(1)
+    live_deck.load_shoe(card_bytes)
+    reference_hand = PlayerHand(Player(simulated_player_name))
+    while len(live_deck) > 0 and reference_hand.is_active():
+        reference_hand.draw_card(live_deck)
+    if len(reference_hand) == 0:
+        return None
+    reference_value = reference_hand.best_hand_value()
+    reference_soft = reference_hand.is_soft()
+    reference_status = reference_hand.get_status()
+
+    packed_hand = encode_hand(reference_hand)
+    packed_values, packed_lengths = hand_values([packed_hand])
+    packed_value_length = (int(packed_values[0]) or None, int(packed_lengths[0]))
+    reference_value_length = (reference_value, len(reference_hand))
+    if packed_value_length != reference_value_length:
+        return f"hand_codec value/length {packed_value_length} != {reference_value_length}"
+    packed_cards, packed_status = decode_hand(packed_hand)
+    if packed_status != reference_status:
+        return f"hand_codec status {packed_status} != {reference_status}"
+    if [card._rank for card in packed_cards] != [card._rank for card in reference_hand]:
+        return "hand_codec ranks differ"
+
+    if len(reference_hand) >= 2:  # The calculator's player draws to two cards whatever its strategy
+        if reference_hand.is_bust():
+            reference_outcome = bust_outcome
+        elif reference_hand.is_natural():
+            reference_outcome = natural_outcome
+        else:
+            reference_outcome = reference_value
+        calculated_outcomes = _standing_calculator.player_distribution(
+            reference_hand, _nominal_upcard, (0,) * value_class_count
+        )
+        if calculated_outcomes != {reference_outcome: 1.0}:
+            return f"probability outcomes {calculated_outcomes} != {{{reference_outcome!r}: 1.0}}"
+    return None
+
+
+def check_round(card_bytes, options):
+    """
+    Compares a round's reference settlement with the headless round engine. Returns None if they agree, else a message.
+
+    Parameters
+    ----------
+    card_bytes : bytes
+        The shoe the round is dealt from.
+    options : tuple
+        The index of the table rules in 'fuzz_rules', the threshold strategy's standing value and the bet.
+    """
+    rules_idx, stand_on, bet = options
+    rules = fuzz_rules[rules_idx]
+    strategy = ThresholdStrategy(stand_on=stand_on)
+
+    reference_deck = Deck(1)
+    reference_deck.load_shoe(card_bytes)
+    try:
+        reference_net = _reference_round(reference_deck, strategy, bet, rules)
+    except AssertionError:
+        return None  # The reference cannot play the case (the shoe ran out): not a mismatch
+
+    fast_deck = Deck(1)
+    fast_deck.load_shoe(card_bytes)
+    try:
+        fast_net, outcome = play_round(fast_deck, strategy, bet, rules=rules)
+    except Exception as error:
+        return f"play_round raised {error!r}"
+    if fast_net != reference_net:
+        return f"play_round net {fast_net} ({outcome}) != settled {reference_net}"
+    if len(fast_deck) != len(reference_deck):
+        return f"play_round used {len(card_bytes) // 2 - len(fast_deck)} cards, reference used " \
+               f"{len(card_bytes) // 2 - len(reference_deck)}"
+    return None
+
+
+def check_rank_shoe(card_bytes, options):
+    """
+    Compares the cards dealt by a rank shoe with a literal shoe: a list of every card's value class, in class order.
+
+    Parameters
+    ----------
+    card_bytes : bytes
+        Each byte pair (read as a 16-bit integer) is a random draw: the shoe's generator returns it modulo the number
+        of cards left, the position of the card dealt among them.
+    options : tuple
+        The number of decks in the shoe.
+    """
+    (deck_count,) = options
+    rank_shoe = RankShoe(deck_count, _ScriptedRandom(card_bytes))
+    reference_classes = sorted(rank_value_classes * (len(suit_names) * deck_count))  # Every card left, in class order
+    for position in range(0, len(card_bytes) - 1, 2):
+        if not reference_classes:
+            break
+        draw = int.from_bytes(card_bytes[position : position + 2], "big")
+        reference_class = reference_classes.pop(draw % len(reference_classes))
+        dealt_class = rank_value_classes[Deck.encode_card(rank_shoe.deal_card())[0]]
+        if dealt_class != reference_class:
+            return f"deal {position // 2}: RankShoe dealt value class {dealt_class}, reference {reference_class}"
+        reference_composition = tuple(reference_classes.count(class_idx) for class_idx in range(value_class_count))
+        if len(rank_shoe) != len(reference_classes) or rank_shoe.composition() != reference_composition:
+            return f"deal {position // 2}: RankShoe composition {rank_shoe.composition()} != {reference_composition}"
+        if rank_shoe.composition_hash() != composition_hash(reference_composition):
+            return f"deal {position // 2}: RankShoe composition hash differs from the reference composition's"
+    return None
+
+
+def check_ev(card_bytes, options):
+    """
+    Compares the exact calculator's EV for a round dealt from a small shoe with a brute-force enumeration of every way
+    the round can be dealt, each played by the reference round of 'check_round'. Returns None if they agree (or some
+    deal runs out of cards, which the reference cannot play), else a message.
+
+    Parameters
+    ----------
+    card_bytes : bytes
+        The cards in the shoe; only their value classes matter.
+    options : tuple
+        The index of the table rules in 'fuzz_rules' and the threshold strategy's standing value.
+    """
+    rules_idx, stand_on = options
+    rules = fuzz_rules[rules_idx]
+    strategy = ThresholdStrategy(stand_on=stand_on)
+    composition = [0] * value_class_count
+    for rank_idx in card_bytes[::2]:
+        composition[rank_value_classes[rank_idx]] += 1
+    if sum(composition) < 4:
+        return None
+
+    reference_ev = _enumerated_ev(b"", composition, strategy, rules)
+    if reference_ev is None:
+        return None
+    calculated_ev = OutcomeCalculator(rules, strategy).initial_ev(tuple(composition))
+    if abs(calculated_ev - reference_ev) > 1e-9:
+        return f"OutcomeCalculator.initial_ev {calculated_ev!r} != enumerated {reference_ev!r}"
+    return None
+
+
+def check_side_bet(card_bytes, options):
+    """
+    Compares a side bet's batch settlement ('SideBet.batch_net_results') with classifying each deal's cards by the
+    literal rules of the side bet (see '_reference_side_bet_winnings'). Returns None if they agree, else a message.
+
+    Parameters
+    ----------
+    card_bytes : bytes
+        The cards of the initial deals, three cards per deal in the order of 'initial_deal_cards'; any cards left over
+        are ignored.
+    options : tuple
+        The side bet (0: Perfect Pairs, 1: 21+3) and the bet.
+    """
+    import numpy as np
+    from blackjack.side_bets import perfect_pairs, twenty_one_three
+
+    side_bet_idx, bet = options
+    side_bet = (perfect_pairs, twenty_one_three)[side_bet_idx]
+    deal_count = len(card_bytes) // 6
+    if deal_count == 0:
+        return None
+    card_pairs = np.frombuffer(card_bytes[: 6 * deal_count], dtype=np.uint8).reshape(deal_count, 3, 2)
+    card_types = card_pairs[:, :, 0].astype(np.int64) * len(suit_names) + card_pairs[:, :, 1]
+    batch_results = side_bet.batch_net_results(card_types, bet).tolist()
+    for deal_idx in range(deal_count):
+        deal_bytes = card_bytes[6 * deal_idx : 6 * deal_idx + 6]
+        reference_result = bet * _reference_side_bet_winnings(side_bet_idx, deal_bytes)
+        if batch_results[deal_idx] != reference_result:
+            return f"deal {deal_idx}: {side_bet.get_name()} batch net {batch_results[deal_idx]} != {reference_result}"
+    return None
+
+
+def check_statistics(card_bytes, options):
+    """
+    Compares statistics accumulated in batches ('RoundStatistics.update_batch') with the same rounds folded in one at a
+    time ('RoundStatistics.update'). Returns None if they agree, else a message.
+
+    Parameters
+    ----------
+    card_bytes : bytes
+        One byte pair per round: the first byte sets its net result (a multiple of the bet from -6 to 6), the second
+        its outcome (an index into 'blackjack.simulation.outcome_names', modulo their number).
+    options : tuple
+        The number of rounds per batch, the bet and whether each batch's outcomes are passed as counts (a dict) rather
+        than one per round.
+    """
+    batch_size, bet, outcomes_counted = options
+    net_results = [(net_byte % 13 - 6) * bet for net_byte in card_bytes[::2]]
+    outcomes = [outcome_names[outcome_byte % len(outcome_names)] for outcome_byte in card_bytes[1::2]]
+    net_results = net_results[: len(outcomes)]
+
+    reference_statistics = RoundStatistics()
+    for net_result, outcome in zip(net_results, outcomes):
+        reference_statistics.update(net_result, outcome)
+    batch_statistics = RoundStatistics()
+    for batch_start in range(0, len(outcomes), batch_size):
+        batch_outcomes = outcomes[batch_start : batch_start + batch_size]
+        if outcomes_counted:
+            batch_outcomes = {outcome: batch_outcomes.count(outcome) for outcome in set(batch_outcomes)}
+        batch_statistics.update_batch(net_results[batch_start : batch_start + batch_size], batch_outcomes)
+
+    for name in ("__len__", "get_net_total", "get_histogram", "get_outcome_counts"):
+        batch_value, reference_value = getattr(batch_statistics, name)(), getattr(reference_statistics, name)()
+        if batch_value != reference_value:
+            return f"update_batch {name} {batch_value!r} != {reference_value!r}"
+    for name in ("mean", "variance"):
+        batch_value, reference_value = getattr(batch_statistics, name)(), getattr(reference_statistics, name)()
+        if not math.isclose(batch_value, reference_value, rel_tol=1e-9, abs_tol=1e-9 * bet * bet):
+            return f"update_batch {name} {batch_value!r} != {reference_value!r}"
+    return None
+
+
+def shrink_case(check, card_bytes, options):
+    """
+    Returns the smallest case found that still fails a check: cards are removed and lowered one change at a time.
+
+    Parameters
+    ----------
+    check : function
+        The check, as in 'fuzz_checks'.
+    card_bytes : bytes
+        The cards of a failing case.
+    options : tuple
+        The options of the case; these are not shrunk.
+
+    Returns
+    -------
+    tuple of (bytes, str)
+        The cards of the shrunk case and the check's message for it.
+    """
+    message = check(card_bytes, options)
+    assert message is not None, "Only failing cases can be shrunk!"
+    shrinking = True
+    while shrinking:
+        shrinking = False
+        for candidate in _shrink_candidates(card_bytes):
+            candidate_message = check(candidate, options)
+            if candidate_message is not None:
+                card_bytes, message = candidate, candidate_message
+                shrinking = True
+                break
+    return card_bytes, message
+
+
+def run_fuzz(case_count, check_names=None, seed=None, max_failures=10, processes=1):
+    """
+    Generates random cases, runs them through checks and returns any mismatches, shrunk to minimal reproducers.
+
+    Parameters
+    ----------
+    case_count : int
+        The number of cases generated for each check.
+    check_names : list of str
+        The checks to run (keys of 'fuzz_checks'). Defaults to None: every check.
+    seed : int
+        Seeds the generation of cases; a run with the same seed and number of processes generates the same cases.
+    max_failures : int
+        Each process stops once it has found this many failures.
+    processes : int
+        The number of worker processes the cases are split between. Defaults to 1: cases run in this process.
+
+    Returns
+    -------
+    list of blackjack.fuzz.FuzzFailure
+        The failures found, in the order they were found (by process).
+    """
+    if check_names is None:
+        check_names = list(fuzz_checks)
+    seed_rng = random.Random(seed)
+    worker_args = [
+        (case_count // processes + (worker_idx < case_count % processes), check_names, seed_rng.getrandbits(64),
+         max_failures)
+        for worker_idx in range(processes)
+    ]
+    if processes == 1:
+        return fuzz_worker(*worker_args[0])
+
+    import multiprocessing
+
+    with multiprocessing.Pool(processes) as pool:
+        worker_failures = pool.starmap(fuzz_worker, worker_args)
+    return [failure for failures in worker_failures for failure in failures]
+
+
+def fuzz_worker(case_count, check_names, seed, max_failures):
+    """Runs one process's share of 'run_fuzz' and returns its failures."""
+    rng = random.Random(seed)
+    failures = []
+    for _ in range(case_count):
+        for check_name in check_names:
+            generate_case, check = fuzz_checks[check_name]
+            card_bytes, options = generate_case(rng)
+            if check(card_bytes, options) is None:
+                continue
+            shrunk_bytes, message = shrink_case(check, card_bytes, options)
+            failures.append(FuzzFailure(check_name, shrunk_bytes, options, message, card_bytes))
+            if len(failures) >= max_failures:
+                return failures
+    return failures
+
+
+def _reference_round(live_deck, strategy, bet, rules):
+    """
+    Plays a round by the literal rules of the game and returns the player's net result, independently of the round
+    engine and of the dealer's settlement methods: only the hands' values ('Hand.best_hand_value' and 'is_soft') are
+    taken from the object model.
+
+    Naturals are settled first: a natural beats any other hand and pays the rules' natural odds, two naturals are a
+    stand-off. Otherwise the player draws while the strategy hits, and loses at once on going bust; the dealer then
+    draws while below their target (or on a soft target, under H17), and the higher value wins at the rules' win odds,
+    with equal values a push. Winnings are rounded down to a whole minor unit.
+    """
+    players_hand = PlayerHand(Player(simulated_player_name))
+    dealers_hand = DealerHand(rules)
+    players_hand.draw_card(live_deck)
+    dealers_hand.draw_card(live_deck, "up")
+    players_hand.draw_card(live_deck)
+    dealers_hand.draw_card(live_deck, "up")
+
+    player_natural = players_hand.best_hand_value() == 21
+    dealer_natural = dealers_hand.best_hand_value() == 21
+    if player_natural or dealer_natural:
+        if player_natural and dealer_natural:
+            return 0
+        if dealer_natural:
+            return -bet
+        return _winnings(bet, rules.get_natural_payout())
+
+    dealer_upcard = next(iter(dealers_hand))
+    while players_hand.best_hand_value() < 21 and strategy.decide(players_hand, dealer_upcard):
+        players_hand.draw_card(live_deck)
+        if players_hand.best_hand_value() is None:
+            return -bet
+
+    dealer_target = rules.get_dealer_target()
+    while dealers_hand.best_hand_value() is not None and (
+        dealers_hand.best_hand_value() < dealer_target
+        or (dealers_hand.best_hand_value() == dealer_target and rules.dealer_hits_soft_17() and dealers_hand.is_soft())
+    ):
+        dealers_hand.draw_card(live_deck, "up")
+
+    player_value, dealer_value = players_hand.best_hand_value(), dealers_hand.best_hand_value()
+    if dealer_value is None or player_value > dealer_value:
+        return _winnings(bet, rules.get_win_payout())
+    if player_value == dealer_value:
+        return 0
+    return -bet
+
+
+def _winnings(bet, payout):
+    """Returns the winnings on a bet at odds given as (winnings, stake), rounded down to a whole minor unit."""
+    winnings, stake = payout
+    return bet * winnings // stake
+
+
+def _enumerated_ev(card_bytes, composition, strategy, rules):
+    """
+    Returns the reference round's expected net result per unit bet over every order the unseen cards can be dealt in
+    after 'card_bytes', or None if some order runs out of cards. Each value class stands for all of its cards: the
+    round is replayed with each class that can be dealt next, weighted by its share of 'composition'.
+    """
+    live_deck = Deck(1, shoe_buffer=card_bytes)
+    try:
+        return _reference_round(live_deck, strategy, _enumerated_bet, rules) / _enumerated_bet
+    except AssertionError:
+        if len(live_deck) > 0:
+            raise  # Not the shoe running out: a genuine error
+    card_total = sum(composition)
+    if card_total == 0:
+        return None
+    expected_net = 0.0
+    for class_idx, class_count in enumerate(composition):
+        if class_count == 0:
+            continue
+        composition[class_idx] -= 1
+        class_ev = _enumerated_ev(card_bytes + bytes((_class_rank_indexes[class_idx], 0)), composition, strategy, rules)
+        composition[class_idx] += 1
+        if class_ev is None:
+            return None
+        expected_net += class_count / card_total * class_ev
+    return expected_net
+
+
+def _reference_side_bet_winnings(side_bet_idx, deal_bytes):
+    """
+    Returns the winnings per unit bet (-1 for a loss) of a side bet on the three cards of a deal, classified from their
+    rank and suit names by the side bet's rules and paytable, independently of the side bets' outcome tables.
+
+    Perfect Pairs (the player's two cards): a perfect pair (same rank and suit) pays 25:1, a coloured pair (same rank
+    and colour) 12:1 and a mixed pair 6:1. 21+3 (all three cards, as a poker hand): suited trips pay 100:1, a straight
+    flush 40:1, three of a kind 30:1, a straight 10:1 and a flush 5:1; an ace is high or low in a straight, which
+    cannot wrap around from king to two.
+    """
+    ranks = [rank_names[rank_idx] for rank_idx in deal_bytes[::2]]
+    suits = [suit_names[suit_idx] for suit_idx in deal_bytes[1::2]]
+    if side_bet_idx == 0:
+        if ranks[0] != ranks[1]:
+            return -1
+        if suits[0] == suits[1]:
+            return 25
+        if (suits[0] in _red_suits) == (suits[1] in _red_suits):
+            return 12
+        return 6
+
+    trips = ranks[0] == ranks[1] == ranks[2]
+    flush = suits[0] == suits[1] == suits[2]
+    low, middle, high = sorted(rank_names.index(rank) for rank in ranks)
+    straight = (middle, high) == (low + 1, low + 2) or (low, middle, high) == (0, 11, 12)  # Ace, queen, king
+    if trips and flush:
+        return 100
+    if straight and flush:
+        return 40
+    if trips:
+        return 30
+    if straight:
+        return 10
+    if flush:
+        return 5
+    return -1
+
+
+def _random_bytes(rng, byte_count):
+    """Returns random bytes from a generator ('random.Random.randbytes' needs Python 3.9)."""
+    return rng.getrandbits(8 * byte_count).to_bytes(byte_count, "big")
+
+
+class _ScriptedRandom:
+    """A stand-in random generator whose draws are read from a buffer, two bytes per draw (see 'check_rank_shoe')."""
+
+    def __init__(self, draw_bytes):
+        self._draws = iter(
+            int.from_bytes(draw_bytes[position : position + 2], "big") for position in range(0, len(draw_bytes) - 1, 2)
+        )
+
+    def randrange(self, stop):
+        """Returns the next draw modulo 'stop'."""
+        return next(self._draws) % stop
+
+
+def _shrink_candidates(card_bytes):
+    """Yields the cases one change smaller than a case: each card removed, then each rank and suit lowered."""
+    for position in range(0, len(card_bytes), 2):
+        yield card_bytes[:position] + card_bytes[position + 2 :]
+    for position in range(0, len(card_bytes), 2):
+        rank_idx, suit_idx = card_bytes[position], card_bytes[position + 1]
+        for lower_rank in range(rank_idx):
+            yield card_bytes[:position] + bytes((lower_rank, suit_idx)) + card_bytes[position + 2 :]
+        if suit_idx > 0:
+            yield card_bytes[:position] + bytes((rank_idx, 0)) + card_bytes[position + 2 :]
+
+
+fuzz_checks = {
+    "hand": (random_hand_case, check_hand),
+    "round": (random_round_case, check_round),
+    "rank_shoe": (random_rank_shoe_case, check_rank_shoe),
+    "ev": (random_ev_case, check_ev),
+    "side_bet": (random_side_bet_case, check_side_bet),
+    "statistics": (random_statistics_case, check_statistics),
+}
@@ -1,7 +1,9 @@
 """
-This module exports the 'Hand' class, 'PlayerHand' and 'DealerHand' subclasses, and related methods.
+This module exports the 'Hand' class, 'PlayerHand' and 'DealerHand' subclasses, the 'HandPool' class and related
+methods.
 """
 import time
+from blackjack.rules import default_rules, payout_amount
 
 draw_delay = 1  # The pause in seconds between drawn card actions
 twenty_one = 21  # Ideal score value for both players
@@ -131,6 +133,22 @@ class Hand:
 
         return best_value
 
+    def is_soft(self):
+        """
+        As a boolean, returns True if the hand's best value counts an ace as 11 (e.g. Ace + Six = 'soft 17').
+
+        A soft hand cannot go bust by drawing a single card: the ace can fall back to a value of 1.
+
+        Returns
+        -------
+        bool
+            True when the best value of the hand counts an ace as 11; otherwise False (including bust hands).
+        """
+        best_value = self.best_hand_value()
+        if best_value is None:
+            return False
+        return best_value - 10 in self.hand_value(bypass_face_down=True)
+
     def is_active(self):
         """
         As a boolean, returns the active status of the hand in the current round (bust/stand = False; otherwise = True).
@@ -172,6 +190,40 @@ class Hand:
         """Updates hand status to inactive: triggered when player chooses to draw no more cards in the current round."""
         self._active = False
 
+    def reset(self):
+        """
+        Empties the hand and restores its initial statuses, ready for reuse in a new round.
+
+        The hand's list of cards is cleared in place rather than replaced, so reusing a hand (see 'HandPool') avoids
+        allocating new hand objects and lists every round.
+        """
+        self._live_hand.clear()
+        self._active = True
+        self._bust = False
+        self._natural = False
+
+    def get_holder_name(self):
+        """Returns the name of the hand's owner, as shown when the hand is printed."""
+        return self._holder_name
+
+    def get_status(self):
+        """Returns the hand's statuses as a tuple of booleans: (active, bust, natural)."""
+        return self._active, self._bust, self._natural
+
+    def restore(self, cards, status):
+        """
+        Replaces the hand's cards and statuses, e.g. when restoring a snapshot of a round (see 'blackjack.snapshot').
+
+        Parameters
+        ----------
+        cards : iterable of blackjack.card.Card
+            The cards making up the hand, in the order they were added. The hand's list of cards is refilled in place.
+        status : tuple of bool
+            The hand's statuses, as returned by 'get_status'.
+        """
+        self._live_hand[:] = cards
+        self._active, self._bust, self._natural = status
+
     def draw_card(self, deck_obj, face_dir="up"):
         """
         Removes one card from the input deck and adds this card to the hand with orientation defined by 'face_dir'.
@@ -294,8 +346,16 @@ class DealerHand(Hand):
     the dealer's turn in a single round must be resolved automatically.
     """
 
-    def __init__(self):
-        """Calls the __init__ method of the base Hand class, initialising an empty hand object for the dealer."""
+    def __init__(self, rules=None):
+        """
+        Calls the __init__ method of the base Hand class, initialising an empty hand object for the dealer.
+
+        Parameters
+        ----------
+        rules : blackjack.rules.Rules
+            The table rules the dealer plays and pays out by. Defaults to None: 'blackjack.rules.default_rules'.
+        """
+        self._rules = default_rules if rules is None else rules
         super().__init__("Dealer")
 
     def draw_card(self, deck_obj, face_dir=None):
@@ -322,13 +382,14 @@ class DealerHand(Hand):
             face_dir = "up"
             super().draw_card(deck_obj, face_dir)
 
-    def resolve_hand(self, deck_obj, player_hand, player_score_message):
+    def resolve_hand(self, deck_obj, player_hand, player_score_message, renderer=None):
         """
-        This method automatically resolves the dealer's hand: drawing cards until the hand value exceeds seventeen.
+        This method automatically resolves the dealer's hand: drawing cards until the hand value reaches the target.
 
-        Method initially checks the dealer's hand value: if its best value > 17, the dealer stands. If < 17, the hand
-        draws cards until its value exceeds 17 or goes bust. The dealer's final hand score is printed to the screen
-        or the player is informed that the dealer has gone bust.
+        Method initially checks the dealer's hand value: if its best value reaches the rules' dealer target (17 by
+        default), the dealer stands. Otherwise, the hand draws cards until it reaches the target or goes bust. Under
+        the 'H17' rule, the dealer also draws on a soft hand equal to the target. The dealer's final hand score is
+        printed to the screen or the player is informed that the dealer has gone bust.
 
         Parameters
         ----------
@@ -340,8 +401,14 @@ class DealerHand(Hand):
         player_score_message : str
             A string that communicates the players score. As the dealer's hand is resolved, the players score is
             printed each time the dealer's hand is printed so the user can easily compare the relative scores.
+        renderer : blackjack.renderer.TableRenderer
+            If given, an open table that is updated in place as the hand is resolved, instead of printing the hands
+            after every draw. Defaults to None: the hands are printed.
         """
-        dealer_target = 17
+        if renderer is not None:
+            self._resolve_rendered(deck_obj, player_hand, player_score_message, renderer)
+            return
+
         print(player_score_message)
         if player_hand.best_hand_value() == twenty_one:
             print("You've got 21!")
@@ -350,7 +417,7 @@ class DealerHand(Hand):
         self._reveal_hand()
 
         while self.is_active():
-            if self.best_hand_value() < dealer_target:
+            if self._must_hit():
                 self.draw_card(deck_obj)
                 self.print_hand(alt_text="\nDealer hits:")
                 player_hand.print_hand()
@@ -371,6 +438,56 @@ class DealerHand(Hand):
             print(player_score_message)
             print("\n---")
 
+    def _resolve_rendered(self, deck_obj, player_hand, player_score_message, renderer):
+        """Resolves the dealer's hand as 'resolve_hand', updating the cells of an open table rather than printing."""
+        if player_hand.best_hand_value() == twenty_one:
+            player_score_message = f"You've got 21! {player_score_message}"
+        for card in self:
+            if not card.is_face_up():
+                card.flip_card()
+        renderer.show_hands(self, player_hand)
+        renderer.show_message(f"Dealer reveals hand. {player_score_message}")
+        time.sleep(draw_delay)
+
+        while self.is_active():
+            if self._must_hit():
+                self.draw_card(deck_obj)
+                renderer.show_hands(self, player_hand)
+                renderer.show_message(f"Dealer hits. {player_score_message}")
+                time.sleep(draw_delay)
+            else:
+                self.stand()
+                renderer.show_message(
+                    f"Dealer stands. Dealer's score = {self.best_hand_value()}. {player_score_message}"
+                )
+
+        if self.is_bust():
+            renderer.show_message(f"Dealer has gone bust! {player_score_message}")
+
+    def auto_resolve(self, deck_obj):
+        """
+        Resolves the dealer's hand without printing or pausing, for automated play: follows the same drawing rule as
+        'resolve_hand'. Cards are drawn face-up.
+
+        Parameters
+        ----------
+        deck_obj : blackjack.deck.Deck
+            The game's 'live' deck object - cards may be removed from this deck and added to the dealer's hand object.
+        """
+        while self.is_active():
+            if self._must_hit():
+                self.draw_card(deck_obj, "up")
+            else:
+                self.stand()
+
+    def _must_hit(self):
+        """Returns True while the dealer's rules require them to draw another card; otherwise False."""
+        best_value = self.best_hand_value()
+        dealer_target = self._rules.get_dealer_target()
+        if best_value < dealer_target:
+            return True
+        return best_value == dealer_target and self._rules.dealer_hits_soft_17() and self.is_soft()
+
     def _reveal_hand(self):
         """Turns all cards in the hand face-up and prints hand details to the screen."""
         print("\n---------------")
@@ -388,7 +505,7 @@ class DealerHand(Hand):
         A hand is a 'natural' if it contains two cards with a total value of 21. Players and dealers can get naturals
         upon drawing their first two cards at the start of a round. If the dealer gets a natural, the round is over and
         they collect the bet of any player who did not also get a natural. If a player gets a natural and the dealer did
-        not, they are immediately paid 1.5x the value of their bet.
+        not, they are immediately paid at the natural odds set by the table rules (by default 3:2, i.e. 1.5x their bet).
 
         Parameters
         ----------
@@ -405,7 +522,8 @@ class DealerHand(Hand):
             Returns True if no further actions are possible in the current round, following the settling of naturals;
             otherwise False (and the round continues).
         """
-        if not any((self.is_natural(), player_hand.is_natural())):
+        payout_multiplier = self.natural_multiplier(player_hand)
+        if payout_multiplier is None:
             round_complete = False
             return round_complete
         else:
@@ -417,20 +535,43 @@ class DealerHand(Hand):
             self._reveal_hand()
             print("Dealer has a natural!")
         elif not self.is_natural() and player_hand.is_natural():
-            # Player wins 1.5x their original bet; multiplier is 2.5x so bet amount is also deposited back into balance
+            # Player wins 1.5x their bet (at 3:2); the multiplier (2.5x) also deposits the bet back into their balance
             print(f"\n{player_obj.get_name()} has a natural (dealer does not)!")
-            payout_multiplier = 2.5
-            player_obj.update_balance(bet_amount * payout_multiplier)
+            player_obj.update_balance(payout_amount(bet_amount, payout_multiplier))
         elif all((self.is_natural(), player_hand.is_natural())):
             # Stand-off between player and dealer: player's bet is deposited back into balance
             print(f"\n{player_obj.get_name()} has a natural!")
             self._reveal_hand()
             print("\nSo does the dealer! It's a stand-off!")
-            payout_multiplier = 1
-            player_obj.update_balance(bet_amount * payout_multiplier)
+            player_obj.update_balance(payout_amount(bet_amount, payout_multiplier))
 
         return round_complete
 
+    def natural_multiplier(self, player_hand):
+        """
+        Returns the multiple of the player's bet paid back to them when naturals are settled, or None if neither the
+        dealer nor the player has a natural (and the round continues).
+
+        Parameters
+        ----------
+        player_hand : blackjack.hand.PlayerHand
+            A player's 'live' hand object, holding its first two cards.
+
+        Returns
+        -------
+        fractions.Fraction or int or None
+            0 if only the dealer has a natural; the rules' natural multiplier if only the player has a natural (5/2 at
+            3:2: 1.5x winnings plus their bet); 1 for a stand-off; None when there are no naturals.
+        """
+        if not any((self.is_natural(), player_hand.is_natural())):
+            return None
+        if self.is_natural() and not player_hand.is_natural():
+            return 0
+        elif not self.is_natural() and player_hand.is_natural():
+            return self._rules.natural_multiplier()
+        else:
+            return self._rules.push_multiplier()
+
     def settle_bet(self, player_hand, player_obj):
         """
         Method settles any bets at the end of the round; where the player loses, the method exits and their bet is lost.
@@ -453,24 +594,42 @@ class DealerHand(Hand):
             (self.is_active(), player_hand.is_active())
         ), "Bets cannot be settled between the dealer and a player unless both participants have 'stood' or gone bust."
 
-        if player_hand.is_bust():
+        payout_multiplier = self.showdown_multiplier(player_hand)
+        if payout_multiplier == 0:
             return
+        else:
+            bet_amount = player_hand.get_bet()
+
+        player_obj.update_balance(payout_amount(bet_amount, payout_multiplier))
+
+    def showdown_multiplier(self, player_hand):
+        """
+        Returns the multiple of the player's bet paid back to them once both hands have been resolved.
+
+        Parameters
+        ----------
+        player_hand : blackjack.hand.PlayerHand
+            A player's resolved hand object. Its value is compared to the value of the dealer's hand.
+
+        Returns
+        -------
+        fractions.Fraction or int
+            The rules' win multiplier if the player wins (2 at even money: winnings plus their bet); 1 if it's a draw
+            (bet returned); 0 if the player loses.
+        """
+        if player_hand.is_bust():
+            return 0
         if self.is_bust():
             dealer_score = 0
         else:
             dealer_score = self.best_hand_value()
 
         if dealer_score > player_hand.best_hand_value():
-            return
+            return 0
+        elif player_hand.best_hand_value() > dealer_score:
+            return self._rules.win_multiplier()
         else:
-            bet_amount = player_hand.get_bet()
-
-        if player_hand.best_hand_value() > dealer_score:
-            payout_multiplier = 2
-            player_obj.update_balance(bet_amount * payout_multiplier)
-        elif player_hand.best_hand_value() == dealer_score:
-            payout_multiplier = 1
-            player_obj.update_balance(bet_amount * payout_multiplier)
+            return self._rules.push_multiplier()
 
 
 class PlayerHand(Hand):
@@ -491,9 +650,7 @@ class PlayerHand(Hand):
             used to define the '_holder_name' attribute on the base class. This name is then displayed when printing
             hand details to screen.
         """
-        self._bet = float(
-            0
-        )  # An attribute holding the amount bet by a player against this hand: initially zero
+        self._bet = 0  # The amount bet by a player against this hand, in minor currency units: initially zero
         player_name = player_obj.get_name()
         super().__init__(player_name)
 
@@ -503,12 +660,58 @@ class PlayerHand(Hand):
 
         Parameters
         ----------
-        amount : float
-            The amount bet against the hand object. In typical game flow, this bet amount has already been verified
-            as positive and has already been removed from the player's balance.
+        amount : int
+            The amount bet against the hand object, in minor currency units. In typical game flow, this bet amount has
+            already been verified as positive and has already been removed from the player's balance.
         """
         self._bet += amount
 
     def get_bet(self):
-        """Returns the amount bet against this player's hand as a float."""
+        """Returns the amount bet against this player's hand as an integer number of minor currency units."""
         return self._bet
+
+    def reset(self):
+        """Empties the hand, restores its initial statuses and clears its bet, ready for reuse in a new round."""
+        super().reset()
+        self._bet = 0
+
+
+class HandPool:
+    """
+    A class holding a small, fixed set of reusable hand objects for a single seat at the table.
+
+    Each call to 'acquire' resets and returns the next hand in the pool, cycling back to the first hand after the last.
+    With a pool of two or more hands, the hand from the previous round is left intact (e.g. for display or analysis)
+    while the next round is played, and no hand objects are created once the pool is built.
+    """
+
+    def __init__(self, hand_class, *hand_args, pool_size=2):
+        """
+        Initialises the pool, creating all of its hand objects up-front.
+
+        Parameters
+        ----------
+        hand_class : type
+            The hand class to pool, e.g. 'PlayerHand' or 'DealerHand'.
+        *hand_args
+            Arguments passed to 'hand_class' when creating each hand, e.g. the player object for a 'PlayerHand'.
+        pool_size : int
+            The number of hands in the pool. Defaults to 2.
+        """
+        assert (isinstance(pool_size, int)) and (pool_size > 0), "'pool_size' must be a positive integer!"
+        self._hands = [hand_class(*hand_args) for _ in range(pool_size)]
+        self._next_idx = 0  # Index of the hand returned by the next call to 'acquire'
+
+    def acquire(self):
+        """
+        Resets and returns the next hand in the pool.
+
+        Returns
+        -------
+        blackjack.hand.Hand
+            An empty, active hand.
+        """
+        hand = self._hands[self._next_idx]
+        self._next_idx = (self._next_idx + 1) % len(self._hands)
+        hand.reset()
+        return hand
@@ -0,0 +1,157 @@
+"""
+This module exports functions packing hands into 64-bit integers ('encode_hand', 'decode_hand') and their vectorised
+NumPy equivalents ('encode_hands', 'decode_hands', 'hand_values') for storing and analysing large numbers of hands.
+
+A packed hand holds the rank of each of its cards and its statuses. Bits of a packed hand, from least significant:
+four bits per card slot, 'max_packed_cards' slots in the order the cards were added, each holding the card's rank code
+(its index in 'rank_names' plus one; 0 marks an empty slot, so the cards end at the first empty slot); then one bit
+each for the hand's bust, natural and stood (no longer active) statuses. Suits, deck numbers and card orientations are
+not stored: a hand decoded from its packed form holds face-up cards of nominal suit.
+
+Packed hands are stored in 'uint64' arrays: eight bytes per hand, whatever its length.
+
+Attributes
+----------
+max_packed_cards : int
+    The largest number of cards a packed hand can hold.
+bust_bit, natural_bit, stood_bit : int
+    The positions of the status bits.
+"""
+import numpy as np
+from blackjack.deck import Deck, rank_names, rank_values
+
+max_packed_cards = 13
+_card_bits = 4  # Bits per card slot
+bust_bit = _card_bits * max_packed_cards
+natural_bit = bust_bit + 1
+stood_bit = bust_bit + 2
+_card_mask = (1 << _card_bits) - 1
+_card_shifts = np.arange(0, bust_bit, _card_bits, dtype=np.uint64)  # The shift of each card slot
+_rank_code_values = np.array(
+    [0] + [1 if rank_value == (1, 11) else rank_value for rank_value in rank_values], dtype=np.int64
+)  # The hard value of a card, indexed by rank code (an ace counts 1; an empty slot 0)
+
+
+def encode_hand(hand):
+    """
+    Returns a hand packed into a 64-bit integer.
+
+    Parameters
+    ----------
+    hand : blackjack.hand.Hand
+        The hand to pack, holding at most 'max_packed_cards' cards. Face-down cards are packed as any other card.
+
+    Returns
+    -------
+    int
+        The packed hand (see the module docstring).
+    """
+    assert len(hand) <= max_packed_cards, f"Hands of over {max_packed_cards} cards cannot be packed!"
+    packed_hand = 0
+    for card_idx, card in enumerate(hand):
+        packed_hand |= (Deck.encode_card(card)[0] + 1) << (_card_bits * card_idx)
+    active, bust, natural = hand.get_status()
+    return packed_hand | (bust << bust_bit) | (natural << natural_bit) | ((not active) << stood_bit)
+
+
+def decode_hand(packed_hand):
+    """
+    Unpacks a hand packed by 'encode_hand', e.g. to restore it with 'Hand.restore'.
+
+    Parameters
+    ----------
+    packed_hand : int
+        The packed hand.
+
+    Returns
+    -------
+    tuple
+        A list of new face-up card objects (with nominal suits) in the order they were added, then the hand's statuses
+        as a tuple of booleans: (active, bust, natural), as returned by 'Hand.get_status'.
+    """
+    packed_hand = int(packed_hand)
+    cards = []
+    for card_shift in range(0, bust_bit, _card_bits):
+        rank_code = (packed_hand >> card_shift) & _card_mask
+        if rank_code == 0:
+            break
+        cards.append(Deck.decode_card(rank_code - 1, 0))
+    status = (
+        not (packed_hand >> stood_bit) & 1,
+        bool((packed_hand >> bust_bit) & 1),
+        bool((packed_hand >> natural_bit) & 1),
+    )
+    return cards, status
+
+
+def encode_hands(rank_codes, bust, natural, stood):
+    """
+    Packs an array of hands, given as the rank codes of their cards and their statuses.
+
+    Parameters
+    ----------
+    rank_codes : array_like of int
+        An array of shape (hand count, card slots), at most 'max_packed_cards' slots: the rank code of each card (its
+        index in 'rank_names' plus one), padded with zeros after each hand's last card.
+    bust, natural, stood : array_like of bool
+        Each hand's statuses, as returned by 'Hand.is_bust', 'Hand.is_natural' and 'not Hand.is_active'.
+
+    Returns
+    -------
+    numpy.ndarray
+        The packed hands, as 'uint64'.
+    """
+    rank_codes = np.asarray(rank_codes, dtype=np.uint64)
+    assert rank_codes.shape[1] <= max_packed_cards, f"Hands of over {max_packed_cards} cards cannot be packed!"
+    packed_hands = (rank_codes << _card_shifts[: rank_codes.shape[1]]).sum(axis=1, dtype=np.uint64)
+    for status_flags, status_bit in ((bust, bust_bit), (natural, natural_bit), (stood, stood_bit)):
+        packed_hands |= np.asarray(status_flags, dtype=np.uint64) << np.uint64(status_bit)
+    return packed_hands
+
+
+def decode_hands(packed_hands):
+    """
+    Unpacks an array of packed hands (the inverse of 'encode_hands').
+
+    Parameters
+    ----------
+    packed_hands : array_like of int
+        The packed hands.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The rank codes, of shape (hand count, 'max_packed_cards'), as 'uint8'; then each hand's bust, natural and stood
+        statuses as boolean arrays.
+    """
+    packed_hands = np.asarray(packed_hands, dtype=np.uint64)
+    rank_codes = ((packed_hands[:, np.newaxis] >> _card_shifts) & np.uint64(_card_mask)).astype(np.uint8)
+    return (
+        rank_codes,
+        *(
+            ((packed_hands >> np.uint64(status_bit)) & np.uint64(1)).astype(bool)
+            for status_bit in (bust_bit, natural_bit, stood_bit)
+        ),
+    )
+
+
+def hand_values(packed_hands):
+    """
+    Returns the best value of each packed hand, as 'Hand.best_hand_value', and its number of cards.
+
+    Parameters
+    ----------
+    packed_hands : array_like of int
+        The packed hands.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Each hand's best value (0 for a bust hand, where 'best_hand_value' returns None), then its number of cards, as
+        'int64'.
+    """
+    rank_codes = decode_hands(packed_hands)[0]
+    hard_totals = _rank_code_values[rank_codes].sum(axis=1)
+    soft_totals = np.where((rank_codes == rank_names.index("Ace") + 1).any(axis=1), hard_totals + 10, hard_totals)
+    best_values = np.where(soft_totals <= 21, soft_totals, np.where(hard_totals <= 21, hard_totals, 0))
+    return best_values, (rank_codes != 0).sum(axis=1)
@@ -0,0 +1,232 @@
+"""
+This module exports the 'EdgeModel' and 'KellyAdvisor' classes and the 'default_edge_model': Kelly bet sizing from the
+player's edge, estimated at the start of each round from the composition of the shoe.
+
+The exact edge of a composition (see 'OutcomeCalculator.initial_ev') takes seconds to calculate, far too long to wait
+for at the start of a round. An edge model instead estimates it with the effects of removal: the exact change in the
+edge of a single 52-card deck when one card of each value class is removed. The cards missing from a shoe, compared
+with a shoe of the same size in full proportion, shift the full shoe's edge by their effects of removal, scaled by the
+size of the shoe ('52 / cards left'). This is the linear model behind card-counting indices and is accurate to a few
+tenths of a percent of edge. The model is calculated once per rules and strategy; each estimate then costs ten
+multiplications, and an advisor also caches its estimates by the shoe's composition hash.
+
+The Kelly criterion stakes the fraction 'edge / variance' of the player's balance, which maximises long-run growth; a
+fraction of that ('fractional Kelly') gives up a little growth for much smaller swings.
+
+Attributes
+----------
+default_edge_model : blackjack.kelly.EdgeModel
+    The edge model for 'blackjack.rules.default_rules' and basic strategy, as calculated by 'EdgeModel.build' (with a
+    variance estimated from 400,000 simulated rounds).
+"""
+import math
+from blackjack.deck import rank_value_classes, value_class_count
+from blackjack.probability import OutcomeCalculator
+from blackjack.rules import default_rules
+
+_full_deck_composition = tuple(
+    rank_value_classes.count(class_idx) * 4 for class_idx in range(value_class_count)
+)  # The cards in each value class of a single 52-card deck
+
+
+class EdgeModel:
+    """
+    A class defining a linear model of the player's edge: the edge of a full shoe and the effect of removing each card.
+    """
+
+    def __init__(self, full_shoe_edge, removal_effects, variance):
+        """
+        Initialises an edge model. Use 'build' to calculate a model for a set of rules.
+
+        Parameters
+        ----------
+        full_shoe_edge : float
+            The player's exact expected net result per unit bet from a full shoe (negative for a house edge).
+        removal_effects : tuple of float
+            For each value class, the change in the edge of a single 52-card deck when one card of that class is
+            removed.
+        variance : float
+            The variance of the player's net result per unit bet, per round.
+        """
+        self._full_shoe_edge = full_shoe_edge
+        self._removal_effects = tuple(removal_effects)
+        self._variance = variance
+
+    def __repr__(self):
+        return (
+            f"EdgeModel(full_shoe_edge={self._full_shoe_edge!r}, removal_effects={self._removal_effects!r}, "
+            f"variance={self._variance!r})"
+        )
+
+    @classmethod
+    def build(cls, rules=None, strategy=None, variance_rounds=400_000, seed=None, processes=None):
+        """
+        Calculates an edge model: the full shoe's edge and the effects of removal exactly, the variance by simulation.
+
+        An offline job: the exact edges take around a minute each, calculated in parallel.
+
+        Parameters
+        ----------
+        rules : blackjack.rules.Rules
+            The table rules. Defaults to None: 'blackjack.rules.default_rules'.
+        strategy : blackjack.strategy.Strategy
+            The player's strategy. Defaults to None: basic strategy.
+        variance_rounds : int
+            The number of rounds simulated to estimate the variance.
+        seed : int
+            Seeds the simulation.
+        processes : int
+            The number of worker processes. Defaults to None: one per CPU.
+
+        Returns
+        -------
+        blackjack.kelly.EdgeModel
+            The calculated model.
+        """
+        import multiprocessing
+        import random
+        from blackjack.rank_shoe import RankShoe
+        from blackjack.simulation import run_simulation
+
+        if rules is None:
+            rules = default_rules
+        full_shoe = tuple(class_count * rules.get_deck_count() for class_count in _full_deck_composition)
+        compositions = [full_shoe, _full_deck_composition] + [
+            tuple(
+                class_count - (class_idx == removed_idx) for class_idx, class_count in enumerate(_full_deck_composition)
+            )
+            for removed_idx in range(value_class_count)
+        ]
+        with multiprocessing.Pool(processes) as pool:
+            edges = pool.starmap(_initial_ev, [(composition, rules, strategy) for composition in compositions])
+
+        bet = 100
+        round_statistics = run_simulation(
+            RankShoe(rules.get_deck_count(), rng=random.Random(seed)), variance_rounds, strategy, rules, bet
+        )
+        removal_effects = tuple(removed_edge - edges[1] for removed_edge in edges[2:])
+        return cls(edges[0], removal_effects, round_statistics.variance() / bet ** 2)
+
+    def get_full_shoe_edge(self):
+        """Returns the player's edge from a full shoe, per unit bet."""
+        return self._full_shoe_edge
+
+    def get_removal_effects(self):
+        """Returns the change in a single deck's edge on removing one card of each value class."""
+        return self._removal_effects
+
+    def get_variance(self):
+        """Returns the variance of the player's net result per unit bet, per round."""
+        return self._variance
+
+    def edge(self, composition):
+        """
+        Returns the estimated edge of the player, per unit bet, for a round dealt from a shoe.
+
+        Parameters
+        ----------
+        composition : sequence of int
+            The cards left in the shoe, per value class (see 'Deck.composition').
+        """
+        card_total = sum(composition)
+        deck_total = sum(_full_deck_composition)
+        edge_shift = 0.0
+        for full_count, class_count, removal_effect in zip(_full_deck_composition, composition, self._removal_effects):
+            edge_shift += (full_count * card_total / deck_total - class_count) * removal_effect  # Cards missing
+        return self._full_shoe_edge + edge_shift * deck_total / card_total
+
+    def to_dict(self):
+        """Returns the model as a JSON-serialisable dict, e.g. to cache a model built for non-default rules."""
+        return {
+            "full_shoe_edge": self._full_shoe_edge,
+            "removal_effects": list(self._removal_effects),
+            "variance": self._variance,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        """Recreates a model from the output of 'to_dict'."""
+        return cls(state["full_shoe_edge"], state["removal_effects"], state["variance"])
+
+
+class KellyAdvisor:
+    """
+    A class recommending a bet for the next round: a fraction of the Kelly stake for the shoe's estimated edge.
+    """
+
+    def __init__(self, edge_model=None, kelly_fraction=0.5, minimum_bet=100):
+        """
+        Initialises an advisor.
+
+        Parameters
+        ----------
+        edge_model : blackjack.kelly.EdgeModel
+            Estimates the player's edge. Defaults to None: 'default_edge_model'.
+        kelly_fraction : float
+            The fraction of the full Kelly stake recommended. Defaults to 0.5 ('half Kelly').
+        minimum_bet : int
+            The table minimum, in minor currency units: recommended whenever the player has no edge (bets must be
+            positive), and the smallest bet ever recommended.
+        """
+        assert 0 < kelly_fraction <= 1, "'kelly_fraction' must be greater than 0 and at most 1!"
+        self._edge_model = default_edge_model if edge_model is None else edge_model
+        self._kelly_fraction = kelly_fraction
+        self._minimum_bet = minimum_bet
+        self._estimates = {}  # Maps a composition hash to its (edge, Kelly fraction of the balance)
+
+    def estimate(self, live_deck):
+        """
+        Returns the player's estimated edge and variance, per unit bet, for the next round dealt from a deck.
+
+        Parameters
+        ----------
+        live_deck : blackjack.deck.Deck
+            The deck the next round is dealt from.
+
+        Returns
+        -------
+        tuple of float
+            The edge (negative for a house edge) and the variance of the net result.
+        """
+        return self._cached_estimate(live_deck)[0], self._edge_model.get_variance()
+
+    def recommend_bet(self, live_deck, balance):
+        """
+        Returns the recommended bet for the next round, in minor currency units.
+
+        Parameters
+        ----------
+        live_deck : blackjack.deck.Deck
+            The deck the next round is dealt from.
+        balance : int
+            The player's balance, in minor currency units (e.g. 'Player.get_balance()').
+
+        Returns
+        -------
+        int
+            The fractional Kelly stake, rounded down; at least the minimum bet, and at most the balance.
+        """
+        balance_fraction = self._cached_estimate(live_deck)[1]
+        kelly_bet = math.floor(balance_fraction * balance)
+        return min(max(kelly_bet, self._minimum_bet), balance)
+
+    def _cached_estimate(self, live_deck):
+        """Returns the deck's estimated edge and fraction of the balance to bet, from the cache where possible."""
+        composition_key = live_deck.composition_hash()
+        if composition_key not in self._estimates:
+            edge = self._edge_model.edge(live_deck.composition())
+            balance_fraction = max(edge, 0.0) / self._edge_model.get_variance() * self._kelly_fraction
+            self._estimates[composition_key] = edge, balance_fraction
+        return self._estimates[composition_key]
+
+
+def _initial_ev(composition, rules, strategy):
+    """Returns the exact edge of a composition (a task of 'EdgeModel.build')."""
+    return OutcomeCalculator(rules, strategy).initial_ev(composition)
+
+
+default_edge_model = EdgeModel(
+    -0.0234712,
+    (-0.0066820, 0.0028584, 0.0033626, 0.0039406, 0.0048734, 0.0037327, 0.0023726, 0.0006365, -0.0009701, -0.0035312),
+    0.96881,
+)
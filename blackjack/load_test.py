@@ -0,0 +1,310 @@
+"""
+This module exports the 'ScriptedBot' and 'LoadTestReport' classes and the 'run_session' and 'run_load_test'
+functions: a load generator driving the interactive game through its real input path, and a latency benchmark.
+
+Each session plays 'blackjack_main.run' unchanged, with the built-in 'input' replaced by a scripted bot: the bot
+answers the name prompt ('Player.set_name'), each bet prompt ('Player.place_bet') and each hit/stand prompt
+('single_player_action'), occasionally entering an invalid response first, and quits at the bet prompt once it has
+played its rounds. The game's printing goes to a null stream, and its pauses ('time.sleep' and the hand module's
+'draw_delay') are skipped so they do not swamp the latencies measured.
+
+The latency of a response is the time from the bot answering a prompt to the game asking for its next input: all of
+the game's processing of that response (validating it, dealing, settling and printing). Latencies are recorded per
+prompt kind. Sessions run concurrently in a pool of worker processes (the replaced 'input' is global to a process, so
+each process plays one session at a time).
+
+Attributes
+----------
+prompt_kinds : tuple of str
+    The kinds of prompt answered by a bot, in the order latencies are reported.
+"""
+import builtins
+import contextlib
+import os
+import random
+import time
+from blackjack import blackjack_main
+from blackjack import hand as hand_module
+
+prompt_kinds = ("name", "bet", "action")
+_prompt_markers = {"name": "Enter your name", "bet": "Place your bet", "action": "Hit [h] or Stand [s]"}
+
+
+class ScriptedBot:
+    """
+    A class defining a bot player: a scripted stream of responses to the interactive game's prompts.
+    """
+
+    def __init__(self, name, round_count, bet_text="5", hit_probability=0.4, invalid_rate=0.05, rng=None):
+        """
+        Initialises a bot.
+
+        Parameters
+        ----------
+        name : str
+            The name entered at the name prompt (1 to 12 characters).
+        round_count : int
+            The number of bets placed before the bot quits; the session ends earlier if the bot's balance runs out.
+        bet_text : str
+            The bet entered at each bet prompt, as typed by a player (e.g. '5' for £5.00).
+        hit_probability : float
+            The probability of hitting at each hit/stand prompt.
+        invalid_rate : float
+            The probability of entering an invalid response before a valid one, at each prompt.
+        rng : random.Random
+            The random generator for the bot's choices. Defaults to None: a new unseeded generator.
+        """
+        assert len(name) in range(1, 13), "A bot's name must be between 1 and 12 characters long!"
+        self._name = name
+        self._round_count = round_count
+        self._bet_text = bet_text
+        self._hit_probability = hit_probability
+        self._invalid_rate = invalid_rate
+        self._rng = random.Random() if rng is None else rng
+        self._bets_placed = 0  # Valid bets entered so far: the rounds started
+        self._invalid_pending = set()  # Prompt kinds answered invalidly, awaiting their valid response
+
+    def get_bets_placed(self):
+        """Returns the number of valid bets entered so far: the number of rounds the bot has started."""
+        return self._bets_placed
+
+    def respond(self, prompt_kind):
+        """
+        Returns the bot's response to a prompt.
+
+        Parameters
+        ----------
+        prompt_kind : str
+            The kind of prompt (one of 'prompt_kinds').
+
+        Returns
+        -------
+        str
+            The text entered, as if typed by a player.
+        """
+        if prompt_kind == "bet" and self._bets_placed >= self._round_count:
+            return blackjack_main.exit_string
+        if prompt_kind not in self._invalid_pending and self._rng.random() < self._invalid_rate:
+            self._invalid_pending.add(prompt_kind)
+            return {"name": "x" * 13, "bet": "lots", "action": "?"}[prompt_kind]
+        self._invalid_pending.discard(prompt_kind)
+
+        if prompt_kind == "name":
+            return self._name
+        if prompt_kind == "bet":
+            self._bets_placed += 1
+            return self._bet_text
+        return "h" if self._rng.random() < self._hit_probability else "s"
+
+
+class LoadTestReport:
+    """
+    A class holding the results of a load test: rounds played, wall-clock time and per-prompt response latencies.
+    """
+
+    def __init__(self, session_count, round_count, elapsed, latencies):
+        """
+        Initialises a report.
+
+        Parameters
+        ----------
+        session_count : int
+            The number of sessions played.
+        round_count : int
+            The total number of rounds played across all sessions.
+        elapsed : float
+            The wall-clock time taken to play every session, in seconds.
+        latencies : dict
+            Each prompt kind mapped to a list of the response latencies measured for it, in seconds.
+        """
+        self._session_count = session_count
+        self._round_count = round_count
+        self._elapsed = elapsed
+        self._latencies = {prompt_kind: sorted(latencies.get(prompt_kind, ())) for prompt_kind in prompt_kinds}
+
+    def get_session_count(self):
+        """Returns the number of sessions played."""
+        return self._session_count
+
+    def get_round_count(self):
+        """Returns the total number of rounds played."""
+        return self._round_count
+
+    def get_elapsed(self):
+        """Returns the wall-clock time taken, in seconds."""
+        return self._elapsed
+
+    def rounds_per_second(self):
+        """Returns the throughput of the load test: rounds played per second of wall-clock time, across all sessions."""
+        return self._round_count / self._elapsed if self._elapsed > 0 else float("inf")
+
+    def latency_count(self, prompt_kind=None):
+        """Returns the number of latencies measured for a prompt kind, or for every kind if None."""
+        return len(self._kind_latencies(prompt_kind))
+
+    def latency_percentile(self, percentile, prompt_kind=None):
+        """
+        Returns a percentile of the response latencies (nearest rank), in seconds.
+
+        Parameters
+        ----------
+        percentile : float
+            The percentile, between 0 and 100 (e.g. 99 for the 99th percentile).
+        prompt_kind : str
+            The kind of prompt (one of 'prompt_kinds'). Defaults to None: latencies of every kind.
+
+        Returns
+        -------
+        float
+            The latency, or None if none were measured.
+        """
+        assert 0 <= percentile <= 100, "'percentile' must be between 0 and 100!"
+        kind_latencies = self._kind_latencies(prompt_kind)
+        if not kind_latencies:
+            return None
+        rank = max(-(-percentile * len(kind_latencies) // 100), 1)  # Nearest rank: the ceiling, counted from 1
+        return kind_latencies[int(rank) - 1]
+
+    def summary(self, percentiles=(50, 90, 99)):
+        """Returns a short multi-line summary: throughput, then the latency percentiles of each prompt kind."""
+        lines = [
+            f"{self._session_count} sessions, {self._round_count} rounds in {self._elapsed:.2f}s: "
+            f"{self.rounds_per_second():.1f} rounds/s"
+        ]
+        for prompt_kind in (*prompt_kinds, None):
+            if not self.latency_count(prompt_kind):
+                continue
+            percentile_text = ", ".join(
+                f"p{percentile} {self.latency_percentile(percentile, prompt_kind) * 1000:.3f}ms"
+                for percentile in percentiles
+            )
+            lines.append(f"{prompt_kind or 'all':<7} n={self.latency_count(prompt_kind)}: {percentile_text}")
+        return "\n".join(lines)
+
+    def _kind_latencies(self, prompt_kind):
+        """Returns the sorted latencies of a prompt kind, or of every kind if None."""
+        if prompt_kind is None:
+            return sorted(latency for kind_latencies in self._latencies.values() for latency in kind_latencies)
+        return self._latencies[prompt_kind]
+
+
+def run_session(bot, rendered=False):
+    """
+    Plays one interactive session ('blackjack_main.run') with a bot answering every prompt.
+
+    Parameters
+    ----------
+    bot : blackjack.load_test.ScriptedBot
+        Answers the game's prompts.
+    rendered : bool
+        If True, the game is played with a 'blackjack.renderer.TableRenderer'. Defaults to False: hands are printed.
+
+    Returns
+    -------
+    tuple
+        The number of rounds played, then a dict mapping each prompt kind to its list of response latencies (seconds).
+    """
+    latencies = {prompt_kind: [] for prompt_kind in prompt_kinds}
+    last_answer = None  # The kind of the last prompt answered and the time it was answered
+
+    def scripted_input(prompt=""):
+        nonlocal last_answer
+        asked_at = time.perf_counter()
+        if last_answer is not None:
+            latencies[last_answer[0]].append(asked_at - last_answer[1])
+        prompt_kind = next(kind for kind, marker in _prompt_markers.items() if marker in prompt)
+        response = bot.respond(prompt_kind)
+        last_answer = prompt_kind, time.perf_counter()
+        return response
+
+    with _scripted_io(scripted_input):
+        renderer = None
+        if rendered:
+            from blackjack.renderer import TableRenderer
+
+            renderer = TableRenderer()
+        try:
+            blackjack_main.run(renderer=renderer)
+            latencies[last_answer[0]].append(time.perf_counter() - last_answer[1])  # Game over: balance ran out
+        except SystemExit:
+            pass  # The bot quit
+    return bot.get_bets_placed(), latencies
+
+
+def run_load_test(
+    session_count,
+    rounds_per_session=20,
+    processes=None,
+    seed=None,
+    bet_text="5",
+    hit_probability=0.4,
+    invalid_rate=0.05,
+    rendered=False,
+):
+    """
+    Plays many scripted sessions concurrently and returns their throughput and response latencies.
+
+    Parameters
+    ----------
+    session_count : int
+        The number of sessions (bot players) to play.
+    rounds_per_session : int
+        The number of rounds each bot plays before quitting.
+    processes : int
+        The number of worker processes: the number of sessions played at once. Defaults to None: one per CPU. With 1,
+        sessions are played one after another in this process.
+    seed : int
+        Seeds each bot's choices and its game's shuffles.
+    bet_text, hit_probability, invalid_rate
+        Each bot's script (see 'ScriptedBot').
+    rendered : bool
+        If True, sessions are played with a table renderer (see 'run_session').
+
+    Returns
+    -------
+    blackjack.load_test.LoadTestReport
+        The rounds played, the wall-clock time and the latencies of every session.
+    """
+    seed_rng = random.Random(seed)
+    session_args = [
+        (f"Bot{session_idx}", rounds_per_session, seed_rng.getrandbits(64), bet_text, hit_probability, invalid_rate,
+         rendered)
+        for session_idx in range(session_count)
+    ]
+    start_time = time.perf_counter()
+    if processes == 1:
+        session_results = [_seeded_session(*args) for args in session_args]
+    else:
+        import multiprocessing
+
+        with multiprocessing.Pool(processes) as pool:
+            session_results = pool.starmap(_seeded_session, session_args)
+    elapsed = time.perf_counter() - start_time
+
+    latencies = {prompt_kind: [] for prompt_kind in prompt_kinds}
+    for _, session_latencies in session_results:
+        for prompt_kind, kind_latencies in session_latencies.items():
+            latencies[prompt_kind].extend(kind_latencies)
+    return LoadTestReport(session_count, sum(rounds for rounds, _ in session_results), elapsed, latencies)
+
+
+def _seeded_session(name, round_count, seed, bet_text, hit_probability, invalid_rate, rendered):
+    """Plays one session of 'run_load_test' with a bot and game shuffles seeded from 'seed'."""
+    rng = random.Random(seed)
+    random.seed(rng.getrandbits(64))  # The game's deck shuffles with the shared generator
+    bot = ScriptedBot(name, round_count, bet_text, hit_probability, invalid_rate, rng)
+    return run_session(bot, rendered)
+
+
+@contextlib.contextmanager
+def _scripted_io(input_function):
+    """Replaces the built-in 'input', discards printing and skips the game's pauses for the duration of a session."""
+    saved_input, saved_sleep, saved_delay = builtins.input, time.sleep, hand_module.draw_delay
+    builtins.input = input_function
+    time.sleep = lambda seconds: None
+    hand_module.draw_delay = 0
+    try:
+        with open(os.devnull, "w") as null_stream, contextlib.redirect_stdout(null_stream):
+            yield
+    finally:
+        builtins.input, time.sleep, hand_module.draw_delay = saved_input, saved_sleep, saved_delay
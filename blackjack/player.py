@@ -2,6 +2,7 @@
 This module exports the 'Player' class and related methods.
 """
 import sys
+from decimal import Decimal, InvalidOperation
 
 exit_string = "quit"  # If this string is entered by the user, the user exits the game.
 
@@ -13,15 +14,30 @@ class Player:
     A player object represents a single participant in the game of blackjack. A player is initialised with: a name
     (input by the user) and a starting balance of £500. Money is withdrawn from a player's balance when they make a bet;
     any winnings are paid into this balance.
+
+    All monetary amounts (balances, bets and payouts) are held as integer numbers of minor currency units, e.g. pence,
+    so that sums of any number of amounts are exact. Amounts are only converted to decimal notation for display, using
+    the player's currency symbol and precision (see 'format_amount').
     """
 
-    def __init__(self):
-        """Initialises a player object: user is required to enter a name for the player - players start with £500."""
+    def __init__(self, name=None):
+        """
+        Initialises a player object: user is required to enter a name for the player - players start with £500.
+
+        Parameters
+        ----------
+        name : str
+            The player's name. Defaults to None, in which case the user is prompted to enter a name; passing a name
+            allows players to be created without keyboard input, e.g. for automated (headless) play.
+        """
         self._name = "None Entered"  # The player's name: requiring user keyboard input via method called below
-        self.set_name()
-        self._balance = 500.00  # The starting balance for any player
+        if name is None:
+            self.set_name()
+        else:
+            self._name = name
         self._precision = 2  # The precision (after decimal place) to which monetary amounts are rounded
         self._currency = "£"  # The currency associated with the player object's balance
+        self._balance = 500 * 10 ** self._precision  # The starting balance for any player (£500) in minor units
 
     def __repr__(self):
         """
@@ -50,7 +66,7 @@ class Player:
         self._name = player_name
 
     def get_balance(self):
-        """Returns the player's balance as a float."""
+        """Returns the player's balance as an integer number of minor currency units (e.g. pence)."""
         return self._balance
 
     def update_balance(self, difference):
@@ -59,9 +75,10 @@ class Player:
 
         Parameters
         ----------
-        difference : float
-            The value added (if +ve) or removed (if -ve) from the player's balance.
+        difference : int
+            The amount, in minor currency units, added (if +ve) or removed (if -ve) from the player's balance.
         """
+        assert isinstance(difference, int), "Balance updates must be whole numbers of minor currency units."
         self._balance += difference
 
     def get_precision(self):
@@ -72,7 +89,48 @@ class Player:
         """Returns the currency associated with the player's balance."""
         return self._currency
 
-    def place_bet(self, player_hand):
+    def format_amount(self, amount):
+        """
+        Returns an amount in minor currency units as a string in the player's currency, e.g. 1250 -> '£12.50'.
+
+        Parameters
+        ----------
+        amount : int
+            The amount in minor currency units.
+        """
+        return f"{self._currency}{Decimal(amount).scaleb(-self._precision):.{self._precision}f}"
+
+    def to_minor_units(self, text_amount):
+        """
+        Converts an amount entered as text in major currency units (e.g. '£12.50') to minor currency units (1250).
+
+        The conversion is exact for amounts entered to the player's precision; any further decimal places are rounded
+        (half to even).
+
+        Parameters
+        ----------
+        text_amount : str
+            The amount as entered, optionally prefixed by the player's currency symbol.
+
+        Returns
+        -------
+        int
+            The amount in minor currency units.
+
+        Raises
+        ------
+        ValueError
+            Raised when 'text_amount' is not a finite number.
+        """
+        try:
+            decimal_amount = Decimal(text_amount.replace(self._currency, "").strip())
+        except InvalidOperation:
+            raise ValueError(f"Invalid amount: {text_amount}")
+        if not decimal_amount.is_finite():
+            raise ValueError(f"Invalid amount: {text_amount}")
+        return int(decimal_amount.scaleb(self._precision).to_integral_value())
+
+    def place_bet(self, player_hand, suggested_bet=None):
         """
         Processes a bet made by a player: user enters bet amount; amount is verified; if OK, bet is added to input hand.
 
@@ -80,15 +138,18 @@ class Player:
         ----------
         player_hand : blackjack.hand.PlayerHand
             The player's 'live' hand object. The user-entered bet will be linked to this hand.
+        suggested_bet : int
+            A bet recommended to the player (e.g. by 'blackjack.kelly.KellyAdvisor'), in minor currency units, shown
+            before they enter their bet. Defaults to None: no suggestion is shown.
         """
-        invalid_bet_message = f"Invalid bet: must be number between 0 and {self._currency}{self._balance:.2f}!"
+        invalid_bet_message = f"Invalid bet: must be number between 0 and {self.format_amount(self._balance)}!"
         self.print_player_details()
+        if suggested_bet is not None:
+            print(f"Suggested bet: {self.format_amount(suggested_bet)}")
         while True:
             try:
                 input_amount = input(f"\nPlace your bet: ")
-                amount = round(
-                    float(input_amount.replace(self._currency, "")), self._precision
-                )
+                amount = self.to_minor_units(input_amount)
                 if 0 < amount <= self.get_balance():
                     break
                 print(invalid_bet_message)
@@ -111,5 +172,5 @@ class Player:
             __repr__ method which must return a string-like object.
         """
         empty_string = ""
-        print(f"{self._name}: balance = {self._currency}{self._balance:.{self._precision}f}")
+        print(f"{self._name}: balance = {self.format_amount(self._balance)}")
         return empty_string
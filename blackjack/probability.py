@@ -0,0 +1,477 @@
+"""
+This module exports the 'OutcomeCalculator' class and the 'shoe_composition' function: exact outcome probabilities and
+round EV, calculated from the composition of the remaining shoe rather than simulated.
+
+Calculations follow the game's value semantics (see 'Hand.hand_value' and 'Hand.best_hand_value'): aces count 1 or 11,
+a hand's best value is its highest value of 21 or under, a hand reaching 21 stands automatically and a two-card 21 is a
+natural. A hand is tracked by its hard total (every ace counted as 1), whether it holds an ace and its number of cards;
+the shoe by its 'composition': the number of cards of each value class left in it.
+
+Results for every (hand, composition) pair reached are memoised by the calculator, so subtrees shared between paths
+(e.g. the dealer's draws after the player draws a 5 then a 6, or a 6 then a 5) are calculated once. Memo tables are
+keyed on the composition's Zobrist hash (see 'blackjack.deck.composition_hash'), updated with two XORs per card drawn,
+rather than on the composition itself; a live deck's hash is read with 'Deck.composition_hash'.
+
+Attributes
+----------
+bust_outcome : str
+    The outcome key of a bust hand in the distributions returned by 'OutcomeCalculator'.
+natural_outcome : str
+    The outcome key of a natural in the distributions returned by 'OutcomeCalculator'.
+"""
+from blackjack.deck import Deck, composition_hash, composition_keys, value_class_count
+from blackjack.rules import default_rules
+from blackjack.strategy import BasicStrategy, upcard_value
+
+bust_outcome = "bust"
+natural_outcome = "natural"
+_bust_idx = 22  # Index of bust within the internal outcome tuples; indices 0 to 21 hold final hand values
+_natural_idx = 23  # Index of a natural within the internal outcome tuples
+
+
+def value_class(card):
+    """Returns the index of a card's value class within a composition: 0 for an ace, value - 1 otherwise."""
+    card_value = upcard_value(card)
+    return 0 if card_value == 11 else card_value - 1
+
+
+def shoe_composition(cards):
+    """
+    Returns the composition of a collection of cards, e.g. the cards left in a deck.
+
+    Parameters
+    ----------
+    cards : iterable of blackjack.card.Card
+        The cards to count, e.g. a 'Deck' object.
+
+    Returns
+    -------
+    tuple of int
+        The number of cards in each value class: aces, two to nine, then ten-value cards.
+    """
+    counts = [0] * value_class_count
+    for card in cards:
+        counts[value_class(card)] += 1
+    return tuple(counts)
+
+
+def _hand_key(cards):
+    """Returns the hard total, ace status and card count of a collection of cards."""
+    value_classes = [value_class(card) for card in cards]
+    return sum(class_idx + 1 for class_idx in value_classes), 0 in value_classes, len(value_classes)
+
+
+def _best_value(hard_total, has_ace):
+    """Returns a hand's best value (None if bust) and whether it is soft, as 'Hand.best_hand_value' and 'is_soft'."""
+    if has_ace and hard_total + 10 <= 21:
+        return hard_total + 10, True
+    if hard_total <= 21:
+        return hard_total, False
+    return None, False
+
+
+def _outcome_dict(outcome_probabilities):
+    """Converts an internal outcome tuple to a dict keyed by final value, 'bust_outcome' or 'natural_outcome'."""
+    outcomes = {}
+    for outcome_idx, probability in enumerate(outcome_probabilities):
+        if probability > 0:
+            if outcome_idx == _bust_idx:
+                outcomes[bust_outcome] = probability
+            elif outcome_idx == _natural_idx:
+                outcomes[natural_outcome] = probability
+            else:
+                outcomes[outcome_idx] = probability
+    return outcomes
+
+
+class OutcomeCalculator:
+    """
+    A class calculating exact outcome distributions and round EV for given table rules and player strategy.
+
+    Each calculator memoises its results; memo tables grow with the number of distinct shoe compositions queried and
+    can be emptied with 'clear'.
+    """
+
+    def __init__(self, rules=None, strategy=None):
+        """
+        Initialises a calculator with empty memo tables.
+
+        Parameters
+        ----------
+        rules : blackjack.rules.Rules
+            The table rules: the dealer's drawing rule and payouts. Defaults to None: 'blackjack.rules.default_rules'.
+        strategy : blackjack.strategy.Strategy
+            The player's fixed strategy (only its 'should_hit' method is used). Defaults to None: basic strategy.
+        """
+        self._rules = default_rules if rules is None else rules
+        self._strategy = BasicStrategy() if strategy is None else strategy
+        self._dealer_memo = {}  # Maps (dealer hand, composition hash) to the dealer's outcome probabilities
+        self._player_memo = {}  # Maps (player hand, upcard, composition hash) to the player's outcome probabilities
+        self._ev_memo = {}  # Maps (player hand, dealer hand, composition hash) to the player's EV per unit bet
+        self._stand_memo = {}  # Maps (player value, upcard, composition hash) to the player's EV on standing
+        self._optimal_memo = {}  # Maps (player hand, upcard, composition hash) to the player's EV on hitting optimally
+
+    def clear(self):
+        """Empties the calculator's memo tables."""
+        self._dealer_memo.clear()
+        self._player_memo.clear()
+        self._ev_memo.clear()
+        self._stand_memo.clear()
+        self._optimal_memo.clear()
+
+    def dealer_distribution(self, dealer_cards, composition):
+        """
+        Returns the probability of each final outcome of the dealer's hand, drawing to the rules' target.
+
+        Parameters
+        ----------
+        dealer_cards : iterable of blackjack.card.Card
+            The dealer's cards so far (e.g. their face-up card only); face-down cards are included.
+        composition : tuple of int
+            The cards left in the shoe (see 'shoe_composition').
+
+        Returns
+        -------
+        dict
+            Maps each final hand value, 'bust_outcome' and 'natural_outcome' to its probability.
+        """
+        composition = tuple(composition)
+        return _outcome_dict(
+            self._dealer_outcomes(*_hand_key(dealer_cards), composition, composition_hash(composition))
+        )
+
+    def player_distribution(self, player_cards, dealer_upcard, composition):
+        """
+        Returns the probability of each final outcome of the player's hand, playing the calculator's strategy.
+
+        Parameters
+        ----------
+        player_cards : iterable of blackjack.card.Card
+            The player's cards so far, e.g. a 'PlayerHand' object.
+        dealer_upcard : blackjack.card.Card
+            The dealer's face-up card, seen by the strategy.
+        composition : tuple of int
+            The cards left in the shoe (see 'shoe_composition').
+
+        Returns
+        -------
+        dict
+            Maps each final hand value (at which the player stood), 'bust_outcome' and 'natural_outcome' to its
+            probability.
+        """
+        composition = tuple(composition)
+        return _outcome_dict(
+            self._player_outcomes(
+                *_hand_key(player_cards), upcard_value(dealer_upcard), composition, composition_hash(composition)
+            )
+        )
+
+    def initial_ev(self, composition):
+        """
+        Returns the player's exact expected net result, per unit bet, for a round about to be dealt from a shoe.
+
+        Every deal of the player's two cards and the dealer's face-up card is weighted by its probability and its EV
+        taken from 'round_ev'. This is an exact calculation over the whole game tree: expect seconds to a minute,
+        depending on the size of the shoe.
+
+        Parameters
+        ----------
+        composition : tuple of int
+            The cards left in the shoe (see 'shoe_composition').
+
+        Returns
+        -------
+        float
+            The expected net result as a multiple of the bet.
+        """
+        class_cards = [Deck.decode_card(class_idx, 0) for class_idx in range(value_class_count)]  # One card per class
+        unseen = list(composition)
+        card_total = sum(unseen)
+        initial_ev = 0.0
+        for first_class in range(value_class_count):
+            first_probability = unseen[first_class] / card_total
+            if first_probability == 0:
+                continue
+            unseen[first_class] -= 1
+            for upcard_class in range(value_class_count):
+                upcard_probability = first_probability * unseen[upcard_class] / (card_total - 1)
+                if upcard_probability == 0:
+                    continue
+                unseen[upcard_class] -= 1
+                for second_class in range(value_class_count):
+                    deal_probability = upcard_probability * unseen[second_class] / (card_total - 2)
+                    if deal_probability == 0:
+                        continue
+                    unseen[second_class] -= 1
+                    initial_ev += deal_probability * self.round_ev(
+                        (class_cards[first_class], class_cards[second_class]), class_cards[upcard_class], unseen
+                    )
+                    unseen[second_class] += 1
+                unseen[upcard_class] += 1
+            unseen[first_class] += 1
+        return initial_ev
+
+    def round_ev(self, player_cards, dealer_upcard, composition):
+        """
+        Returns the player's exact expected net result, per unit bet, for a round in progress.
+
+        The dealer's face-down card is treated as unknown: each possible card is weighted by its share of 'composition'.
+        As in 'DealerHand.settle_naturals', a dealer natural ends the round before the player acts. Every card drawn by
+        the player is removed from the shoe before the dealer draws, so the result is exact for the given composition.
+
+        Parameters
+        ----------
+        player_cards : iterable of blackjack.card.Card
+            The player's cards so far, e.g. a 'PlayerHand' object.
+        dealer_upcard : blackjack.card.Card
+            The dealer's face-up card.
+        composition : tuple of int
+            The cards unseen by the player: the cards left in the shoe plus the dealer's face-down card (if dealt).
+
+        Returns
+        -------
+        float
+            The expected net result as a multiple of the bet, e.g. -0.05 for a 5% house edge.
+        """
+        composition = tuple(composition)
+        composition_key = composition_hash(composition)
+        player_hard, player_ace, player_count = _hand_key(player_cards)
+        upcard_class = value_class(dealer_upcard)
+        player_natural = player_count == 2 and _best_value(player_hard, player_ace)[0] == 21
+        natural_net = float(self._rules.natural_multiplier()) - 1
+
+        card_total = sum(composition)
+        round_ev = 0.0
+        for hole_class, hole_count in enumerate(composition):
+            if hole_count == 0:
+                continue
+            hole_probability = hole_count / card_total
+            dealer_hard = upcard_class + hole_class + 2
+            dealer_ace = upcard_class == 0 or hole_class == 0
+            if _best_value(dealer_hard, dealer_ace)[0] == 21:
+                round_ev += hole_probability * (0.0 if player_natural else -1.0)
+            elif player_natural:
+                round_ev += hole_probability * natural_net
+            else:
+                round_ev += hole_probability * self._player_ev(
+                    player_hard,
+                    player_ace,
+                    player_count,
+                    dealer_hard,
+                    dealer_ace,
+                    upcard_class,
+                    *_remove_card(composition, composition_key, hole_class),
+                )
+        return round_ev
+
+    def decision_evs(self, player_classes, upcard_class, composition):
+        """
+        Returns the player's EV on standing and on hitting (then playing on optimally) for a hand in progress.
+
+        Unlike 'round_ev', later decisions are not taken from the calculator's strategy: after hitting, the player
+        stands or hits again, whichever has the higher EV given the exact composition of the unseen cards
+        (composition-dependent optimal play). Decisions never see the dealer's face-down card. The player only acts
+        once naturals are settled, so whenever the player stands, the face-down card is weighted over the cards that do
+        not give the dealer a natural; the much smaller effect of that condition on the player's own draws is ignored.
+
+        Parameters
+        ----------
+        player_classes : sequence of int
+            The value class of each of the player's cards (see 'value_class'); the hand must not be bust.
+        upcard_class : int
+            The value class of the dealer's face-up card.
+        composition : tuple of int
+            The cards unseen by the player, as in 'round_ev'.
+
+        Returns
+        -------
+        tuple of float
+            The EV per unit bet of standing, then of hitting.
+        """
+        composition = tuple(composition)
+        composition_key = composition_hash(composition)
+        player_hard = sum(class_idx + 1 for class_idx in player_classes)
+        player_ace = 0 in player_classes
+        player_value = _best_value(player_hard, player_ace)[0]
+        assert player_value is not None, "The player's hand must not be bust!"
+        return (
+            self._peek_stand_ev(player_value, upcard_class, composition, composition_key),
+            self._optimal_hit_ev(player_hard, player_ace, upcard_class, composition, composition_key),
+        )
+
+    def _peek_stand_ev(self, player_value, upcard_class, composition, composition_key):
+        """Returns the player's EV per unit bet on standing, over face-down cards not giving the dealer a natural."""
+        memo_key = (player_value, upcard_class, composition_key)
+        if memo_key in self._stand_memo:
+            return self._stand_memo[memo_key]
+
+        stand_ev = hole_total = 0.0
+        for hole_class, hole_count in enumerate(composition):
+            dealer_hard = upcard_class + hole_class + 2
+            dealer_ace = upcard_class == 0 or hole_class == 0
+            if hole_count == 0 or _best_value(dealer_hard, dealer_ace)[0] == 21:
+                continue
+            stand_ev += hole_count * self._stand_ev(
+                player_value,
+                self._dealer_outcomes(
+                    dealer_hard, dealer_ace, 2, *_remove_card(composition, composition_key, hole_class)
+                ),
+            )
+            hole_total += hole_count
+
+        self._stand_memo[memo_key] = stand_ev = stand_ev / hole_total
+        return stand_ev
+
+    def _optimal_hit_ev(self, hard_total, has_ace, upcard_class, composition, composition_key):
+        """Returns the player's EV per unit bet on hitting, then playing optimally, once naturals are settled."""
+        memo_key = (hard_total, has_ace, upcard_class, composition_key)
+        if memo_key in self._optimal_memo:
+            return self._optimal_memo[memo_key]
+
+        hit_ev = 0.0
+        card_total = sum(composition)
+        for class_idx, class_count in enumerate(composition):
+            if class_count == 0:
+                continue
+            next_hard = hard_total + class_idx + 1
+            next_ace = has_ace or class_idx == 0
+            next_value = _best_value(next_hard, next_ace)[0]
+            if next_value is None:
+                hit_ev -= class_count / card_total
+                continue
+            remaining, remaining_key = _remove_card(composition, composition_key, class_idx)
+            card_ev = self._peek_stand_ev(next_value, upcard_class, remaining, remaining_key)
+            if next_value < 21:
+                card_ev = max(
+                    card_ev, self._optimal_hit_ev(next_hard, next_ace, upcard_class, remaining, remaining_key)
+                )
+            hit_ev += (class_count / card_total) * card_ev
+
+        self._optimal_memo[memo_key] = hit_ev
+        return hit_ev
+
+    def _dealer_outcomes(self, hard_total, has_ace, card_count, composition, composition_key):
+        """Returns a tuple of each dealer outcome's probability, indexed by final value, '_bust_idx', '_natural_idx'."""
+        memo_key = (hard_total, has_ace, card_count, composition_key)
+        if memo_key in self._dealer_memo:
+            return self._dealer_memo[memo_key]
+
+        best_value, is_soft = _best_value(hard_total, has_ace)
+        dealer_target = self._rules.get_dealer_target()
+        outcomes = [0.0] * (_natural_idx + 1)
+        if best_value is None:
+            outcomes[_bust_idx] = 1.0
+        elif best_value == 21 and card_count == 2:
+            outcomes[_natural_idx] = 1.0
+        elif best_value == 21 or best_value > dealer_target or (
+            best_value == dealer_target and not (self._rules.dealer_hits_soft_17() and is_soft)
+        ):
+            outcomes[best_value] = 1.0  # The dealer stands, as in 'DealerHand._must_hit
+        else:
+            card_total = sum(composition)
+            for class_idx, class_count in enumerate(composition):
+                if class_count == 0:
+                    continue
+                next_outcomes = self._dealer_outcomes(
+                    hard_total + class_idx + 1,
+                    has_ace or class_idx == 0,
+                    card_count + 1,
+                    *_remove_card(composition, composition_key, class_idx),
+                )
+                weight = class_count / card_total
+                for outcome_idx, probability in enumerate(next_outcomes):
+                    outcomes[outcome_idx] += weight * probability
+
+        self._dealer_memo[memo_key] = outcomes = tuple(outcomes)
+        return outcomes
+
+    def _player_outcomes(self, hard_total, has_ace, card_count, dealer_upcard, composition, composition_key):
+        """Returns a tuple of the probability of each player outcome, indexed as in '_dealer_outcomes'."""
+        memo_key = (hard_total, has_ace, card_count, dealer_upcard, composition_key)
+        if memo_key in self._player_memo:
+            return self._player_memo[memo_key]
+
+        outcomes = [0.0] * (_natural_idx + 1)
+        best_value, is_soft = _best_value(hard_total, has_ace)
+        if best_value is None:
+            outcomes[_bust_idx] = 1.0
+        elif best_value == 21 and card_count == 2:
+            outcomes[_natural_idx] = 1.0
+        elif card_count >= 2 and (
+            best_value == 21 or not self._strategy.should_hit(best_value, is_soft, dealer_upcard)
+        ):
+            outcomes[best_value] = 1.0
+        else:
+            card_total = sum(composition)
+            for class_idx, class_count in enumerate(composition):
+                if class_count == 0:
+                    continue
+                next_outcomes = self._player_outcomes(
+                    hard_total + class_idx + 1,
+                    has_ace or class_idx == 0,
+                    card_count + 1,
+                    dealer_upcard,
+                    *_remove_card(composition, composition_key, class_idx),
+                )
+                weight = class_count / card_total
+                for outcome_idx, probability in enumerate(next_outcomes):
+                    outcomes[outcome_idx] += weight * probability
+
+        self._player_memo[memo_key] = outcomes = tuple(outcomes)
+        return outcomes
+
+    def _player_ev(
+        self, hard_total, has_ace, card_count, dealer_hard, dealer_ace, upcard_class, composition, composition_key
+    ):
+        """Returns the player's EV per unit bet once naturals are settled, from the given hands and composition."""
+        memo_key = (hard_total, has_ace, card_count, dealer_hard, dealer_ace, upcard_class, composition_key)
+        if memo_key in self._ev_memo:
+            return self._ev_memo[memo_key]
+
+        best_value, is_soft = _best_value(hard_total, has_ace)
+        dealer_upcard = 11 if upcard_class == 0 else upcard_class + 1
+        if best_value is None:
+            player_ev = -1.0
+        elif best_value == 21 or not self._strategy.should_hit(best_value, is_soft, dealer_upcard):
+            player_ev = self._stand_ev(
+                best_value, self._dealer_outcomes(dealer_hard, dealer_ace, 2, composition, composition_key)
+            )
+        else:
+            player_ev = 0.0
+            card_total = sum(composition)
+            for class_idx, class_count in enumerate(composition):
+                if class_count == 0:
+                    continue
+                player_ev += (class_count / card_total) * self._player_ev(
+                    hard_total + class_idx + 1,
+                    has_ace or class_idx == 0,
+                    card_count + 1,
+                    dealer_hard,
+                    dealer_ace,
+                    upcard_class,
+                    *_remove_card(composition, composition_key, class_idx),
+                )
+
+        self._ev_memo[memo_key] = player_ev
+        return player_ev
+
+    def _stand_ev(self, player_value, dealer_outcomes):
+        """Returns the player's EV per unit bet on standing with 'player_value' against the dealer's outcomes."""
+        win_net = float(self._rules.win_multiplier()) - 1
+        stand_ev = dealer_outcomes[_bust_idx] * win_net
+        for dealer_value in range(len(dealer_outcomes) - 2):
+            if dealer_value < player_value:
+                stand_ev += dealer_outcomes[dealer_value] * win_net
+            elif dealer_value > player_value:
+                stand_ev -= dealer_outcomes[dealer_value]
+        return stand_ev
+
+
+def _remove_card(composition, composition_key, class_idx):
+    """Returns a composition with one card of the given value class removed, and its updated Zobrist hash."""
+    class_count = composition[class_idx]
+    class_keys = composition_keys[class_idx]
+    return (
+        composition[:class_idx] + (class_count - 1,) + composition[class_idx + 1 :],
+        composition_key ^ class_keys[class_count] ^ class_keys[class_count - 1],
+    )
@@ -0,0 +1,203 @@
+"""
+This module exports the 'HotPathProfiler' class: low-overhead, sampled profiling of the game's hot functions, written
+as folded stacks for flame graphs.
+
+Profiling a whole process under cProfile slows every function call several times over and distorts the profile. A
+hot-path profiler instead wraps only the functions in 'hot_functions' (replacing them on their classes while it is
+installed). Every call is counted, but only every 'sample_interval'-th call of each function is timed (with
+'time.perf_counter') and has its Python call stack recorded; the other calls cost a counter update and a comparison.
+
+Each function's cumulative time (including the calls it makes) is estimated from its exact call count and the mean time
+of its sampled calls; the times measured include the wrappers of the hot calls it makes (a fraction of a microsecond
+each). The sampled stacks are written in the folded format read by flame graph tools (e.g. 'flamegraph.pl' or
+speedscope): one line per stack, its frames ('module.qualified_name') joined by semicolons, followed by an estimate of
+the time spent in the stack's last frame, in microseconds. A flame graph adds each stack's time to its callers, so a
+stack's own time excludes the estimated time of the sampled hot stacks nested inside it.
+
+Only calls made in the profiling process, on the thread that installed the profiler, should be profiled: calls made in
+worker processes (e.g. by 'blackjack.sweep.run_sweep') are not seen.
+
+Attributes
+----------
+hot_functions : tuple of tuple
+    The functions wrapped by default, as (class, method name) pairs.
+"""
+import sys
+import time
+from blackjack import Card, Deck, DealerHand, Hand
+
+hot_functions = (
+    (Deck, "deal_card"),
+    (Hand, "draw_card"),
+    (Hand, "hand_value"),
+    (Card, "is_ace"),
+    (Card, "card_value"),
+    (DealerHand, "resolve_hand"),
+)
+
+
+class HotPathProfiler:
+    """
+    A class counting and sampling calls to hot functions. Use as a context manager, or call 'install' and 'uninstall'.
+    """
+
+    def __init__(self, sample_interval=100, functions=None):
+        """
+        Initialises a profiler. Nothing is wrapped until the profiler is installed.
+
+        Parameters
+        ----------
+        sample_interval : int
+            Every call of a function is counted; one in this many is timed. Defaults to 100; 1 times every call.
+        functions : sequence of tuple
+            The functions to wrap, as (class, method name) pairs. Defaults to None: 'hot_functions'.
+        """
+        assert sample_interval >= 1, "'sample_interval' must be at least 1!"
+        self._sample_interval = sample_interval
+        self._functions = hot_functions if functions is None else tuple(functions)
+        self._originals = {}  # Maps each (class, method name) pair to its original function while installed
+        self._call_counters = {}  # Maps each function's name to [call count, calls until its next sample]
+        self._sampled_calls = {}  # Maps each function's name to its number of timed calls
+        self._sampled_time = {}  # Maps each function's name to the total time of its timed calls, in seconds
+        self._stack_samples = {}  # Maps each sampled stack (frames joined by ';') to its function and timed calls' time
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.uninstall()
+
+    def get_sample_interval(self):
+        """Returns the sampling interval: one in this many calls of each function is timed."""
+        return self._sample_interval
+
+    def is_installed(self):
+        """Returns True while the profiler's wrappers replace the hot functions."""
+        return bool(self._originals)
+
+    def install(self):
+        """Replaces each hot function on its class with a wrapper counting (and sampling) its calls."""
+        assert not self.is_installed(), "The profiler is already installed!"
+        for owner, method_name in self._functions:
+            function = owner.__dict__[method_name]
+            self._originals[owner, method_name] = function
+            setattr(owner, method_name, self._wrap(function, f"{owner.__name__}.{method_name}"))
+
+    def uninstall(self):
+        """Restores the original hot functions. The statistics collected are kept."""
+        for (owner, method_name), function in self._originals.items():
+            setattr(owner, method_name, function)
+        self._originals = {}
+
+    def function_statistics(self):
+        """
+        Returns the statistics of each hot function, most time-consuming first.
+
+        Returns
+        -------
+        list of tuple
+            For each function: its name (e.g. 'Deck.deal_card'), its call count, its number of timed calls and its
+            estimated cumulative time in seconds (None if none of its calls were timed).
+        """
+        function_statistics = []
+        for function_name, (call_count, _) in self._call_counters.items():
+            sampled_calls = self._sampled_calls[function_name]
+            cumulative_time = None
+            if sampled_calls:
+                cumulative_time = self._sampled_time[function_name] / sampled_calls * call_count
+            function_statistics.append((function_name, call_count, sampled_calls, cumulative_time))
+        return sorted(function_statistics, key=lambda statistics: -(statistics[3] or 0.0))
+
+    def summary(self):
+        """Returns a table of 'function_statistics' as a multi-line string."""
+        lines = [f"{'function':<24}{'calls':>12}{'sampled':>10}{'cumulative (s)':>16}"]
+        for function_name, call_count, sampled_calls, cumulative_time in self.function_statistics():
+            time_text = "-" if cumulative_time is None else f"{cumulative_time:.6f}"
+            lines.append(f"{function_name:<24}{call_count:>12}{sampled_calls:>10}{time_text:>16}")
+        return "\n".join(lines)
+
+    def folded_stacks(self):
+        """
+        Returns the sampled stacks in folded format, sorted: each line is a stack, its frames joined by ';', then the
+        estimated time of its last frame in microseconds, excluding the sampled hot stacks nested inside it. Stacks
+        with no time of their own are left out.
+        """
+        stack_times = {}  # Each stack's estimated total time: its timed calls' time, scaled up to all of its calls
+        for stack, (function_name, sampled_time) in self._stack_samples.items():
+            call_count = self._call_counters[function_name][0]
+            stack_times[stack] = sampled_time * call_count / self._sampled_calls[function_name]
+
+        own_times = dict(stack_times)
+        for stack, stack_time in stack_times.items():
+            frames = stack.split(";")
+            for caller_length in range(len(frames) - 1, 0, -1):
+                caller_stack = ";".join(frames[:caller_length])
+                if caller_stack in own_times:  # The nearest sampled hot stack this one is nested in
+                    own_times[caller_stack] -= stack_time
+                    break
+        return [
+            f"{stack} {round(own_time * 1e6)}"
+            for stack, own_time in sorted(own_times.items())
+            if round(own_time * 1e6) > 0
+        ]
+
+    def write_folded(self, file_path):
+        """
+        Writes the sampled stacks to a file in folded format (see 'folded_stacks'), e.g. for 'flamegraph.pl'.
+
+        Parameters
+        ----------
+        file_path : str or os.PathLike
+            The file written.
+        """
+        with open(file_path, "w") as folded_file:
+            for line in self.folded_stacks():
+                folded_file.write(f"{line}\n")
+
+    def _wrap(self, function, function_name):
+        """Returns the wrapper replacing a hot function: it counts every call and times every sampled call."""
+        call_counter = self._call_counters.setdefault(function_name, [0, self._sample_interval])
+        self._sampled_calls.setdefault(function_name, 0)
+        self._sampled_time.setdefault(function_name, 0.0)
+        sample_interval = self._sample_interval
+
+        def hot_function(*args, **kwargs):
+            call_counter[0] += 1
+            call_counter[1] -= 1
+            if call_counter[1]:
+                return function(*args, **kwargs)
+            call_counter[1] = sample_interval
+            return self._sampled_call(function, function_name, args, kwargs)
+
+        hot_function.__name__ = function.__name__
+        hot_function.__qualname__ = function.__qualname__
+        hot_function.__doc__ = function.__doc__
+        hot_function.__wrapped__ = function
+        return hot_function
+
+    def _sampled_call(self, function, function_name, args, kwargs):
+        """Times a sampled call and adds its time to the function's statistics and to its call stack."""
+        frames = [_frame_name(function.__module__, function.__code__)]
+        caller_frame = sys._getframe(2)  # The hot function's caller (skipping this method and the wrapper)
+        while caller_frame is not None:
+            module_name = caller_frame.f_globals.get("__name__", "?")
+            if module_name != __name__:  # Leaves out the wrappers of enclosing hot calls
+                frames.append(_frame_name(module_name, caller_frame.f_code))
+            caller_frame = caller_frame.f_back
+        stack = ";".join(reversed(frames))
+
+        start_time = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start_time
+            self._sampled_calls[function_name] += 1
+            self._sampled_time[function_name] += elapsed
+            stack_time = self._stack_samples.get(stack, (function_name, 0.0))[1]
+            self._stack_samples[stack] = function_name, stack_time + elapsed
+
+
+def _frame_name(module_name, code):
+    """Returns a stack frame's name in folded stacks: its module and its code's qualified name (Python 3.11+)."""
+    return f"{module_name}.{getattr(code, 'co_qualname', code.co_name)}"
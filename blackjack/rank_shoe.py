@@ -0,0 +1,95 @@
+"""
+This module exports the 'RankShoe' class: a lightweight shoe for simulations that only need card values.
+
+A standard 'Deck' holds a card object (with its suit, rank, short rank and deck number) for every card in the shoe. A
+rank shoe holds only the number of cards left in each of the ten value classes (aces, two to nine, ten-value cards) in
+a 20-byte array, and draws each card in proportion to those counts as it is dealt: exactly the distribution of dealing
+the top card of a shuffled shoe with that composition. A card object is created for each card dealt, so it can be used
+anywhere a 'Deck' is dealt from ('Hand.draw_card' only needs 'deal_card'; game loops also use len() and new_deck()),
+and thousands of rank shoes can be kept in memory at once.
+
+Suits are not tracked: the suit of each card dealt, and the rank of each ten-value card, are nominal. Use a 'Deck' for
+anything that depends on suits (e.g. 'blackjack.side_bets').
+"""
+import random
+from array import array
+from blackjack.deck import Deck, composition_hash, rank_value_classes, validate_deck_count, value_class_count
+
+_class_rank_indexes = tuple(
+    rank_value_classes.index(class_idx) for class_idx in range(value_class_count)
+)  # Index in 'rank_names' of the first rank of each value class: ace, two to nine, then ten
+
+
+class RankShoe:
+    """
+    A class defining a shoe that holds card counts per value class rather than card objects.
+    """
+
+    def __init__(self, input_deck_count, rng=None):
+        """
+        Initialises a full rank shoe.
+
+        Parameters
+        ----------
+        input_deck_count : int
+            The number of 52-card sets in the shoe.
+        rng : random.Random
+            The random generator used to draw cards. Defaults to None: Python's shared 'random' generator.
+        """
+        validate_deck_count(input_deck_count)
+        self._deck_count = input_deck_count
+        self._rng = random if rng is None else rng
+        self._class_counts = array("H", bytes(2 * value_class_count))  # Cards left per value class (see 'composition')
+        self._card_count = 0  # Total of '_class_counts': the number of cards left in the shoe
+        self.new_deck()
+
+    def __len__(self):
+        """Allows len() to be used on rank shoes, returning the number of cards left in the shoe."""
+        return self._card_count
+
+    def __repr__(self):
+        return f"RankShoe({self._deck_count})"
+
+    def new_deck(self):
+        """Refills the shoe: four cards per deck in each value class from ace to nine, sixteen ten-value cards."""
+        for class_idx in range(value_class_count):
+            self._class_counts[class_idx] = rank_value_classes.count(class_idx) * 4 * self._deck_count
+        self._card_count = 52 * self._deck_count
+
+    def shuffle_deck(self):
+        """Does nothing: a rank shoe has no order, each card is drawn at random as it is dealt."""
+
+    def return_cards(self, cards):
+        """Does nothing: as with a standard shoe, discards stay out of play until new_deck() is called."""
+
+    def deal_card(self):
+        """
+        Draws a card at random in proportion to the counts left in the shoe, removes it from the counts and returns it.
+        Called by hand objects.
+
+        Returns
+        -------
+        blackjack.card.Card
+            A new face-up card of the value class drawn.
+        """
+        assert self._card_count > 0, "Cannot deal a card: the shoe is empty."
+        card_offset = self._rng.randrange(self._card_count)  # The card's position among those left, in class order
+        class_idx = 0
+        while card_offset >= self._class_counts[class_idx]:
+            card_offset -= self._class_counts[class_idx]
+            class_idx += 1
+        self._class_counts[class_idx] -= 1
+        self._card_count -= 1
+
+        rank_idx = _class_rank_indexes[class_idx]
+        if class_idx == value_class_count - 1:
+            rank_idx += (card_offset // 4) % 4  # Spreads ten-value cards across ten, jack, queen and king
+        return Deck.decode_card(rank_idx, card_offset % 4)
+
+    def composition(self):
+        """Returns the number of cards left in each value class, as 'Deck.composition'."""
+        return tuple(self._class_counts)
+
+    def composition_hash(self):
+        """Returns the Zobrist hash of the shoe's composition, as 'Deck.composition_hash'."""
+        return composition_hash(self._class_counts)
@@ -0,0 +1,161 @@
+"""
+This module exports the 'TableRenderer' class: incremental terminal rendering of a round of blackjack.
+
+The interactive game prints each hand in full after every action. A renderer instead draws a fixed table layout once
+per round, one row each for the dealer's hand, the player's hand, a message, the player's balance and the action
+prompt, then keeps the text of every cell on screen. Each update compares the new cells with those on screen and
+rewrites only the row's tail from the first changed cell, using ANSI cursor control: a card drawn to a hand writes just
+the new card and the hand's value, and an unchanged row writes nothing at all.
+
+Cursor movements are relative to the line below the table, where the cursor rests between updates, so nothing else may
+be printed while a table is open; close the table (see 'close') before printing anything else.
+
+Attributes
+----------
+table_rows : tuple of str
+    The names of the table's rows, top to bottom.
+"""
+import sys
+
+table_rows = ("dealer", "player", "message", "balance", "prompt")
+_cursor_up = "\x1b[{}A"
+_cursor_down = "\x1b[{}B"
+_cursor_column = "\x1b[{}G"  # Moves to a column, counted from 1
+_clear_to_end = "\x1b[K"
+
+
+class TableRenderer:
+    """
+    A class rendering a round's table to a terminal, rewriting only the cells that have changed.
+    """
+
+    def __init__(self, stream=None, input_function=None):
+        """
+        Initialises a renderer. No output is written until a table is opened.
+
+        Parameters
+        ----------
+        stream : io.TextIOBase
+            The terminal stream written to. Defaults to None: 'sys.stdout'.
+        input_function : function
+            Reads the player's response to a prompt, as the built-in 'input' (which it defaults to).
+        """
+        self._stream = sys.stdout if stream is None else stream
+        self._input = input if input_function is None else input_function
+        self._screen = None  # The cells on screen in each row while a table is open; otherwise None
+        self._characters_written = 0  # Characters written to the stream, including control sequences
+
+    def is_open(self):
+        """Returns True while a table is open (drawn and being updated)."""
+        return self._screen is not None
+
+    def get_characters_written(self):
+        """Returns the number of characters written to the stream, including control sequences."""
+        return self._characters_written
+
+    def open(self):
+        """Draws an empty table below the cursor, leaving the cursor on the line below it."""
+        assert not self.is_open(), "A table is already open!"
+        self._write("\n" * len(table_rows))
+        self._screen = [[] for _ in table_rows]
+
+    def close(self):
+        """Stops updating the table, leaving it on screen; the cursor is on the line below it, ready for printing."""
+        self._screen = None
+        self._stream.flush()
+
+    def show_hands(self, dealer_hand, player_hand):
+        """
+        Updates the rows of both hands: each card as shown to the player (see 'Card.short_card_details'), then the
+        hand's value(s).
+
+        Parameters
+        ----------
+        dealer_hand : blackjack.hand.DealerHand
+            The dealer's hand.
+        player_hand : blackjack.hand.PlayerHand
+            The player's hand.
+        """
+        self._update_row("dealer", _hand_cells(dealer_hand))
+        self._update_row("player", _hand_cells(player_hand))
+
+    def show_message(self, text):
+        """Updates the message row, e.g. with the player's score or the outcome of the dealer's draw."""
+        self._update_row("message", [text])
+
+    def show_balance(self, player_obj, bet=None):
+        """
+        Updates the balance row.
+
+        Parameters
+        ----------
+        player_obj : blackjack.player.Player
+            The player whose balance is shown.
+        bet : int
+            The amount bet this round, in minor currency units, shown alongside the balance. Defaults to None: no bet
+            is shown.
+        """
+        balance_cells = [f"Balance: {player_obj.format_amount(player_obj.get_balance())}"]
+        if bet is not None:
+            balance_cells.append(f"   Bet: {player_obj.format_amount(bet)}")
+        self._update_row("balance", balance_cells)
+
+    def prompt(self, text):
+        """
+        Shows a prompt in the prompt row and returns the player's response. Typing the response and pressing enter
+        leaves the cursor on the line below the table, as after any other update.
+
+        Parameters
+        ----------
+        text : str
+            The prompt, e.g. 'Hit [h] or Stand [s]: '.
+
+        Returns
+        -------
+        str
+            The player's response.
+        """
+        rows_up = len(table_rows) - table_rows.index("prompt")
+        self._write(_cursor_up.format(rows_up) + "\r" + _clear_to_end)
+        self._screen[table_rows.index("prompt")] = []  # The response is typed into the row: it always changes
+        self._stream.flush()
+        return self._input(text)
+
+    def _update_row(self, row_name, cells):
+        """Rewrites a row from its first changed cell to its end; writes nothing if no cell has changed."""
+        assert self.is_open(), "Open a table before updating it!"
+        row_idx = table_rows.index(row_name)
+        on_screen = self._screen[row_idx]
+        changed_idx = 0
+        while changed_idx < min(len(cells), len(on_screen)) and cells[changed_idx] == on_screen[changed_idx]:
+            changed_idx += 1
+        if changed_idx == len(cells) == len(on_screen):
+            return
+
+        column = sum(len(cell) for cell in cells[:changed_idx]) + 1
+        rows_up = len(table_rows) - row_idx
+        self._write(
+            _cursor_up.format(rows_up)
+            + _cursor_column.format(column)
+            + "".join(cells[changed_idx:])
+            + _clear_to_end
+            + _cursor_down.format(rows_up)
+            + "\r"
+        )
+        self._screen[row_idx] = list(cells)
+        self._stream.flush()
+
+    def _write(self, text):
+        """Writes text to the stream, counting the characters written."""
+        self._stream.write(text)
+        self._characters_written += len(text)
+
+
+def _hand_cells(hand):
+    """Returns the cells of a hand's row: its holder's name, each card, then its value(s) as shown to the player."""
+    hand_values = ", ".join(str(hand_value) for hand_value in hand.hand_value())
+    return (
+        [f"{hand.get_holder_name():<12}"]
+        + [f"{card.short_card_details():<6}" for card in hand]
+        + [f"  Value: {hand_values}"]
+    )
@@ -0,0 +1,154 @@
+"""
+This module exports the 'Rules' class, which collects the table rules of a game of blackjack, the default rules and
+the 'payout_amount' function.
+
+Attributes
+----------
+default_rules : blackjack.rules.Rules
+    The rules used when none are specified: six decks, reshuffled below 60 cards; the dealer stands on all 17s;
+    naturals pay 3:2 and other wins pay even money.
+"""
+import math
+from fractions import Fraction
+
+
+class Rules:
+    """
+    A class defining the table rules that vary between blackjack games: shoe size, reshuffle point, the dealer's drawing
+    rule and payouts.
+
+    Rules objects are treated as immutable values: two rules objects with the same settings compare equal and produce
+    the same 'as_dict' output (used to key cached results).
+    """
+
+    def __init__(
+        self,
+        deck_count=6,
+        deck_length_limit=60,
+        dealer_target=17,
+        dealer_hits_soft_17=False,
+        natural_payout=(3, 2),
+        win_payout=(1, 1),
+    ):
+        """
+        Initialises a set of table rules.
+
+        Parameters
+        ----------
+        deck_count : int
+            The number of 52-card decks shuffled into the shoe. Casinos normally use 6 decks at a time.
+        deck_length_limit : int
+            When the number of cards in the shoe falls below this limit, a new shoe is shuffled (sets the penetration).
+        dealer_target : int
+            The dealer draws cards until their hand value reaches at least this target.
+        dealer_hits_soft_17 : bool
+            If True, the dealer also draws on a soft hand equal to 'dealer_target' (the 'H17' rule); if False, the
+            dealer stands on it ('S17').
+        natural_payout : tuple of int
+            The odds paid on a player's natural as (winnings, stake), e.g. (3, 2) for 3:2 or (6, 5) for 6:5.
+        win_payout : tuple of int
+            The odds paid on any other winning hand as (winnings, stake). Defaults to even money: (1, 1).
+        """
+        self._deck_count = deck_count
+        self._deck_length_limit = deck_length_limit
+        self._dealer_target = dealer_target
+        self._dealer_hits_soft_17 = dealer_hits_soft_17
+        self._natural_payout = tuple(natural_payout)
+        self._win_payout = tuple(win_payout)
+
+    def __repr__(self):
+        """Returns the rules' settings as a constructor call, e.g. 'Rules(deck_count=6, ...)'."""
+        settings = ", ".join(f"{name}={value!r}" for name, value in self.as_dict().items())
+        return f"Rules({settings})"
+
+    def __eq__(self, other):
+        """Rules objects are equal when all of their settings are equal."""
+        return isinstance(other, Rules) and self.as_dict() == other.as_dict()
+
+    def __hash__(self):
+        """Hashes the rules' settings, so that equal rules objects can key dicts and sets (e.g. sweep results)."""
+        return hash(
+            (
+                self._deck_count,
+                self._deck_length_limit,
+                self._dealer_target,
+                self._dealer_hits_soft_17,
+                self._natural_payout,
+                self._win_payout,
+            )
+        )
+
+    def as_dict(self):
+        """Returns the rules' settings as a dict of constructor arguments (JSON-serialisable, in a fixed order)."""
+        return {
+            "deck_count": self._deck_count,
+            "deck_length_limit": self._deck_length_limit,
+            "dealer_target": self._dealer_target,
+            "dealer_hits_soft_17": self._dealer_hits_soft_17,
+            "natural_payout": list(self._natural_payout),
+            "win_payout": list(self._win_payout),
+        }
+
+    def get_deck_count(self):
+        """Returns the number of 52-card decks shuffled into the shoe."""
+        return self._deck_count
+
+    def get_deck_length_limit(self):
+        """Returns the number of cards below which a new shoe is shuffled."""
+        return self._deck_length_limit
+
+    def get_dealer_target(self):
+        """Returns the hand value the dealer draws to."""
+        return self._dealer_target
+
+    def dealer_hits_soft_17(self):
+        """Returns True if the dealer draws on a soft hand equal to their target (H17); False if they stand (S17)."""
+        return self._dealer_hits_soft_17
+
+    def get_natural_payout(self):
+        """Returns the odds paid on a player's natural as a (winnings, stake) tuple."""
+        return self._natural_payout
+
+    def get_win_payout(self):
+        """Returns the odds paid on any other winning hand as a (winnings, stake) tuple."""
+        return self._win_payout
+
+    def natural_multiplier(self):
+        """Returns the exact multiple of the bet paid back to a player winning with a natural (e.g. 5/2 for 3:2)."""
+        winnings, stake = self._natural_payout
+        return Fraction(stake + winnings, stake)
+
+    def win_multiplier(self):
+        """Returns the exact multiple of the bet paid back to a player winning without a natural (e.g. 2 at evens)."""
+        winnings, stake = self._win_payout
+        return Fraction(stake + winnings, stake)
+
+    @staticmethod
+    def push_multiplier():
+        """Returns the multiple of the bet paid back to a player in a draw (stand-off): the bet is returned."""
+        return 1
+
+
+default_rules = Rules()
+
+
+def payout_amount(bet_amount, payout_multiplier):
+    """
+    Returns the amount paid back to a player as a whole number of minor currency units (e.g. pence).
+
+    The payout is calculated exactly: a £10.00 bet (1000) on a 3:2 natural pays back 2500. Where the exact payout
+    includes a fraction of a minor unit (e.g. an odd-pence bet at 3:2), the fraction is rounded down, as casinos do.
+
+    Parameters
+    ----------
+    bet_amount : int
+        The amount bet, in minor currency units.
+    payout_multiplier : int or fractions.Fraction
+        The multiple of the bet paid back, e.g. from 'Rules.natural_multiplier'.
+
+    Returns
+    -------
+    int
+        The payout in minor currency units.
+    """
+    return math.floor(bet_amount * payout_multiplier)
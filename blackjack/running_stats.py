@@ -0,0 +1,254 @@
+"""
+This module exports the 'RoundStatistics' class: an online accumulator for the results of simulated rounds.
+
+Results are folded in one round at a time and never stored, so memory use stays constant however long a simulation
+runs. The mean and variance of the player's net result are updated with Welford's algorithm, which remains numerically
+stable over very long runs. Net results are whole minor currency units, so the total net result is also kept exactly, as
+an integer, and always reconciles with the sum of the results folded in.
+"""
+import math
+
+
+class RoundStatistics:
+    """
+    A class accumulating running statistics over the net results and outcomes of simulated rounds.
+
+    Tracks: the number of rounds; the mean and variance of the net result per round (the player's expected value, or
+    EV, and its spread); a histogram of net results; and a count of each round outcome. Accumulators from separate runs
+    (e.g. different processes) can be combined with 'merge'.
+    """
+
+    def __init__(self):
+        """Initialises an empty accumulator."""
+        self._count = 0  # The number of rounds accumulated
+        self._net_total = 0  # Exact sum of the net results, in minor currency units
+        self._mean = 0.0  # Running mean of the net result per round
+        self._m2 = 0.0  # Running sum of squared differences from the mean (Welford's M2)
+        self._histogram = {}  # Maps each distinct net result to the number of rounds that produced it
+        self._outcome_counts = {}  # Maps each round outcome to the number of rounds ending with it
+
+    def __len__(self):
+        """Allows len() to be used on accumulators, returning the number of rounds accumulated."""
+        return self._count
+
+    def update(self, net_result, outcome):
+        """
+        Folds the result of a single round into the running statistics.
+
+        Parameters
+        ----------
+        net_result : int
+            The player's net winnings from the round in minor currency units (negative for a loss).
+        outcome : str
+            The round's outcome, one of 'blackjack.simulation.outcome_names'.
+        """
+        self._count += 1
+        self._net_total += net_result
+        delta = net_result - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (net_result - self._mean)
+        self._histogram[net_result] = self._histogram.get(net_result, 0) + 1
+        self._outcome_counts[outcome] = self._outcome_counts.get(outcome, 0) + 1
+
+    def update_batch(self, net_results, outcomes):
+        """
+        Folds the results of a batch of rounds into the running statistics, using integer NumPy arithmetic.
+
+        Gives the same count, net total, histogram and outcome counts as calling 'update' once per round; the batch's
+        mean and M2 are computed exactly from integer sums and then combined as in 'merge'. The sums are taken over
+        the batch's distinct net results (counted by NumPy) as Python integers, so they cannot overflow however large
+        the bets or the batch.
+
+        Parameters
+        ----------
+        net_results : array_like of int
+            The player's net winnings from each round, in minor currency units.
+        outcomes : array_like of str, or dict
+            Each round's outcome, in the same order as 'net_results'; or the number of rounds in the batch ending with
+            each outcome (e.g. from 'numpy.bincount' over outcome codes), which avoids building a string per round.
+        """
+        import numpy as np
+
+        net_results = np.asarray(net_results, dtype=np.int64)
+        batch_count = len(net_results)
+        if batch_count == 0:
+            return
+        distinct_results, result_counts = np.unique(net_results, return_counts=True)
+        histogram = dict(zip(distinct_results.tolist(), result_counts.tolist()))
+        batch_total = sum(net_result * count for net_result, count in histogram.items())
+        batch_squared_total = sum(net_result * net_result * count for net_result, count in histogram.items())
+
+        if isinstance(outcomes, dict):
+            outcome_counts = {outcome: int(count) for outcome, count in outcomes.items() if count}
+        else:
+            distinct_outcomes, outcome_totals = np.unique(np.asarray(outcomes), return_counts=True)
+            outcome_counts = dict(zip(distinct_outcomes.tolist(), outcome_totals.tolist()))
+        assert sum(outcome_counts.values()) == batch_count, "Every round in the batch must have exactly one outcome!"
+
+        batch = RoundStatistics()
+        batch._count = batch_count
+        batch._net_total = batch_total
+        batch._mean = batch_total / batch_count
+        batch._m2 = (batch_squared_total * batch_count - batch_total * batch_total) / batch_count
+        batch._histogram = histogram
+        batch._outcome_counts = outcome_counts
+        self.merge(batch)
+
+    def merge(self, other):
+        """
+        Combines the rounds accumulated by another 'RoundStatistics' object into this one.
+
+        Parameters
+        ----------
+        other : blackjack.running_stats.RoundStatistics
+            The accumulator to combine; it is left unchanged.
+        """
+        if other._count == 0:
+            return
+        combined_count = self._count + other._count
+        delta = other._mean - self._mean
+        self._m2 += other._m2 + delta * delta * self._count * other._count / combined_count
+        self._mean += delta * other._count / combined_count
+        self._count = combined_count
+        self._net_total += other._net_total
+        for net_result, count in other._histogram.items():
+            self._histogram[net_result] = self._histogram.get(net_result, 0) + count
+        for outcome, count in other._outcome_counts.items():
+            self._outcome_counts[outcome] = self._outcome_counts.get(outcome, 0) + count
+
+    def to_dict(self):
+        """
+        Returns the accumulator's complete state as a JSON-serialisable dict (see 'from_dict').
+
+        Returns
+        -------
+        dict
+            The round count, exact net total, Welford mean and M2, histogram (as a list of [net result, count] pairs) and
+            outcome counts.
+        """
+        return {
+            "count": self._count,
+            "net_total": self._net_total,
+            "mean": self._mean,
+            "m2": self._m2,
+            "histogram": [[net_result, count] for net_result, count in self._histogram.items()],
+            "outcome_counts": dict(self._outcome_counts),
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        """
+        Recreates an accumulator from the dict returned by 'to_dict'; continuing to update it gives exactly the same
+        results as the original would have.
+
+        Parameters
+        ----------
+        state : dict
+            A state returned by 'to_dict'.
+
+        Returns
+        -------
+        blackjack.running_stats.RoundStatistics
+            The restored accumulator.
+        """
+        round_statistics = cls()
+        round_statistics._count = state["count"]
+        round_statistics._net_total = state["net_total"]
+        round_statistics._mean = state["mean"]
+        round_statistics._m2 = state["m2"]
+        round_statistics._histogram = {net_result: count for net_result, count in state["histogram"]}
+        round_statistics._outcome_counts = dict(state["outcome_counts"])
+        return round_statistics
+
+    def get_net_total(self):
+        """Returns the exact sum of the accumulated net results, as an integer number of minor currency units."""
+        return self._net_total
+
+    def mean(self):
+        """Returns the mean net result per round (the player's estimated EV), or 0.0 if no rounds are accumulated."""
+        return self._mean
+
+    def variance(self):
+        """Returns the sample variance of the net result per round, or 0.0 if fewer than two rounds are accumulated."""
+        if self._count < 2:
+            return 0.0
+        return self._m2 / (self._count - 1)
+
+    def standard_error(self):
+        """Returns the standard error of the mean net result per round."""
+        if self._count < 2:
+            return math.inf
+        return math.sqrt(self.variance() / self._count)
+
+    def confidence_interval(self, z_score=1.96):
+        """
+        Returns a normal-approximation confidence interval for the player's EV per round.
+
+        Parameters
+        ----------
+        z_score : float
+            The number of standard errors either side of the mean. Defaults to 1.96 (a 95% interval).
+
+        Returns
+        -------
+        tuple of float
+            The lower and upper bounds of the interval.
+        """
+        half_width = z_score * self.standard_error()
+        return self._mean - half_width, self._mean + half_width
+
+    def is_precise(self, target_half_width, z_score=1.96):
+        """
+        Returns True once the confidence interval for the player's EV is narrower than the target on either side.
+
+        Parameters
+        ----------
+        target_half_width : float
+            The largest acceptable distance between the mean and either bound of the interval.
+        z_score : float
+            The number of standard errors either side of the mean. Defaults to 1.96 (a 95% interval).
+        """
+        return z_score * self.standard_error() < target_half_width
+
+    def outcome_rate(self, outcome):
+        """
+        Returns the fraction of accumulated rounds that ended with the given outcome.
+
+        Parameters
+        ----------
+        outcome : str
+            One of 'blackjack.simulation.outcome_names', e.g. 'natural', 'bust' or 'push'.
+        """
+        if self._count == 0:
+            return 0.0
+        return self._outcome_counts.get(outcome, 0) / self._count
+
+    def get_outcome_counts(self):
+        """Returns a copy of the number of rounds ending with each outcome, keyed by outcome name."""
+        return dict(self._outcome_counts)
+
+    def get_histogram(self):
+        """Returns a copy of the histogram of net results: a dict mapping each net result to its number of rounds."""
+        return dict(sorted(self._histogram.items()))
+
+    def summary(self, z_score=1.96):
+        """
+        Returns the key statistics as a dict: rounds, EV, standard deviation, interval bounds and the rate of each
+        outcome seen.
+
+        Parameters
+        ----------
+        z_score : float
+            The number of standard errors either side of the mean used for the interval. Defaults to 1.96.
+        """
+        lower_bound, upper_bound = self.confidence_interval(z_score)
+        summary = {
+            "rounds": self._count,
+            "ev": self._mean,
+            "standard_deviation": math.sqrt(self.variance()),
+            "ev_lower": lower_bound,
+            "ev_upper": upper_bound,
+        }
+        for outcome in sorted(self._outcome_counts):
+            summary[f"{outcome}_rate"] = self.outcome_rate(outcome)
+        return summary
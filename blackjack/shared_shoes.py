@@ -0,0 +1,218 @@
+"""
+This module exports the 'SharedShoeArrays' class and the 'run_shared_simulation' function.
+
+Simulations fanned out across processes share their inputs and outputs through 'multiprocessing.shared_memory'. The
+parent process allocates and shuffles every shoe once; worker processes attach to the same memory, deal straight from
+their assigned shoes through NumPy views (see 'Deck.load_shoe') and add their results into their own row of a shared
+accumulator array. Neither card data nor per-round results are pickled across process boundaries: a worker receives
+only the small 'spec' tuple naming the shared blocks.
+
+Attributes
+----------
+result_fields : tuple of str
+    The columns of the shared result accumulator: rounds played, summed net result, summed squared net result and a
+    count for each round outcome in 'blackjack.simulation.outcome_names'. Net results are whole minor currency units, so
+    every column is an exact 64-bit integer total.
+"""
+
+import numpy as np
+from multiprocessing import shared_memory
+from blackjack.deck import Deck
+from blackjack.rules import default_rules
+from blackjack.shoe_library import shuffled_shoes
+from blackjack.simulation import outcome_names, play_shoe
+
+result_fields = ("rounds", "net_total", "net_squared_total") + outcome_names
+
+
+class SharedShoeArrays:
+    """
+    A class holding a block of shuffled shoes and a block of result accumulators in shared memory.
+
+    The parent process creates the blocks with 'create'; workers attach to them with 'attach', passing the picklable
+    'spec' of the parent's object. Every process must call 'close' when finished; the parent also calls 'unlink' to free
+    the memory (both are done on leaving a 'with' block).
+    """
+
+    def __init__(self, spec, owner):
+        """
+        Attaches to existing shared memory blocks. Use 'create' or 'attach' rather than calling this directly.
+
+        Parameters
+        ----------
+        spec : tuple
+            Names and shapes of the shared blocks: (shoes block name, results block name, shoe count, deck count,
+            worker count).
+        owner : bool
+            True for the process that created the blocks and is responsible for unlinking them.
+        """
+        shoes_name, results_name, shoe_count, deck_count, worker_count = spec
+        self._spec = spec
+        self._owner = owner
+        self._shoes_memory = shared_memory.SharedMemory(name=shoes_name)
+        self._results_memory = shared_memory.SharedMemory(name=results_name)
+        self.shoes = np.ndarray(
+            (shoe_count, 52 * deck_count, 2), dtype=np.uint8, buffer=self._shoes_memory.buf
+        )  # Rank/suit byte pairs of every shoe, as dealt by 'Deck.load_shoe'
+        self.results = np.ndarray(
+            (worker_count, len(result_fields)), dtype=np.int64, buffer=self._results_memory.buf
+        )  # One row of accumulators per worker, with columns named by 'result_fields'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    @classmethod
+    def create(cls, shoe_count, deck_count, worker_count, seed=None):
+        """
+        Allocates new shared memory blocks, fills the shoe block with shuffled shoes and zeroes the accumulators.
+
+        Parameters
+        ----------
+        shoe_count : int
+            The number of shoes to allocate.
+        deck_count : int
+            The number of 52-card sets shuffled into each shoe.
+        worker_count : int
+            The number of worker processes (rows of the result accumulator).
+        seed : int
+            Seeds the shuffle. Defaults to None (fresh entropy from the operating system).
+
+        Returns
+        -------
+        blackjack.shared_shoes.SharedShoeArrays
+            The owning handle to the new blocks.
+        """
+        shoes_bytes = shoe_count * 52 * deck_count * 2
+        results_bytes = worker_count * len(result_fields) * np.dtype(np.int64).itemsize
+        shoes_memory = shared_memory.SharedMemory(create=True, size=shoes_bytes)
+        results_memory = shared_memory.SharedMemory(create=True, size=results_bytes)
+        spec = (shoes_memory.name, results_memory.name, shoe_count, deck_count, worker_count)
+        shoes_memory.close()
+        results_memory.close()
+
+        shared_arrays = cls(spec, owner=True)
+        shared_arrays.shoes[:] = shuffled_shoes(np.random.default_rng(seed), shoe_count, deck_count)
+        shared_arrays.results[:] = 0
+        return shared_arrays
+
+    @classmethod
+    def attach(cls, spec):
+        """Attaches a worker process to the shared blocks described by 'spec' (see 'get_spec')."""
+        return cls(spec, owner=False)
+
+    def get_spec(self):
+        """Returns the small, picklable tuple that lets other processes attach to these shared blocks."""
+        return self._spec
+
+    def totals(self):
+        """Returns the accumulated results summed over all workers, as a dict keyed by 'result_fields'."""
+        return dict(zip(result_fields, self.results.sum(axis=0).tolist()))
+
+    def close(self):
+        """Releases this process' views onto the shared blocks."""
+        del self.shoes, self.results
+        self._shoes_memory.close()
+        self._results_memory.close()
+
+    def unlink(self):
+        """Frees the shared blocks; called once by the owning process after all workers have finished."""
+        self._shoes_memory.unlink()
+        self._results_memory.unlink()
+
+
+def run_shared_simulation(shoe_count, rules=None, worker_count=2, strategy=None, bet=100, seed=None):
+    """
+    Plays every shoe in a shared block of shoes across worker processes and returns the combined results.
+
+    Parameters
+    ----------
+    shoe_count : int
+        The number of shoes to play; shoes are split evenly into contiguous ranges, one per worker.
+    rules : blackjack.rules.Rules
+        The table rules, setting the number of decks per shoe and the number of cards left when play of a shoe stops.
+        Defaults to None: 'blackjack.rules.default_rules'.
+    worker_count : int
+        The number of worker processes.
+    strategy : blackjack.strategy.Strategy
+        Chooses the player's actions. Defaults to None: basic strategy is played.
+    bet : int
+        The amount bet each round, in minor currency units.
+    seed : int
+        Seeds the shuffle of the shoes.
+
+    Returns
+    -------
+    dict
+        Totals over all workers, keyed by 'result_fields'.
+    """
+    import multiprocessing
+
+    if rules is None:
+        rules = default_rules
+    with SharedShoeArrays.create(shoe_count, rules.get_deck_count(), worker_count, seed) as shared_arrays:
+        boundaries = np.linspace(0, shoe_count, worker_count + 1).astype(int)
+        workers = [
+            multiprocessing.Process(
+                target=simulate_shared_shoes,
+                args=(
+                    shared_arrays.get_spec(),
+                    worker_idx,
+                    boundaries[worker_idx],
+                    boundaries[worker_idx + 1],
+                    strategy,
+                    rules,
+                    bet,
+                ),
+            )
+            for worker_idx in range(worker_count)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert all(
+            worker.exitcode == 0 for worker in workers
+        ), "A simulation worker process failed."
+        return shared_arrays.totals()
+
+
+def simulate_shared_shoes(spec, worker_idx, first_shoe, stop_shoe, strategy=None, rules=None, bet=100):
+    """
+    Worker process entry point: plays shoes 'first_shoe' to 'stop_shoe - 1' of a shared block of shoes, adding results
+    into row 'worker_idx' of the shared accumulator.
+
+    Parameters
+    ----------
+    spec : tuple
+        Describes the shared blocks (see 'SharedShoeArrays.get_spec').
+    worker_idx : int
+        This worker's row of the result accumulator.
+    first_shoe : int
+        Index of the first shoe to play.
+    stop_shoe : int
+        Index one past the last shoe to play.
+    strategy : blackjack.strategy.Strategy
+        Chooses the player's actions. Defaults to None: basic strategy is played.
+    rules : blackjack.rules.Rules
+        The table rules. Each shoe is played until fewer cards remain than the rules' deck length limit.
+    bet : int
+        The amount bet each round, in minor currency units.
+    """
+    shared_arrays = SharedShoeArrays.attach(spec)
+    accumulator = shared_arrays.results[worker_idx]
+    live_deck = Deck(spec[3], shoe_buffer=b"")  # Empty until a shared shoe is loaded: no card objects are created
+    for shoe_idx in range(int(first_shoe), int(stop_shoe)):
+        live_deck.load_shoe(shared_arrays.shoes[shoe_idx])
+        for net_result, outcome in play_shoe(live_deck, strategy, rules, bet):
+            accumulator[0] += 1
+            accumulator[1] += net_result
+            accumulator[2] += net_result * net_result
+            accumulator[3 + outcome_names.index(outcome)] += 1
+    live_deck.release_shoe()  # Drops the deck's view of the shared shoes so that the block can be closed
+    del accumulator
+    shared_arrays.close()
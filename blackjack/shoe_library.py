@@ -0,0 +1,162 @@
+"""
+This module exports the 'ShoeLibrary' class and the 'write_shoe_library' and 'shuffled_shoes' functions.
+
+A shoe library is a single flat file holding many pre-shuffled shoes. Dealing every strategy or benchmark from the same
+library gives identical cards across runs and processes, and removes the cost of shuffling from timed code. The file
+starts with a fixed-size header followed by the shoes, back-to-back. Each shoe holds '52 * deck_count' cards and each
+card is stored as two bytes: an index into 'blackjack.deck.rank_names' followed by an index into
+'blackjack.deck.suit_names' (see 'Deck.load_shoe').
+
+Attributes
+----------
+library_magic : bytes
+    Identifies a file as a shoe library; written at the start of the header.
+header_format : str
+    The 'struct' format of the file header: magic bytes, number of 52-card sets per shoe and number of shoes.
+"""
+import mmap
+import struct
+from blackjack.deck import rank_names, suit_names
+
+library_magic = b"BJSHOE01"
+header_format = "<8sII"
+
+
+def write_shoe_library(file_path, shoe_count, deck_count, seed=None, batch_size=4096):
+    """
+    Generates 'shoe_count' independently shuffled shoes and writes them to a new shoe library file.
+
+    Shoes are shuffled in batches with NumPy (imported here so that reading a library only requires the standard
+    library). The same 'seed' always produces an identical file.
+
+    Parameters
+    ----------
+    file_path : str or os.PathLike
+        Location of the library file to be written; an existing file is overwritten.
+    shoe_count : int
+        The number of shoes to generate.
+    deck_count : int
+        The number of 52-card sets shuffled into each shoe.
+    seed : int
+        Seeds the random generator. Defaults to None (fresh entropy from the operating system).
+    batch_size : int
+        The number of shoes shuffled per NumPy call; bounds peak memory use while writing.
+    """
+    import numpy as np
+
+    assert (isinstance(shoe_count, int)) and (shoe_count > 0), "'shoe_count' must be a positive integer!"
+    assert (isinstance(deck_count, int)) and (deck_count > 0), "'deck_count' must be a positive integer!"
+
+    rng = np.random.default_rng(seed)
+    with open(file_path, "wb") as library_file:
+        library_file.write(struct.pack(header_format, library_magic, deck_count, shoe_count))
+        shoes_left = shoe_count
+        while shoes_left > 0:
+            batch = min(batch_size, shoes_left)
+            shuffled_shoes(rng, batch, deck_count).tofile(library_file)
+            shoes_left -= batch
+
+
+def shuffled_shoes(rng, shoe_count, deck_count):
+    """
+    Returns a NumPy array of independently shuffled shoes encoded as rank/suit byte pairs.
+
+    Parameters
+    ----------
+    rng : numpy.random.Generator
+        The random generator used to shuffle the shoes.
+    shoe_count : int
+        The number of shoes to generate.
+    deck_count : int
+        The number of 52-card sets shuffled into each shoe.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of dtype uint8 and shape (shoe_count, 52 * deck_count, 2): the rank index then suit index of each card.
+    """
+    import numpy as np
+
+    # The unshuffled shoe in the same order as 'Deck.new_deck': deck by deck, suit by suit, rank by rank
+    single_deck = [
+        (rank_idx, suit_idx)
+        for suit_idx in range(len(suit_names))
+        for rank_idx in range(len(rank_names))
+    ]
+    ordered_shoe = np.array(single_deck * deck_count, dtype=np.uint8)
+    orderings = np.argsort(rng.random((shoe_count, len(ordered_shoe))), axis=1)
+    return ordered_shoe[orderings]
+
+
+class ShoeLibrary:
+    """
+    A class giving read-only, memory-mapped access to the shoes stored in a shoe library file.
+
+    The file is never read into memory: 'shoe' returns a zero-copy view of a single shoe that can be passed directly to
+    'Deck.load_shoe', or the library can be attached to a deck with 'Deck.attach_shoe_library'. Any number of processes
+    can map the same file, sharing one copy of it in the operating system's page cache.
+    """
+
+    def __init__(self, file_path):
+        """
+        Opens and memory-maps a shoe library file, validating its header.
+
+        Parameters
+        ----------
+        file_path : str or os.PathLike
+            Location of a file written by 'write_shoe_library'.
+        """
+        with open(file_path, "rb") as library_file:
+            self._map = mmap.mmap(library_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, self._deck_count, self._shoe_count = struct.unpack_from(header_format, self._map)
+            assert magic == library_magic, f"'{file_path}' is not a shoe library file."
+            self._header_size = struct.calcsize(header_format)
+            self._shoe_size = 2 * 52 * self._deck_count  # Bytes per shoe: two per card
+            assert (
+                len(self._map) == self._header_size + self._shoe_count * self._shoe_size
+            ), f"Shoe library '{file_path}' is truncated or corrupt."
+        except Exception:
+            self._map.close()  # The file itself was closed once mapped
+            raise
+        self._view = memoryview(self._map)
+
+    def __len__(self):
+        """Allows len() to be used on library objects, returning the number of shoes stored in the library."""
+        return self._shoe_count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_deck_count(self):
+        """Returns the number of 52-card sets shuffled into each shoe of the library."""
+        return self._deck_count
+
+    def shoe(self, shoe_index):
+        """
+        Returns a zero-copy view of the rank/suit byte pairs of a single shoe, top card first.
+
+        Parameters
+        ----------
+        shoe_index : int
+            Index of the shoe within the library, from 0 to len(library) - 1.
+
+        Returns
+        -------
+        memoryview
+            A read-only view onto the memory-mapped file.
+        """
+        assert 0 <= shoe_index < self._shoe_count, f"Shoe index out of range: {shoe_index}"
+        start = self._header_size + shoe_index * self._shoe_size
+        return self._view[start : start + self._shoe_size]
+
+    def close(self):
+        """
+        Unmaps the library file. Any deck still dealing from the library must be detached (or have loaded a different
+        shoe) first: the memory map cannot be closed while views onto it are still in use.
+        """
+        self._view.release()
+        self._map.close()
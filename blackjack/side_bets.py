@@ -0,0 +1,347 @@
+"""
+This module exports the 'SideBet' class, the 'perfect_pairs' and 'twenty_one_three' side bets and related functions:
+settlement, exact house edges and batch pricing of side bets on the initial deal.
+
+Both side bets are settled from the cards of the initial deal alone: Perfect Pairs from the player's first two cards,
+21+3 from those two cards and the dealer's face-up card. Each card is identified by its card type: an integer from 0
+to 51 combining its rank and suit ('rank index * 4 + suit index', indexes as in 'Deck.encode_card'). A side bet holds a
+precomputed lookup table of the outcome of every ordered combination of card types, so settling a bet is a single
+table read, and a NumPy array of millions of deals is settled with a single indexing operation.
+
+Attributes
+----------
+perfect_pairs_payouts : tuple of tuple
+    The winning Perfect Pairs outcomes, best first, as (outcome name, winnings per unit bet). A perfect pair is two
+    cards of the same rank and suit; a coloured pair, the same rank and colour; a mixed pair, the same rank.
+twenty_one_three_payouts : tuple of tuple
+    The winning 21+3 outcomes, best first, as (outcome name, winnings per unit bet). Straights may be ace-low or
+    ace-high but do not wrap around (e.g. king, ace, two is not a straight).
+perfect_pairs : blackjack.side_bets.SideBet
+    The Perfect Pairs side bet.
+twenty_one_three : blackjack.side_bets.SideBet
+    The 21+3 side bet.
+losing_outcome : str
+    The outcome recorded for a side bet that loses.
+"""
+import numpy as np
+from blackjack.deck import Deck, rank_names, suit_names
+
+card_type_count = len(rank_names) * len(suit_names)  # The number of distinct cards in a 52-card set
+losing_outcome = "lose"
+perfect_pairs_payouts = (("perfect pair", 25), ("coloured pair", 12), ("mixed pair", 6))
+twenty_one_three_payouts = (
+    ("suited trips", 100),
+    ("straight flush", 40),
+    ("three of a kind", 30),
+    ("straight", 10),
+    ("flush", 5),
+)
+
+
+class SideBet:
+    """
+    A class defining a side bet settled on the cards of the initial deal, with a lookup table of its outcomes.
+    """
+
+    def __init__(self, name, payouts, outcome_table):
+        """
+        Initialises a side bet. Use the module's 'perfect_pairs' and 'twenty_one_three' rather than calling this.
+
+        Parameters
+        ----------
+        name : str
+            The side bet's display name, e.g. 'Perfect Pairs'.
+        payouts : tuple of tuple
+            The winning outcomes as (outcome name, winnings per unit bet).
+        outcome_table : numpy.ndarray
+            The outcome code of every ordered combination of card types, one axis per card: 0 for a losing combination,
+            otherwise one more than the index of the winning outcome in 'payouts'.
+        """
+        self._name = name
+        self._payouts = payouts
+        self._outcome_table = outcome_table
+        self._card_count = outcome_table.ndim  # The number of initial-deal cards the side bet is settled on
+        self._outcome_names = (losing_outcome,) + tuple(outcome_name for outcome_name, _ in payouts)
+        self._winnings = np.array([-1] + [winnings for _, winnings in payouts], dtype=np.int64)  # Per unit bet
+
+    def __repr__(self):
+        return f"SideBet({self._name!r})"
+
+    def get_name(self):
+        """Returns the side bet's display name."""
+        return self._name
+
+    def get_payouts(self):
+        """Returns the side bet's winning outcomes as (outcome name, winnings per unit bet), best first."""
+        return self._payouts
+
+    def get_outcome_names(self):
+        """
+        Returns the side bet's outcome names indexed by outcome code: 'losing_outcome' (code 0), then each winning
+        outcome in the order of 'get_payouts'.
+        """
+        return self._outcome_names
+
+    def get_card_count(self):
+        """Returns the number of initial-deal cards the side bet is settled on."""
+        return self._card_count
+
+    def outcome(self, cards):
+        """
+        Returns the outcome of the side bet for the cards of an initial deal.
+
+        Parameters
+        ----------
+        cards : sequence of blackjack.card.Card
+            The player's first two cards, then the dealer's face-up card (see 'initial_deal_cards'); cards beyond
+            those the side bet is settled on are ignored.
+
+        Returns
+        -------
+        str
+            The name of the winning outcome, or 'losing_outcome'.
+        """
+        table_idx = tuple(card_type(card) for card in cards[: self._card_count])
+        return self._outcome_names[self._outcome_table[table_idx]]
+
+    def payout(self, cards, bet):
+        """
+        Returns the amount paid to the player on settling the side bet: their stake plus winnings, or 0 if it loses.
+
+        Parameters
+        ----------
+        cards : sequence of blackjack.card.Card
+            The cards of the initial deal, as in 'outcome'.
+        bet : int
+            The amount of the side bet, in minor currency units.
+        """
+        outcome_code = self._outcome_names.index(self.outcome(cards))
+        return bet * (int(self._winnings[outcome_code]) + 1)
+
+    def batch_outcome_codes(self, card_types):
+        """
+        Returns the outcome code of the side bet (see '__init__') for each deal in an array of initial deals.
+
+        Parameters
+        ----------
+        card_types : numpy.ndarray
+            An integer array of shape (deal count, 3): each deal's card types, in the order of 'initial_deal_cards'.
+        """
+        return self._outcome_table[tuple(card_types[:, card_idx] for card_idx in range(self._card_count))]
+
+    def batch_net_results(self, card_types, bet, outcome_codes=None):
+        """
+        Returns the player's net winnings from the side bet for each deal in an array of initial deals.
+
+        Parameters
+        ----------
+        card_types : numpy.ndarray
+            An integer array of shape (deal count, 3), as in 'batch_outcome_codes'.
+        bet : int
+            The amount of the side bet, in minor currency units.
+        outcome_codes : numpy.ndarray
+            The deals' outcome codes, if already returned by 'batch_outcome_codes'. Defaults to None: calculated from
+            'card_types'.
+
+        Returns
+        -------
+        numpy.ndarray
+            The net winnings of each deal (negative for a loss), in minor currency units, as 'int64'.
+        """
+        if outcome_codes is None:
+            outcome_codes = self.batch_outcome_codes(card_types)
+        return bet * self._winnings[outcome_codes]
+
+    def outcome_probabilities(self, card_counts):
+        """
+        Returns the exact probability of each outcome when the initial deal is drawn from a shoe.
+
+        Parameters
+        ----------
+        card_counts : array_like of int
+            The number of cards of each card type left in the shoe (see 'card_counts').
+
+        Returns
+        -------
+        dict
+            The probability of each outcome name, including 'losing_outcome'.
+        """
+        deal_probabilities = _ordered_deal_probabilities(np.asarray(card_counts, dtype=np.float64), self._card_count)
+        outcome_probabilities = np.bincount(
+            self._outcome_table.ravel(), weights=deal_probabilities.ravel(), minlength=len(self._outcome_names)
+        )
+        return dict(zip(self._outcome_names, outcome_probabilities.tolist()))
+
+    def house_edge(self, card_counts):
+        """
+        Returns the exact house edge of the side bet for a shoe: the fraction of each unit bet the player loses on
+        average (negative if the player has the edge).
+
+        Parameters
+        ----------
+        card_counts : array_like of int
+            The number of cards of each card type left in the shoe (see 'card_counts').
+        """
+        outcome_probabilities = self.outcome_probabilities(card_counts)
+        return -sum(
+            outcome_probabilities[outcome_name] * int(winnings)
+            for outcome_name, winnings in zip(self._outcome_names, self._winnings)
+        )
+
+
+def card_type(card):
+    """Returns a card's card type: an integer from 0 to 51 identifying its rank and suit."""
+    rank_idx, suit_idx = Deck.encode_card(card)
+    return rank_idx * len(suit_names) + suit_idx
+
+
+def card_counts(cards):
+    """
+    Returns the number of cards of each card type in an iterable of cards, e.g. a deck.
+
+    Returns
+    -------
+    numpy.ndarray
+        Counts indexed by card type, as 'int64'.
+    """
+    return np.bincount([card_type(card) for card in cards], minlength=card_type_count).astype(np.int64)
+
+
+def initial_deal_cards(player_hand, dealer_hand):
+    """Returns the cards side bets are settled on: the player's first two cards, then the dealer's face-up card."""
+    player_cards = iter(player_hand)
+    return [next(player_cards), next(player_cards), next(iter(dealer_hand))]
+
+
+def simulate_initial_deals(deal_count, deck_count, rng=None):
+    """
+    Returns the card types of the side bet cards of independent initial deals, each from a freshly shuffled shoe.
+
+    Each deal draws three distinct cards from the shoe's '52 * deck_count' positions, so cards are dealt without
+    replacement within a deal exactly as from a real shoe; no shoe is ever shuffled or stored.
+
+    Parameters
+    ----------
+    deal_count : int
+        The number of deals.
+    deck_count : int
+        The number of 52-card sets in the shoe.
+    rng : numpy.random.Generator
+        The random generator. Defaults to None: a generator seeded from the operating system.
+
+    Returns
+    -------
+    numpy.ndarray
+        An 'int64' array of shape (deal_count, 3): each deal's card types, in the order of 'initial_deal_cards'.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    shoe_length = card_type_count * deck_count
+    first = rng.integers(0, shoe_length, deal_count)
+    second = rng.integers(0, shoe_length - 1, deal_count)
+    second += second >= first  # Skips the position of the first card
+    third = rng.integers(0, shoe_length - 2, deal_count)
+    third += third >= np.minimum(first, second)
+    third += third >= np.maximum(first, second)
+    return np.stack((first, second, third), axis=1) % card_type_count
+
+
+def price_side_bets(deal_count, deck_count, side_bets=None, bet=100, seed=None, batch_size=1_000_000):
+    """
+    Settles side bets on millions of simulated initial deals, in batches, and returns their round statistics.
+
+    Parameters
+    ----------
+    deal_count : int
+        The number of deals.
+    deck_count : int
+        The number of 52-card sets in the shoe.
+    side_bets : sequence of blackjack.side_bets.SideBet
+        The side bets to price. Defaults to None: Perfect Pairs and 21+3.
+    bet : int
+        The amount of each side bet, in minor currency units.
+    seed : int
+        Seeds the random generator.
+    batch_size : int
+        The number of deals simulated at once; bounds memory use.
+
+    Returns
+    -------
+    dict
+        A 'blackjack.running_stats.RoundStatistics' for each side bet's name, with outcomes recorded by name (counted
+        per batch from the outcome codes, without a string per deal).
+    """
+    from blackjack.running_stats import RoundStatistics
+
+    if side_bets is None:
+        side_bets = (perfect_pairs, twenty_one_three)
+    rng = np.random.default_rng(seed)
+    side_bet_statistics = {side_bet.get_name(): RoundStatistics() for side_bet in side_bets}
+    for batch_start in range(0, deal_count, batch_size):
+        card_types = simulate_initial_deals(min(batch_size, deal_count - batch_start), deck_count, rng)
+        for side_bet in side_bets:
+            outcome_codes = side_bet.batch_outcome_codes(card_types)
+            outcome_names = side_bet.get_outcome_names()
+            outcome_counts = np.bincount(outcome_codes.ravel(), minlength=len(outcome_names))
+            side_bet_statistics[side_bet.get_name()].update_batch(
+                side_bet.batch_net_results(card_types, bet, outcome_codes),
+                dict(zip(outcome_names, outcome_counts.tolist())),
+            )
+    return side_bet_statistics
+
+
+def _ordered_deal_probabilities(card_counts, card_count):
+    """Returns the probability of drawing each ordered combination of 'card_count' card types, without replacement."""
+    shoe_length = card_counts.sum()
+    deal_probabilities = card_counts / shoe_length
+    for card_idx in range(1, card_count):
+        earlier_matches = np.zeros(deal_probabilities.shape + (card_type_count,))
+        for earlier_idx in range(card_idx):
+            earlier_matches += _same_type_indicator(card_idx + 1, earlier_idx, card_idx)
+        remaining = (card_counts - earlier_matches).clip(min=0)  # Cards of each type left for this draw
+        deal_probabilities = deal_probabilities[..., np.newaxis] * remaining / (shoe_length - card_idx)
+    return deal_probabilities
+
+
+def _same_type_indicator(ndim, first_axis, second_axis):
+    """Returns a broadcastable array of 'ndim' axes: 1 where the card types on two axes are equal, otherwise 0."""
+    return np.eye(card_type_count).reshape(
+        [card_type_count if axis in (first_axis, second_axis) else 1 for axis in range(ndim)]
+    )
+
+
+def _perfect_pairs_table():
+    """Returns the Perfect Pairs outcome code of every ordered pair of card types."""
+    rank_idx, suit_idx = np.divmod(np.arange(card_type_count), len(suit_names))
+    same_rank = rank_idx[:, np.newaxis] == rank_idx
+    same_suit = suit_idx[:, np.newaxis] == suit_idx
+    same_colour = (suit_idx[:, np.newaxis] % 2) == (suit_idx % 2)  # Spades and clubs are black; hearts, diamonds red
+    outcome_table = np.zeros((card_type_count, card_type_count), dtype=np.uint8)
+    outcome_table[same_rank] = 3
+    outcome_table[same_rank & same_colour] = 2
+    outcome_table[same_rank & same_suit] = 1
+    return outcome_table
+
+
+def _twenty_one_three_table():
+    """Returns the 21+3 outcome code of every ordered triple of card types."""
+    card_ranks, card_suits = np.divmod(np.indices((card_type_count,) * 3), len(suit_names))
+    sorted_ranks = np.sort(card_ranks, axis=0)
+    distinct_ranks = (sorted_ranks[0] != sorted_ranks[1]) & (sorted_ranks[1] != sorted_ranks[2])
+    ace_high = (sorted_ranks[0] == 0) & (sorted_ranks[1] == len(rank_names) - 2) & (
+        sorted_ranks[2] == len(rank_names) - 1
+    )
+    straight = distinct_ranks & ((sorted_ranks[2] - sorted_ranks[0] == 2) | ace_high)
+    flush = (card_suits[0] == card_suits[1]) & (card_suits[1] == card_suits[2])
+    trips = (card_ranks[0] == card_ranks[1]) & (card_ranks[1] == card_ranks[2])
+
+    outcome_table = np.zeros((card_type_count,) * 3, dtype=np.uint8)
+    for outcome_code, outcome_mask in reversed(
+        list(enumerate((trips & flush, straight & flush, trips, straight, flush), start=1))
+    ):
+        outcome_table[outcome_mask] = outcome_code  # Written worst first, so the best outcome of each deal remains
+    return outcome_table
+
+
+perfect_pairs = SideBet("Perfect Pairs", perfect_pairs_payouts, _perfect_pairs_table())
+twenty_one_three = SideBet("21+3", twenty_one_three_payouts, _twenty_one_three_table())
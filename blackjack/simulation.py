@@ -0,0 +1,243 @@
+"""
+This module defines headless play: rounds of blackjack resolved automatically, without keyboard input, printing or
+pauses.
+
+Rounds follow the same flow as 'blackjack_main.single_round', using the same hand objects and payout rules, but the
+player's actions are chosen by a strategy object (see 'blackjack.strategy'). All of the dealer's cards are dealt face-up:
+nothing is hidden from a strategy that only reads the dealer's first card, and card objects are never flipped, so card
+objects may safely be shared between decks.
+
+Attributes
+----------
+simulated_player_name : str
+    The name given to the automated player holding simulated hands.
+outcome_names : tuple of str
+    The possible outcomes of a simulated round, in a fixed order (used to index per-outcome counters).
+"""
+
+from blackjack import Player, DealerHand, PlayerHand, HandPool
+from blackjack.rules import default_rules, payout_amount
+from blackjack.running_stats import RoundStatistics
+from blackjack.strategy import BasicStrategy
+
+simulated_player_name = "StatJack"
+outcome_names = ("natural", "dealer_natural", "stand_off", "win", "push", "loss", "bust")
+
+
+def play_round(live_deck, strategy, bet=100, player_obj=None, rules=None, hand_pools=None):
+    """
+    Plays a single headless round against the dealer and returns the player's net result and the round's outcome.
+
+    Parameters
+    ----------
+    live_deck : blackjack.deck.Deck
+        All cards for this round are dealt from this deck; at the end of the round, both hands' cards are passed to its
+        'return_cards' method. Any object with the deck's 'deal_card' and 'return_cards' methods can be used.
+    strategy : blackjack.strategy.Strategy
+        Chooses the player's actions.
+    bet : int
+        The amount bet against the player's hand, in minor currency units. Defaults to 100 (£1.00), giving results in
+        hundredths of the bet.
+    player_obj : blackjack.player.Player
+        The player holding the hand. Defaults to None: a player named 'simulated_player_name' is created. The player's
+        balance is not updated.
+    rules : blackjack.rules.Rules
+        The table rules for the dealer's play and payouts. Defaults to None: 'blackjack.rules.default_rules'.
+    hand_pools : tuple of blackjack.hand.HandPool
+        The player's and dealer's hand pools, as returned by 'new_hand_pools'; when given, 'player_obj' and 'rules' are
+        taken from the pooled hands. Defaults to None: new hand objects are created for the round.
+
+    Returns
+    -------
+    tuple of (int, str)
+        The player's net winnings in minor currency units (negative for a loss) and the round's outcome (one of
+        'outcome_names').
+    """
+    if hand_pools is None:
+        if player_obj is None:
+            player_obj = Player(simulated_player_name)
+        hand_pools = new_hand_pools(player_obj, rules, pool_size=1)
+    player_hands, dealer_hands = hand_pools
+    players_hand = player_hands.acquire()
+    dealers_hand = dealer_hands.acquire()
+    players_hand.add_bet(bet)
+
+    players_hand.draw_card(live_deck)
+    dealers_hand.draw_card(live_deck, "up")
+    players_hand.draw_card(live_deck)
+    dealers_hand.draw_card(live_deck, "up")
+
+    round_result = _resolve_round(live_deck, players_hand, dealers_hand, strategy, bet)
+    live_deck.return_cards([*players_hand, *dealers_hand])
+    return round_result
+
+
+def new_hand_pools(player_obj, rules=None, pool_size=2):
+    """
+    Returns a pair of hand pools for a simulated seat, so that repeated rounds reuse the same hand objects.
+
+    Parameters
+    ----------
+    player_obj : blackjack.player.Player
+        The player holding the pooled player hands.
+    rules : blackjack.rules.Rules
+        The table rules for the pooled dealer hands. Defaults to None: 'blackjack.rules.default_rules'.
+    pool_size : int
+        The number of hands in each pool.
+
+    Returns
+    -------
+    tuple of blackjack.hand.HandPool
+        The player's hand pool and the dealer's hand pool.
+    """
+    return (
+        HandPool(PlayerHand, player_obj, pool_size=pool_size),
+        HandPool(DealerHand, rules, pool_size=pool_size),
+    )
+
+
+def _resolve_round(live_deck, players_hand, dealers_hand, strategy, bet):
+    """Plays out a round once the initial cards are dealt; returns the player's net result and the round's outcome."""
+    payout_multiplier = dealers_hand.natural_multiplier(players_hand)
+    if payout_multiplier is not None:
+        if not players_hand.is_natural():
+            outcome = "dealer_natural"
+        elif dealers_hand.is_natural():
+            outcome = "stand_off"
+        else:
+            outcome = "natural"
+        return payout_amount(bet, payout_multiplier) - bet, outcome
+
+    dealer_upcard = next(iter(dealers_hand))
+    while players_hand.is_active():
+        if strategy.decide(players_hand, dealer_upcard):
+            players_hand.draw_card(live_deck)
+        else:
+            players_hand.stand()
+
+    if players_hand.is_bust():
+        return -bet, "bust"
+
+    dealers_hand.auto_resolve(live_deck)
+    payout_multiplier = dealers_hand.showdown_multiplier(players_hand)
+    if payout_multiplier == 0:
+        outcome = "loss"
+    elif dealers_hand.best_hand_value() == players_hand.best_hand_value():
+        outcome = "push"
+    else:
+        outcome = "win"
+    return payout_amount(bet, payout_multiplier) - bet, outcome
+
+
+def play_shoe(live_deck, strategy=None, rules=None, bet=100):
+    """
+    Plays headless rounds from the deck until fewer cards remain than the rules' deck length limit, yielding each result.
+
+    Parameters
+    ----------
+    live_deck : blackjack.deck.Deck
+        The shoe to play through. The deck is not replaced once it runs low: callers decide whether to call new_deck()
+        or load another shoe.
+    strategy : blackjack.strategy.Strategy
+        Chooses the player's actions. Defaults to None: basic strategy is played.
+    rules : blackjack.rules.Rules
+        The table rules. Play stops once the number of cards left in the deck falls below the rules' deck length limit
+        (as in 'blackjack_main.run'). Defaults to None: 'blackjack.rules.default_rules'.
+    bet : int
+        The amount bet each round, in minor currency units.
+
+    Yields
+    ------
+    tuple of (int, str)
+        The result of each round, as returned by 'play_round'.
+    """
+    if strategy is None:
+        strategy = BasicStrategy()
+    if rules is None:
+        rules = default_rules
+    hand_pools = new_hand_pools(Player(simulated_player_name), rules)
+    deck_length_limit = rules.get_deck_length_limit()
+    while len(live_deck) >= deck_length_limit:
+        yield play_round(live_deck, strategy, bet, rules=rules, hand_pools=hand_pools)
+
+
+def run_simulation(
+    live_deck,
+    round_limit,
+    strategy=None,
+    rules=None,
+    bet=100,
+    target_half_width=None,
+    min_rounds=1000,
+    check_interval=1000,
+):
+    """
+    Plays headless rounds, folding each result into a running accumulator, until 'round_limit' rounds have been played
+    or the confidence interval for the player's EV is tighter than 'target_half_width'.
+
+    No per-round results are kept, so memory use is constant at any run length. A fresh deck is shuffled whenever the
+    number of cards falls below the rules' deck length limit, as in 'blackjack_main.run'.
+
+    Parameters
+    ----------
+    live_deck : blackjack.deck.Deck
+        The deck to deal from.
+    round_limit : int
+        The maximum number of rounds to play.
+    strategy : blackjack.strategy.Strategy
+        Chooses the player's actions. Defaults to None: basic strategy is played.
+    rules : blackjack.rules.Rules
+        The table rules. Defaults to None: 'blackjack.rules.default_rules'.
+    bet : int
+        The amount bet each round, in minor currency units.
+    target_half_width : float
+        Stops early once the 95% confidence interval for EV per round extends less than this either side of the mean.
+        Defaults to None (always play 'round_limit' rounds).
+    min_rounds : int
+        Early stopping is not considered before this many rounds, guarding against a misleadingly small early variance.
+    check_interval : int
+        The interval (in rounds) at which the stopping rule is checked.
+
+    Returns
+    -------
+    blackjack.running_stats.RoundStatistics
+        The accumulated statistics.
+    """
+    if strategy is None:
+        strategy = BasicStrategy()
+    if rules is None:
+        rules = default_rules
+    hand_pools = new_hand_pools(Player(simulated_player_name), rules)
+    round_statistics = RoundStatistics()
+    for round_idx in range(1, round_limit + 1):
+        if len(live_deck) < rules.get_deck_length_limit():
+            live_deck.new_deck()
+        round_statistics.update(*play_round(live_deck, strategy, bet, rules=rules, hand_pools=hand_pools))
+        if stopping_rule_met(round_statistics, round_idx, target_half_width, min_rounds, check_interval):
+            break
+    return round_statistics
+
+
+def stopping_rule_met(round_statistics, round_idx, target_half_width, min_rounds, check_interval):
+    """
+    Returns True when a simulation should stop early: see the matching arguments of 'run_simulation'.
+
+    Parameters
+    ----------
+    round_statistics : blackjack.running_stats.RoundStatistics
+        The statistics accumulated so far.
+    round_idx : int
+        The number of rounds played so far.
+    target_half_width : float or None
+        The target half-width of the 95% confidence interval for EV per round; None disables early stopping.
+    min_rounds : int
+        Early stopping is not considered before this many rounds.
+    check_interval : int
+        The rule is only checked every 'check_interval' rounds.
+    """
+    return (
+        target_half_width is not None
+        and round_idx >= min_rounds
+        and round_idx % check_interval == 0
+        and round_statistics.is_precise(target_half_width)
+    )
@@ -0,0 +1,177 @@
+"""
+This module exports the 'SimulationJob' class: a long-running headless simulation that can be checkpointed and resumed.
+
+A job periodically writes a small JSON checkpoint holding: the state of its deck's random generator from just before the
+current shoe was shuffled, the number of cards dealt from that shoe, the accumulated round statistics and the index of
+the next round. A job created with the same arguments and checkpoint path resumes from the checkpoint and finishes with
+exactly the same statistics as an uninterrupted run: no rounds are lost or double-counted.
+"""
+import json
+import os
+import random
+from blackjack import Player
+from blackjack.deck import Deck
+from blackjack.rules import default_rules
+from blackjack.running_stats import RoundStatistics
+from blackjack.simulation import new_hand_pools, play_round, simulated_player_name, stopping_rule_met
+from blackjack.strategy import BasicStrategy
+
+
+class SimulationJob:
+    """
+    A class defining a reproducible simulation run with periodic checkpoints.
+
+    The job's deck is shuffled by a generator seeded from the job's 'seed', so each job plays a fixed sequence of
+    rounds. Checkpoints are written atomically (to a temporary file which then replaces the previous checkpoint), so a
+    job killed mid-write always leaves a valid checkpoint behind.
+    """
+
+    def __init__(
+        self,
+        round_limit,
+        seed,
+        checkpoint_path=None,
+        checkpoint_interval=10000,
+        rules=None,
+        strategy=None,
+        bet=100,
+        target_half_width=None,
+        min_rounds=1000,
+        check_interval=1000,
+    ):
+        """
+        Initialises a simulation job, resuming from 'checkpoint_path' if a checkpoint has already been written there.
+
+        Parameters
+        ----------
+        round_limit : int
+            The maximum number of rounds to play.
+        seed : int
+            Seeds the deck's random generator.
+        checkpoint_path : str or os.PathLike
+            Location of the job's checkpoint file. Defaults to None (no checkpoints are written).
+        checkpoint_interval : int
+            The number of rounds between checkpoints.
+        rules : blackjack.rules.Rules
+            The table rules. Defaults to None: 'blackjack.rules.default_rules'.
+        strategy : blackjack.strategy.Strategy
+            Chooses the player's actions. Defaults to None: basic strategy is played.
+        bet : int
+            The amount bet each round, in minor currency units.
+        target_half_width, min_rounds, check_interval
+            The early stopping rule (see 'blackjack.simulation.run_simulation').
+
+        Raises
+        ------
+        AssertionError
+            Raised when resuming from a checkpoint written by a job with different arguments.
+        """
+        self._strategy = BasicStrategy() if strategy is None else strategy
+        self._rules = default_rules if rules is None else rules
+        self._config = {
+            "round_limit": round_limit,
+            "seed": seed,
+            "rules": self._rules.as_dict(),
+            "strategy": self._strategy.as_dict(),
+            "bet": bet,
+            "target_half_width": target_half_width,
+            "min_rounds": min_rounds,
+            "check_interval": check_interval,
+        }  # The arguments defining the job's results: a checkpoint can only be resumed by a job with the same config
+        self._checkpoint_path = checkpoint_path
+        self._checkpoint_interval = checkpoint_interval
+        self._deck = Deck(self._rules.get_deck_count(), rng=random.Random(seed))
+        self._hand_pools = new_hand_pools(Player(simulated_player_name), self._rules)
+        self._statistics = RoundStatistics()
+        self._round_index = 0  # The number of rounds played so far (and index of the next round)
+        self._complete = False  # Set once the round limit is reached or the stopping rule is met
+
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            self._resume()
+
+    def get_round_index(self):
+        """Returns the number of rounds played so far."""
+        return self._round_index
+
+    def is_complete(self):
+        """Returns True once the job has reached its round limit or met its early stopping rule."""
+        return self._complete
+
+    def get_statistics(self):
+        """Returns the job's accumulated round statistics."""
+        return self._statistics
+
+    def run(self, max_rounds=None):
+        """
+        Plays rounds until the job is complete (or 'max_rounds' more rounds have been played), writing checkpoints every
+        'checkpoint_interval' rounds and once more on returning.
+
+        Parameters
+        ----------
+        max_rounds : int
+            Optionally stops after this many rounds, e.g. to share a time-slice; calling 'run' again continues the job.
+
+        Returns
+        -------
+        blackjack.running_stats.RoundStatistics
+            The statistics accumulated so far.
+        """
+        config = self._config
+        rounds_played = 0
+        while not self._complete and (max_rounds is None or rounds_played < max_rounds):
+            if self._round_index >= config["round_limit"]:
+                self._complete = True
+                break
+            if len(self._deck) < self._rules.get_deck_length_limit():
+                self._deck.new_deck()
+            self._statistics.update(
+                *play_round(self._deck, self._strategy, config["bet"], rules=self._rules, hand_pools=self._hand_pools)
+            )
+            self._round_index += 1
+            rounds_played += 1
+            if stopping_rule_met(
+                self._statistics,
+                self._round_index,
+                config["target_half_width"],
+                config["min_rounds"],
+                config["check_interval"],
+            ):
+                self._complete = True
+            if self._round_index % self._checkpoint_interval == 0:
+                self.write_checkpoint()
+
+        if self._round_index >= config["round_limit"]:
+            self._complete = True
+        self.write_checkpoint()
+        return self._statistics
+
+    def write_checkpoint(self):
+        """Atomically writes the job's current state to its checkpoint file, if it has one."""
+        if self._checkpoint_path is None:
+            return
+        rng_state, cards_dealt = self._deck.get_shoe_state()
+        checkpoint = {
+            "config": self._config,
+            "round_index": self._round_index,
+            "complete": self._complete,
+            "rng_state": rng_state,
+            "cards_dealt": cards_dealt,
+            "statistics": self._statistics.to_dict(),
+        }
+        temporary_path = f"{self._checkpoint_path}.tmp"
+        with open(temporary_path, "w") as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file)
+        os.replace(temporary_path, self._checkpoint_path)
+
+    def _resume(self):
+        """Restores the job's state from its checkpoint file."""
+        with open(self._checkpoint_path) as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+        assert (
+            checkpoint["config"] == self._config
+        ), "Checkpoint was written by a simulation job with different arguments."
+        version, internal_state, gauss_next = checkpoint["rng_state"]
+        self._deck.restore_shoe_state(((version, tuple(internal_state), gauss_next), checkpoint["cards_dealt"]))
+        self._statistics = RoundStatistics.from_dict(checkpoint["statistics"])
+        self._round_index = checkpoint["round_index"]
+        self._complete = checkpoint["complete"]
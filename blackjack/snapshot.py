@@ -0,0 +1,255 @@
+"""
+This module exports the 'RoundSnapshot' and 'RoundFork' classes: compact capture of a round in progress and cheap,
+independent copies of it for what-if evaluation.
+
+A snapshot holds the state of a round as a handful of bytes objects and integers rather than card objects: the order
+of the cards left in the deck and the cards of both hands are encoded as rank/suit byte pairs (see 'Deck.encode_card'),
+alongside each hand's card orientations and statuses, the player's balance and their bet. Capturing a round costs one
+pass over the deck; a snapshot is immutable, so it can be restored any number of times.
+
+A fork is a reusable set of live game objects (a deck, both hands and a player) that a snapshot is restored into. The
+fork's deck deals straight from the snapshot's bytes without copying them (see 'Deck.load_shoe'), and only the few
+cards in the hands are decoded into card objects, so restoring a snapshot costs a few microseconds however many cards
+remain in the deck. Rollout-based advisors create one fork and restore into it thousands of times.
+"""
+from blackjack import Player, DealerHand, PlayerHand
+from blackjack.deck import Deck, rank_value_classes, value_class_count
+from blackjack.rules import payout_amount
+from blackjack.simulation import simulated_player_name
+from blackjack.strategy import BasicStrategy
+
+
+class RoundSnapshot:
+    """
+    A class holding the complete state of a round in progress in compact, immutable form.
+    """
+
+    def __init__(self, deck_bytes, hand_states, balance, bet):
+        """
+        Initialises a snapshot. Use 'capture' rather than calling this directly.
+
+        Parameters
+        ----------
+        deck_bytes : bytes
+            The cards left in the deck, top card first, as rank/suit byte pairs.
+        hand_states : tuple
+            For the player's hand then the dealer's hand: (card bytes, face-up flags, statuses).
+        balance : int
+            The player's balance, in minor currency units.
+        bet : int
+            The amount bet against the player's hand, in minor currency units.
+        """
+        self._deck_bytes = deck_bytes
+        self._hand_states = hand_states
+        self._balance = balance
+        self._bet = bet
+
+    @classmethod
+    def capture(cls, live_deck, player_hand, dealer_hand, player_obj):
+        """
+        Captures the state of a round in progress. The captured objects are not changed.
+
+        Parameters
+        ----------
+        live_deck : blackjack.deck.Deck
+            The deck being dealt from. A lazily shuffled deck is shuffled on capture, fixing the order of its cards.
+        player_hand : blackjack.hand.PlayerHand
+            The player's hand, including the bet against it.
+        dealer_hand : blackjack.hand.DealerHand
+            The dealer's hand.
+        player_obj : blackjack.player.Player
+            The player holding 'player_hand'.
+
+        Returns
+        -------
+        blackjack.snapshot.RoundSnapshot
+            The captured state.
+        """
+        return cls(
+            _encode_cards(live_deck),
+            (_hand_state(player_hand), _hand_state(dealer_hand)),
+            player_obj.get_balance(),
+            player_hand.get_bet(),
+        )
+
+    def __len__(self):
+        """Returns the number of cards left in the captured deck."""
+        return len(self._deck_bytes) // 2
+
+    def __eq__(self, other):
+        """Snapshots are equal when they capture identical states."""
+        return isinstance(other, RoundSnapshot) and (
+            (self._deck_bytes, self._hand_states, self._balance, self._bet)
+            == (other._deck_bytes, other._hand_states, other._balance, other._bet)
+        )
+
+    def __hash__(self):
+        return hash((self._deck_bytes, self._hand_states, self._balance, self._bet))
+
+    def get_deck_bytes(self):
+        """Returns the cards left in the captured deck as rank/suit byte pairs, top card first."""
+        return self._deck_bytes
+
+    def get_hand_states(self):
+        """Returns the captured player's and dealer's hands, each as a tuple: (card bytes, face-up flags, statuses)."""
+        return self._hand_states
+
+    def get_balance(self):
+        """Returns the captured balance of the player, in minor currency units."""
+        return self._balance
+
+    def get_bet(self):
+        """Returns the captured bet against the player's hand, in minor currency units."""
+        return self._bet
+
+
+class RoundFork:
+    """
+    A class holding a reusable set of live game objects into which snapshots are restored for what-if play.
+    """
+
+    def __init__(self, deck_count, rules=None):
+        """
+        Initialises a fork's game objects. This is the only costly step: create a fork once and reuse it.
+
+        Parameters
+        ----------
+        deck_count : int
+            The number of 52-card sets in the deck of the rounds restored into this fork.
+        rules : blackjack.rules.Rules
+            The table rules for the fork's dealer. Defaults to None: 'blackjack.rules.default_rules'.
+        """
+        self.live_deck = Deck(deck_count, shoe_buffer=b"")  # Deals from the bytes of the latest snapshot restored
+        self.player_obj = Player(simulated_player_name)
+        self.player_hand = PlayerHand(self.player_obj)
+        self.dealer_hand = DealerHand(rules)
+
+    def restore(self, snapshot, rng=None):
+        """
+        Restores a snapshot into this fork's game objects, replacing the state of the previous what-if round.
+
+        Parameters
+        ----------
+        snapshot : blackjack.snapshot.RoundSnapshot
+            The state to restore.
+        rng : random.Random
+            If given, the cards unseen by the player (the cards left in the deck and the dealer's face-down card) are
+            shuffled together with this generator and the face-down card is dealt back from them: the round is then
+            only known as it would be to the player, for rollouts averaging over the unseen cards. Unless the captured
+            dealer's hand is a natural, the face-down card never gives the dealer one: the player only acts once
+            naturals are settled. Defaults to None: the round is restored exactly as captured.
+
+        Returns
+        -------
+        blackjack.snapshot.RoundFork
+            This fork, to allow e.g. 'fork.restore(snapshot).what_if(True)'.
+        """
+        deck_bytes, hand_states = snapshot.get_deck_bytes(), snapshot.get_hand_states()
+        if rng is not None:
+            deck_bytes, hand_states = _redeal_unseen(deck_bytes, hand_states, rng)
+        self.live_deck.load_shoe(deck_bytes)
+
+        for hand, (card_bytes, face_up_flags, status) in zip((self.player_hand, self.dealer_hand), hand_states):
+            hand.reset()
+            hand.restore(_decode_cards(card_bytes, face_up_flags), status)
+        self.player_hand.add_bet(snapshot.get_bet())
+        self.player_obj.update_balance(snapshot.get_balance() - self.player_obj.get_balance())
+        return self
+
+    def what_if(self, hit, strategy=None):
+        """
+        Plays out the restored round silently after a first decision, and returns the player's net result.
+
+        The player hits or stands as directed, then (if still active) plays on with 'strategy'; the dealer then draws
+        to their target and bets are settled as at the end of 'blackjack.simulation.play_round'.
+
+        Parameters
+        ----------
+        hit : bool
+            The player's next decision: True to hit, False to stand.
+        strategy : blackjack.strategy.Strategy
+            Chooses the player's later decisions. Defaults to None: basic strategy is played.
+
+        Returns
+        -------
+        int
+            The player's net winnings from the round, in minor currency units (negative for a loss).
+        """
+        if strategy is None:
+            strategy = BasicStrategy()
+        players_hand, dealers_hand = self.player_hand, self.dealer_hand
+        bet = players_hand.get_bet()
+        if hit:
+            players_hand.draw_card(self.live_deck)
+        else:
+            players_hand.stand()
+
+        dealer_upcard = next(iter(dealers_hand))
+        while players_hand.is_active():
+            if strategy.decide(players_hand, dealer_upcard):
+                players_hand.draw_card(self.live_deck)
+            else:
+                players_hand.stand()
+        if players_hand.is_bust():
+            return -bet
+
+        dealers_hand.auto_resolve(self.live_deck)
+        return payout_amount(bet, dealers_hand.showdown_multiplier(players_hand)) - bet
+
+
+def _encode_cards(cards):
+    """Returns an iterable of card objects encoded as rank/suit byte pairs, in order."""
+    return b"".join(Deck.encode_card(card) for card in cards)
+
+
+def _decode_cards(card_bytes, face_up_flags):
+    """Returns the card objects encoded in 'card_bytes', turning face-down those whose flag is False."""
+    cards = []
+    for position, face_up in zip(range(0, len(card_bytes), 2), face_up_flags):
+        card = Deck.decode_card(card_bytes[position], card_bytes[position + 1])
+        if not face_up:
+            card.flip_card()
+        cards.append(card)
+    return cards
+
+
+def _redeal_unseen(deck_bytes, hand_states, rng):
+    """
+    Returns a snapshot's deck bytes and hand states with the dealer's face-down card shuffled in with the deck's cards
+    and a face-down card dealt back from them (see 'RoundFork.restore'); the rest of the shuffled cards form the deck.
+    """
+    unseen_pairs = [deck_bytes[position : position + 2] for position in range(0, len(deck_bytes), 2)]
+    player_state, (card_bytes, face_up_flags, status) = hand_states
+    card_pairs = [card_bytes[position : position + 2] for position in range(0, len(card_bytes), 2)]
+    unseen_pairs.extend(card_pair for card_pair, face_up in zip(card_pairs, face_up_flags) if not face_up)
+    rng.shuffle(unseen_pairs)
+
+    dealer_natural = status[2]
+    for card_idx, face_up in enumerate(face_up_flags):
+        if face_up:
+            continue
+        redealt_idx = len(unseen_pairs) - 1  # The top card of the shuffled cards, unless it would give a natural
+        if not dealer_natural:
+            redealt_idx = next(
+                (
+                    pair_idx
+                    for pair_idx in range(len(unseen_pairs) - 1, -1, -1)
+                    if not _is_natural(card_pairs[:card_idx] + [unseen_pairs[pair_idx]] + card_pairs[card_idx + 1 :])
+                ),
+                redealt_idx,
+            )
+        card_pairs[card_idx] = unseen_pairs.pop(redealt_idx)
+    if False in face_up_flags:  # The dealer's first two cards, before the reveal: statuses follow from the new card
+        redealt_natural = _is_natural(card_pairs)
+        status = (not redealt_natural, False, redealt_natural)
+    return b"".join(unseen_pairs), (player_state, (b"".join(card_pairs), face_up_flags, status))
+
+
+def _is_natural(card_pairs):
+    """Returns True if the cards, as rank/suit byte pairs, are two cards worth 21: an ace and a ten-value card."""
+    return sorted(rank_value_classes[card_pair[0]] for card_pair in card_pairs) == [0, value_class_count - 1]
+
+
+def _hand_state(hand):
+    """Returns a hand's cards, card orientations and statuses in the compact form held by snapshots."""
+    return _encode_cards(hand), tuple(card.is_face_up() for card in hand), hand.get_status()
@@ -0,0 +1,141 @@
+"""
+This module exports strategy classes that choose a player's actions automatically, along with related helpers.
+
+Strategies replace keyboard input for headless play (see 'blackjack.simulation'). The game currently offers two
+actions, hit or stand, so a strategy answers a single question: given the best value of the player's hand, whether that
+value is soft and the value of the dealer's face-up card, should the player hit?
+"""
+
+
+def hand_total(hand_obj):
+    """
+    Returns the best value of a hand and whether that value is soft, as used by strategy decisions.
+
+    Parameters
+    ----------
+    hand_obj : blackjack.hand.Hand
+        The hand to evaluate; face-down cards are included.
+
+    Returns
+    -------
+    tuple of (int or None, bool)
+        The best hand value (None if bust) and whether it counts an ace as 11.
+    """
+    return hand_obj.best_hand_value(), hand_obj.is_soft()
+
+
+def upcard_value(card):
+    """
+    Returns the value of the dealer's face-up card as used by strategy tables: 2 to 10, or 11 for an ace.
+
+    Parameters
+    ----------
+    card : blackjack.card.Card
+        The dealer's face-up card.
+
+    Returns
+    -------
+    int
+        The card's value, with aces counted as 11.
+    """
+    if card.is_ace(bypass_face_down=True):
+        return 11
+    return card.card_value(bypass_face_down=True)
+
+
+class Strategy:
+    """
+    A base class defining the interface shared by automated player strategies.
+
+    Subclasses implement 'should_hit'; the 'decide' method adapts live game objects to that decision.
+    """
+
+    def should_hit(self, player_total, is_soft, dealer_upcard):
+        """
+        Returns True if the player should hit; False if they should stand.
+
+        Parameters
+        ----------
+        player_total : int
+            The best value of the player's hand (21 or under).
+        is_soft : bool
+            Whether the player's best value counts an ace as 11.
+        dealer_upcard : int
+            The value of the dealer's face-up card: 2 to 10, or 11 for an ace.
+        """
+        raise NotImplementedError
+
+    def as_dict(self):
+        """
+        Returns the strategy's identity as a JSON-serialisable dict: its class name and the parameters that change its
+        decisions. Strategies playing differently must return different dicts: the dict keys cached results and
+        checkpoints. Subclasses with parameters extend the base dict.
+        """
+        return {"name": type(self).__name__}
+
+    def decide(self, player_hand, dealer_upcard_card):
+        """
+        Returns True if the player holding 'player_hand' should hit; False if they should stand.
+
+        Parameters
+        ----------
+        player_hand : blackjack.hand.PlayerHand
+            The player's active hand.
+        dealer_upcard_card : blackjack.card.Card
+            The dealer's face-up card.
+        """
+        player_total, is_soft = hand_total(player_hand)
+        return self.should_hit(player_total, is_soft, upcard_value(dealer_upcard_card))
+
+
+class ThresholdStrategy(Strategy):
+    """
+    A strategy that hits until the hand reaches a fixed value, ignoring the dealer's card.
+
+    With the default threshold of 17, the player mimics the dealer's own drawing rule.
+    """
+
+    def __init__(self, stand_on=17):
+        """
+        Initialises the strategy with the hand value at which the player stops drawing.
+
+        Parameters
+        ----------
+        stand_on : int
+            The player stands once their best hand value reaches this value. Defaults to 17.
+        """
+        self._stand_on = stand_on
+
+    def as_dict(self):
+        """Returns the strategy's class name and threshold (see 'Strategy.as_dict')."""
+        return {**super().as_dict(), "stand_on": self._stand_on}
+
+    def should_hit(self, player_total, is_soft, dealer_upcard):
+        """Returns True while the player's best hand value is below the strategy's threshold."""
+        return player_total < self._stand_on
+
+
+class BasicStrategy(Strategy):
+    """
+    A strategy playing the standard hit/stand basic strategy (this game does not offer doubling or splitting).
+
+    Hard totals: stand on 17 or more; stand on 13 to 16 against a dealer 2 to 6; stand on 12 against a dealer 4 to 6;
+    otherwise hit. Soft totals: stand on 19 or more; stand on soft 18 unless the dealer shows 9, 10 or an ace;
+    otherwise hit.
+    """
+
+    def should_hit(self, player_total, is_soft, dealer_upcard):
+        """Returns True if basic strategy hits the given hand against the dealer's face-up card."""
+        if is_soft:
+            if player_total >= 19:
+                return False
+            if player_total == 18:
+                return dealer_upcard >= 9
+            return True
+        if player_total >= 17:
+            return False
+        if player_total >= 13:
+            return dealer_upcard >= 7
+        if player_total == 12:
+            return not 4 <= dealer_upcard <= 6
+        return True
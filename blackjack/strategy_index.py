@@ -0,0 +1,339 @@
+"""
+This module exports the 'IndexedStrategy' class and the 'write_strategy_index' and 'shoe_state_composition' functions:
+composition-dependent play precomputed offline and looked up from a memory-mapped index file.
+
+The offline job ('write_strategy_index') finds the optimal decision, hit or stand, for every player hand (the multiset
+of its cards' value classes) against every dealer face-up card, for a grid of shoe states: decks remaining and Hi-Lo
+true counts. Decisions come from exact EVs (see 'OutcomeCalculator.decision_evs'). Each decision is bit-packed into a
+single 64-bit record and the records are written sorted, so the loader ('IndexedStrategy') memory-maps the file and
+finds any decision by binary search: O(log n) reads of 8 bytes, with nothing but the header loaded into memory.
+
+An index file holds a fixed-size header, the decks remaining of each depth bucket (one 'uint32' each), then the sorted
+records ('uint64', little-endian). Bits of a record, from least significant: the decision (1 to hit); three bits for
+the count of each of the ten value classes in the player's hand; four bits for the dealer's face-up card's value class;
+five bits for the true count bucket; four bits for the depth bucket.
+
+Attributes
+----------
+index_magic : bytes
+    Identifies a file as a strategy index; written at the start of the header.
+header_format : str
+    The 'struct' format of the file header: magic bytes, number of 52-card sets in a full shoe, number of records,
+    number of depth buckets, and the lowest and highest true counts indexed.
+max_hand_class_count : int
+    The largest number of cards of one value class a hand can hold and still be indexed (limited by the record's bits).
+"""
+import itertools
+import mmap
+import os
+import struct
+import sys
+from blackjack.deck import value_class_count
+from blackjack.probability import OutcomeCalculator, value_class
+from blackjack.rules import default_rules
+from blackjack.strategy import BasicStrategy, Strategy
+
+index_magic = b"BJSTRAT1"
+header_format = "<8sIIIii"
+record_format = "<Q"
+max_hand_class_count = 7
+_class_bits = 3  # Bits per value class count in a record's hand field
+_upcard_shift = 1 + _class_bits * value_class_count
+_count_shift = _upcard_shift + 4
+_depth_shift = _count_shift + 5
+
+
+def shoe_state_composition(decks_remaining, true_count):
+    """
+    Returns a representative composition of the cards left in a shoe at a given depth and Hi-Lo true count.
+
+    The cards dealt so far are assumed to have left a running count of 'true_count * decks_remaining': the low cards
+    (two to six) are depleted by half of that, spread evenly across their ranks, and the high cards (tens and aces)
+    enriched by the other half.
+
+    Parameters
+    ----------
+    decks_remaining : int
+        The number of 52-card sets' worth of cards left in the shoe.
+    true_count : int
+        The Hi-Lo true count.
+
+    Returns
+    -------
+    tuple of int
+        The number of cards in each value class (see 'Deck.composition').
+    """
+    rank_shift = true_count * decks_remaining / 10  # Cards moved per rank: running count / 2, over five ranks
+    composition = [4 * decks_remaining] * value_class_count
+    composition[-1] = 16 * decks_remaining
+    for class_idx in range(1, 6):
+        composition[class_idx] = round(composition[class_idx] - rank_shift)
+    composition[0] = round(composition[0] + rank_shift)
+    composition[-1] = round(composition[-1] + 4 * rank_shift)
+    return tuple(max(class_count, 0) for class_count in composition)
+
+
+def write_strategy_index(
+    file_path,
+    deck_count=6,
+    decks_remaining=(1, 2, 4, 6),
+    true_counts=range(-3, 4),
+    max_hand_cards=3,
+    upcard_classes=range(value_class_count),
+    rules=None,
+    processes=None,
+):
+    """
+    Calculates the optimal decision for every indexed (shoe state, dealer card, player hand) and writes an index file.
+
+    Shoe states are calculated in parallel, one per task. This is an offline job: at the defaults, each shoe state
+    takes around a minute of calculation.
+
+    Parameters
+    ----------
+    file_path : str or os.PathLike
+        Location of the index file to be written; an existing file is overwritten.
+    deck_count : int
+        The number of 52-card sets in a full shoe.
+    decks_remaining : tuple of int
+        The depth buckets: shoe depths (in decks left) at which decisions are calculated.
+    true_counts : iterable of int
+        The consecutive true counts at which decisions are calculated (at most 32 of them).
+    max_hand_cards : int
+        Hands of up to this many cards are indexed; decisions for larger hands fall back to basic strategy.
+    upcard_classes : iterable of int
+        The value classes of the dealer's face-up cards indexed; decisions against other cards fall back to basic
+        strategy. Defaults to every class.
+    rules : blackjack.rules.Rules
+        The table rules. Defaults to None: 'blackjack.rules.default_rules'.
+    processes : int
+        The number of worker processes. Defaults to None: one per CPU.
+
+    Returns
+    -------
+    int
+        The number of records written.
+    """
+    import multiprocessing
+    from array import array
+
+    true_counts = list(true_counts)
+    assert len(decks_remaining) <= 16, "At most 16 depth buckets can be indexed!"
+    assert len(true_counts) <= 32, "At most 32 true counts can be indexed!"
+    assert true_counts == list(
+        range(true_counts[0], true_counts[0] + len(true_counts))
+    ), "True counts must be consecutive!"
+    assert 2 <= max_hand_cards <= max_hand_class_count, f"'max_hand_cards' must be from 2 to {max_hand_class_count}!"
+    if rules is None:
+        rules = default_rules
+
+    bucket_args = [
+        (depth_idx, count_idx, shoe_state_composition(depth, true_count), max_hand_cards, tuple(upcard_classes), rules)
+        for depth_idx, depth in enumerate(decks_remaining)
+        for count_idx, true_count in enumerate(true_counts)
+    ]
+    with multiprocessing.Pool(processes) as pool:
+        bucket_records = pool.starmap(index_shoe_state, bucket_args)
+    records = array("Q", sorted(itertools.chain.from_iterable(bucket_records)))
+    if sys.byteorder == "big":
+        records.byteswap()  # Records are stored little-endian on every platform
+
+    with open(file_path, "wb") as index_file:
+        index_file.write(
+            struct.pack(
+                header_format, index_magic, deck_count, len(records), len(decks_remaining), true_counts[0],
+                true_counts[-1],
+            )
+        )
+        index_file.write(struct.pack(f"<{len(decks_remaining)}I", *decks_remaining))
+        records.tofile(index_file)
+    return len(records)
+
+
+def index_shoe_state(depth_idx, count_idx, composition, max_hand_cards, upcard_classes, rules):
+    """
+    Returns the records of every indexed decision in one shoe state (a task of 'write_strategy_index').
+
+    Parameters
+    ----------
+    depth_idx : int
+        The shoe state's depth bucket.
+    count_idx : int
+        The shoe state's true count bucket (the true count's offset from the lowest indexed true count).
+    composition : tuple of int
+        The cards left in the shoe before the player's and dealer's cards are dealt.
+    max_hand_cards : int
+        Hands of up to this many cards are indexed.
+    upcard_classes : tuple of int
+        The value classes of the dealer's face-up cards indexed.
+    rules : blackjack.rules.Rules
+        The table rules.
+
+    Returns
+    -------
+    list of int
+        Bit-packed decision records (see the module docstring).
+    """
+    calculator = OutcomeCalculator(rules)
+    records = []
+    for upcard_class in upcard_classes:
+        for card_count in range(2, max_hand_cards + 1):
+            for player_classes in itertools.combinations_with_replacement(range(value_class_count), card_count):
+                hard_total = sum(class_idx + 1 for class_idx in player_classes)
+                soft_total = hard_total + 10 if 0 in player_classes else hard_total
+                if hard_total >= 21 or soft_total == 21:
+                    continue  # Bust hands and hands of 21 take no decision
+                unseen = list(composition)
+                for class_idx in player_classes + (upcard_class,):
+                    unseen[class_idx] -= 1
+                if min(unseen) < 0:
+                    continue  # The hand cannot be dealt from this shoe
+                stand_ev, hit_ev = calculator.decision_evs(player_classes, upcard_class, unseen)
+                hand_key = _record_key(depth_idx, count_idx, upcard_class, _hand_counts(player_classes))
+                records.append(hand_key | (hit_ev > stand_ev))
+        calculator.clear()  # Bounds memory: memo tables for other dealer cards share few entries
+    return records
+
+
+class IndexedStrategy(Strategy):
+    """
+    A strategy answering hit/stand decisions from a memory-mapped strategy index, given the state of the shoe.
+
+    Hands that are not indexed (e.g. hands with more cards than the index covers) are played with basic strategy.
+    """
+
+    def __init__(self, file_path, counter=None):
+        """
+        Opens and memory-maps a strategy index file, validating its header.
+
+        Parameters
+        ----------
+        file_path : str or os.PathLike
+            Location of a file written by 'write_strategy_index'.
+        counter : blackjack.bet_spread.HiLoCounter
+            The counter of the deck being played, read at each decision for the depth and true count of the shoe.
+            Defaults to None: decisions are looked up for a full shoe at a true count of zero.
+        """
+        with open(file_path, "rb") as index_file:
+            self._map = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic,
+            self._deck_count,
+            self._record_count,
+            depth_count,
+            self._min_true_count,
+            self._max_true_count,
+        ) = struct.unpack_from(header_format, self._map)
+        assert magic == index_magic, f"'{file_path}' is not a strategy index file."
+        self._decks_remaining = struct.unpack_from(f"<{depth_count}I", self._map, struct.calcsize(header_format))
+        self._records_offset = struct.calcsize(header_format) + 4 * depth_count  # Byte offset of the first record
+        assert (
+            len(self._map) == self._records_offset + 8 * self._record_count
+        ), f"Strategy index '{file_path}' is truncated or corrupt."
+        self._counter = counter
+        self._fallback = BasicStrategy()  # Plays hands that are not indexed
+        self._file_path = os.fspath(file_path)  # Identifies the index (see 'as_dict')
+
+    def __len__(self):
+        """Allows len() to be used on indexed strategies, returning the number of decisions in the index."""
+        return self._record_count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Unmaps the index file."""
+        self._map.close()
+
+    def as_dict(self):
+        """Returns the strategy's class name, index file and the size of its index (see 'Strategy.as_dict')."""
+        return {
+            **super().as_dict(),
+            "file_path": self._file_path,
+            "deck_count": self._deck_count,
+            "record_count": self._record_count,
+            "counted": self._counter is not None,
+        }
+
+    def should_hit(self, player_total, is_soft, dealer_upcard):
+        """Returns the basic strategy decision: a decision from totals alone cannot use the index."""
+        return self._fallback.should_hit(player_total, is_soft, dealer_upcard)
+
+    def decide(self, player_hand, dealer_upcard_card):
+        """
+        Returns True if the player holding 'player_hand' should hit; False if they should stand.
+
+        Parameters
+        ----------
+        player_hand : blackjack.hand.PlayerHand
+            The player's active hand.
+        dealer_upcard_card : blackjack.card.Card
+            The dealer's face-up card.
+        """
+        decision = self.lookup([value_class(card) for card in player_hand], value_class(dealer_upcard_card))
+        if decision is None:
+            return super().decide(player_hand, dealer_upcard_card)
+        return decision
+
+    def lookup(self, player_classes, upcard_class):
+        """
+        Returns the indexed decision for a hand in the current shoe state: True to hit, False to stand, or None if the
+        hand is not indexed.
+
+        Parameters
+        ----------
+        player_classes : sequence of int
+            The value class of each of the player's cards (see 'blackjack.probability.value_class').
+        upcard_class : int
+            The value class of the dealer's face-up card.
+        """
+        hand_counts = _hand_counts(player_classes)
+        if max(hand_counts) > max_hand_class_count:
+            return None
+        depth_idx, count_idx = self._shoe_state_buckets()
+        search_key = _record_key(depth_idx, count_idx, upcard_class, hand_counts)
+
+        low, high = 0, self._record_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._record(middle) < search_key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._record_count and self._record(low) >> 1 == search_key >> 1:
+            return bool(self._record(low) & 1)
+        return None
+
+    def _record(self, record_idx):
+        """Reads a single record from the mapped file."""
+        return struct.unpack_from(record_format, self._map, self._records_offset + 8 * record_idx)[0]
+
+    def _shoe_state_buckets(self):
+        """Returns the depth and true count buckets nearest the counted shoe's state."""
+        if self._counter is None:
+            decks_left, true_count = self._deck_count, 0
+        else:
+            decks_left, true_count = len(self._counter) / 52, self._counter.true_count()
+        depth_gaps = [abs(bucket_depth - decks_left) for bucket_depth in self._decks_remaining]
+        depth_idx = depth_gaps.index(min(depth_gaps))
+        true_count = min(max(true_count, self._min_true_count), self._max_true_count)
+        return depth_idx, true_count - self._min_true_count
+
+
+def _hand_counts(player_classes):
+    """Returns the number of cards of each value class in a hand."""
+    hand_counts = [0] * value_class_count
+    for class_idx in player_classes:
+        hand_counts[class_idx] += 1
+    return hand_counts
+
+
+def _record_key(depth_idx, count_idx, upcard_class, hand_counts):
+    """Returns the bit-packed record for a decision, with the decision bit clear."""
+    record = (depth_idx << _depth_shift) | (count_idx << _count_shift) | (upcard_class << _upcard_shift)
+    for class_idx, class_count in enumerate(hand_counts):
+        record |= class_count << (1 + _class_bits * class_idx)
+    return record
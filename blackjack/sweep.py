@@ -0,0 +1,157 @@
+"""
+This module exports functions to evaluate a grid of rule variants in parallel, caching each cell's results on disk.
+
+Each cell of a sweep is a 'Rules' object simulated for a fixed number of rounds from a fixed seed. Results are stored
+as JSON files in a cache directory, named by a hash of everything that determines them: the rules, seed, round count,
+strategy and bet. Re-running a sweep (or a larger sweep containing it) only simulates cells missing from the cache.
+"""
+import hashlib
+import itertools
+import json
+import os
+import random
+from blackjack.deck import Deck
+from blackjack.rules import Rules
+from blackjack.running_stats import RoundStatistics
+from blackjack.simulation import run_simulation
+from blackjack.strategy import BasicStrategy
+
+
+def rules_grid(**variants):
+    """
+    Returns a list of rules objects covering every combination of the given rule settings.
+
+    Parameters
+    ----------
+    **variants : list
+        For each 'Rules' argument to vary, a list of its values, e.g.
+        rules_grid(deck_count=[1, 6], natural_payout=[(3, 2), (6, 5)], dealer_hits_soft_17=[False, True]). Settings not
+        given keep their default values.
+
+    Returns
+    -------
+    list of blackjack.rules.Rules
+        One rules object per combination of settings.
+    """
+    setting_names = list(variants)
+    return [
+        Rules(**dict(zip(setting_names, setting_values)))
+        for setting_values in itertools.product(*variants.values())
+    ]
+
+
+def cell_key(rules, seed, round_limit, strategy=None, bet=100):
+    """
+    Returns the hash identifying the results of a single sweep cell, used as its cache file name.
+
+    Parameters
+    ----------
+    rules : blackjack.rules.Rules
+        The cell's rules.
+    seed : int
+        Seeds the cell's deck.
+    round_limit : int
+        The number of rounds simulated.
+    strategy : blackjack.strategy.Strategy
+        The player's strategy. Defaults to None: basic strategy.
+    bet : int
+        The amount bet each round, in minor currency units.
+
+    Returns
+    -------
+    str
+        A SHA-256 hex digest.
+    """
+    strategy_description = (BasicStrategy() if strategy is None else strategy).as_dict()
+    cell_description = json.dumps(
+        {
+            "rules": rules.as_dict(),
+            "seed": seed,
+            "round_limit": round_limit,
+            "strategy": strategy_description,
+            "bet": bet,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(cell_description.encode()).hexdigest()
+
+
+def run_sweep(rules_list, round_limit, seed, cache_dir, strategy=None, bet=100, processes=None):
+    """
+    Simulates every rules variant not already in the cache (in parallel) and returns the statistics of every cell.
+
+    Parameters
+    ----------
+    rules_list : list of blackjack.rules.Rules
+        The variants to evaluate, e.g. from 'rules_grid'.
+    round_limit : int
+        The number of rounds simulated per cell.
+    seed : int
+        Seeds every cell's deck, so that all cells share a common sequence of random numbers.
+    cache_dir : str or os.PathLike
+        Directory holding cached cell results; created if it does not exist.
+    strategy : blackjack.strategy.Strategy
+        The player's strategy. Defaults to None: basic strategy.
+    bet : int
+        The amount bet each round, in minor currency units.
+    processes : int
+        The number of worker processes. Defaults to None: one per CPU.
+
+    Returns
+    -------
+    list of tuple
+        (rules, statistics) pairs in the order of 'rules_list'; statistics are 'RoundStatistics' objects.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    cache_paths = [
+        os.path.join(cache_dir, f"{cell_key(rules, seed, round_limit, strategy, bet)}.json")
+        for rules in rules_list
+    ]
+    missing_cells = [
+        cell_idx for cell_idx, cache_path in enumerate(cache_paths) if not os.path.exists(cache_path)
+    ]
+
+    if missing_cells:
+        import multiprocessing
+
+        cell_args = [(rules_list[cell_idx], round_limit, seed, strategy, bet) for cell_idx in missing_cells]
+        with multiprocessing.Pool(processes) as pool:
+            cell_states = pool.starmap(evaluate_cell, cell_args)
+        for cell_idx, cell_state in zip(missing_cells, cell_states):
+            _write_cell(cache_paths[cell_idx], rules_list[cell_idx], cell_state)
+
+    results = []
+    for rules, cache_path in zip(rules_list, cache_paths):
+        with open(cache_path) as cache_file:
+            cell_state = json.load(cache_file)["statistics"]
+        results.append((rules, RoundStatistics.from_dict(cell_state)))
+    return results
+
+
+def evaluate_cell(rules, round_limit, seed, strategy=None, bet=100):
+    """
+    Simulates a single sweep cell and returns its statistics as a JSON-serialisable dict (see 'RoundStatistics.to_dict').
+
+    Parameters
+    ----------
+    rules : blackjack.rules.Rules
+        The cell's rules.
+    round_limit : int
+        The number of rounds to simulate.
+    seed : int
+        Seeds the cell's deck.
+    strategy : blackjack.strategy.Strategy
+        The player's strategy. Defaults to None: basic strategy.
+    bet : int
+        The amount bet each round, in minor currency units.
+    """
+    live_deck = Deck(rules.get_deck_count(), rng=random.Random(seed))
+    return run_simulation(live_deck, round_limit, strategy, rules, bet).to_dict()
+
+
+def _write_cell(cache_path, rules, cell_state):
+    """Atomically writes a cell's rules and statistics to its cache file."""
+    temporary_path = f"{cache_path}.tmp"
+    with open(temporary_path, "w") as cache_file:
+        json.dump({"rules": rules.as_dict(), "statistics": cell_state}, cache_file)
+    os.replace(temporary_path, cache_path)
@@ -0,0 +1,37 @@
+"""Tests for vectorised bankroll simulation. Run using: python -m pytest."""
+
+import numpy as np
+from blackjack.bankroll import flat_bet, payout_distribution, proportional_bet, simulate_bankrolls
+from blackjack.running_stats import RoundStatistics
+
+
+def test_certain_loss_ruins_every_trajectory():
+    report = simulate_bankrolls([-100], [1.0], flat_bet(200), trajectory_count=50, starting_balance=1000)
+    assert report.risk_of_ruin() == 1.0
+    assert np.all(report.get_session_lengths() == 5)
+    assert np.all(report.get_final_balances() == 0)
+
+
+def test_bankroll_report_statistics():
+    report = simulate_bankrolls(
+        [-100, 0, 100, 150], [0.49, 0.09, 0.38, 0.04], flat_bet(5000), trajectory_count=2000, round_limit=200, seed=1
+    )
+    assert 0 < report.risk_of_ruin() < 1
+    assert np.all(report.get_session_lengths() <= 200)
+    balance_percentiles = report.final_balance_percentiles()
+    assert balance_percentiles[5] <= balance_percentiles[50] <= balance_percentiles[95]
+    assert report.session_length_histogram()[0].sum() == len(report) == 2000
+    repeat_report = simulate_bankrolls(
+        [-100, 0, 100, 150], [0.49, 0.09, 0.38, 0.04], flat_bet(5000), trajectory_count=2000, round_limit=200, seed=1
+    )
+    assert np.array_equal(report.get_final_balances(), repeat_report.get_final_balances())
+
+
+def test_proportional_bet_and_distribution():
+    round_statistics = RoundStatistics()
+    for net_result, outcome in ((-100, "loss"), (100, "win"), (100, "win"), (150, "natural")):
+        round_statistics.update(net_result, outcome)
+    net_results, probabilities = payout_distribution(round_statistics)
+    assert net_results.tolist() == [-100, 100, 150]
+    assert probabilities.tolist() == [0.25, 0.5, 0.25]
+    assert proportional_bet(0.1)(np.array([50000, 5, 0])).tolist() == [5000, 1, 0]
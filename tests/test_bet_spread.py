@@ -0,0 +1,36 @@
+"""Tests for count-driven betting. Run using: python -m pytest."""
+
+import numpy as np
+import pytest
+from blackjack.bet_spread import BetRamp, HiLoCounter, evaluate_ramps, play_counted_shoes
+from blackjack.deck import Deck
+from blackjack.rules import Rules
+
+
+def test_hi_lo_count_balances_over_shoe():
+    counter = HiLoCounter(Deck(1))
+    for _ in range(51):
+        counter.deal_card()
+    assert counter.get_running_count() in (-1, 0, 1)
+    counter.deal_card()
+    assert counter.get_running_count() == 0
+    counter.new_deck()
+    assert counter.get_running_count() == 0 and len(counter) == 52
+
+
+def test_bet_ramp_clamps_counts():
+    bet_ramp = BetRamp([100, 200, 400], min_true_count=1)
+    assert bet_ramp.bet_for(-3) == 100
+    assert bet_ramp.bet_for(2) == 200
+    assert bet_ramp.bet_for(9) == 400
+
+
+def test_evaluate_ramps_matches_flat_bet():
+    true_counts, net_results = play_counted_shoes(5, Rules(deck_count=2, deck_length_limit=26), seed=4)
+    assert len(true_counts) == len(net_results) > 0
+    ramp_results = evaluate_ramps([[100, 100], [200, 200], [100, 800]], true_counts, net_results)
+    assert ramp_results["ev_per_100"][0] == pytest.approx(net_results.mean() * 100)
+    assert ramp_results["sd_per_100"][0] == pytest.approx(net_results.std(ddof=1) * 10)
+    assert ramp_results["ev_per_100"][1] == pytest.approx(2 * ramp_results["ev_per_100"][0])
+    assert ramp_results["mean_bet"].tolist()[:2] == [100, 200]
+    assert np.all((ramp_results["bankroll"] > 0) | np.isinf(ramp_results["bankroll"]))
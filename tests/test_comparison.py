@@ -0,0 +1,29 @@
+"""Tests for common-random-numbers strategy comparison. Run using: python -m pytest."""
+
+from blackjack.comparison import compare_strategies
+from blackjack.rules import Rules
+from blackjack.strategy import BasicStrategy, ThresholdStrategy
+
+
+def test_identical_strategies_never_differ():
+    comparison = compare_strategies([BasicStrategy(), BasicStrategy()], 500, seed=2)
+    assert len(comparison) == 500
+    assert comparison.ev_difference(1) == 0
+    assert comparison.difference_interval(1) == (0, 0)
+    assert comparison.get_strategy_statistics(0).to_dict() == comparison.get_strategy_statistics(1).to_dict()
+
+
+def test_paired_comparison_reduces_variance():
+    comparison = compare_strategies(
+        [BasicStrategy(), ThresholdStrategy(12), ThresholdStrategy(17)], 3000, Rules(deck_count=2), seed=5
+    )
+    summaries = comparison.summary()
+    assert len(summaries) == 2
+    for strategy_idx, strategy_summary in enumerate(summaries, start=1):
+        difference_statistics = comparison.get_difference_statistics(strategy_idx)
+        assert difference_statistics.get_net_total() == (
+            comparison.get_strategy_statistics(strategy_idx).get_net_total()
+            - comparison.get_strategy_statistics(0).get_net_total()
+        )
+        assert 0 < strategy_summary["different_rate"] < 1
+        assert strategy_summary["variance_reduction"] > 1
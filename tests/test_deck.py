@@ -1,7 +1,13 @@
 """Tests for deck objects. Run using: python -m pytest."""
 
+import random
 import pytest
-from blackjack.deck import Deck
+from collections import Counter
+from blackjack.continuous_deck import ContinuousShufflingDeck, InfiniteDeck
+from blackjack.deck import Deck, composition_hash
+from blackjack.rank_shoe import RankShoe
+from blackjack.simulation import run_simulation
+from blackjack.strategy import BasicStrategy, upcard_value
 
 
 @pytest.mark.parametrize("deck_count,multiplier", [(1, 1), (2, 2), (6, 6), (10, 10)])
@@ -16,3 +22,95 @@ def test_deck_length(deck_count, multiplier):
 def test_invalid_type_deck_length(deck_count):
     with pytest.raises(AssertionError):
         single_deck = Deck(deck_count)
+
+
+def test_lazy_shuffle_deals_every_card_once():
+    lazy_deck = Deck(2, lazy_shuffle=True)
+    dealt_codes = [Deck.encode_card(lazy_deck.deal_card()) for _ in range(len(lazy_deck))]
+    assert len(lazy_deck) == 0
+    assert sorted(dealt_codes) == sorted(Deck.encode_card(card) for card in Deck(2))
+
+
+def test_lazy_shuffle_iteration_fixes_order():
+    lazy_deck = Deck(1, lazy_shuffle=True)
+    lazy_deck.deal_card()
+    observed_order = list(lazy_deck)
+    assert [lazy_deck.deal_card() for _ in range(len(lazy_deck))] == observed_order
+
+
+def test_lazy_shuffle_first_card_uniform():
+    rng = random.Random(1)
+    lazy_deck = Deck(1, rng=rng, lazy_shuffle=True)
+    first_ranks = Counter()
+    for _ in range(13000):
+        lazy_deck.new_deck()
+        first_ranks[lazy_deck.deal_card()._rank] += 1
+    assert len(first_ranks) == 13
+    assert all(850 < count < 1150 for count in first_ranks.values())
+
+
+def test_continuous_shuffling_deck_refills():
+    machine = ContinuousShufflingDeck(1)
+    dealt_cards = [machine.deal_card() for _ in range(5)]
+    assert len(machine) == 47
+    dealt_cards[0].flip_card()
+    machine.return_cards(dealt_cards)
+    assert len(machine) == 52
+    assert all(card.is_face_up() for card in machine)
+
+
+def test_infinite_deck_never_runs_low():
+    infinite_deck = InfiniteDeck(random.Random(2))
+    ranks = Counter(infinite_deck.deal_card()._rank for _ in range(1000))
+    assert len(ranks) == 13
+    assert len(infinite_deck) > 10 ** 9
+
+
+def test_composition_hash_tracks_deals():
+    first_deck, second_deck = Deck(2, rng=random.Random(1)), Deck(2, rng=random.Random(2))
+    assert first_deck.composition() == (8, 8, 8, 8, 8, 8, 8, 8, 8, 32)
+    assert first_deck.composition_hash() == second_deck.composition_hash()
+    for _ in range(20):
+        first_deck.deal_card()
+    assert first_deck.composition_hash() != second_deck.composition_hash()
+    assert first_deck.composition_hash() == composition_hash(first_deck.composition())
+    assert sum(first_deck.composition()) == len(first_deck) == 84
+
+    loaded_deck = Deck(2)
+    loaded_deck.load_shoe(b"".join(Deck.encode_card(card) for card in first_deck))
+    assert loaded_deck.composition_hash() == first_deck.composition_hash()
+    loaded_deck.deal_card()
+    first_deck.deal_card()
+    assert loaded_deck.composition() == first_deck.composition()
+    first_deck.new_deck()
+    assert first_deck.composition_hash() == second_deck.composition_hash()
+
+
+def test_rank_shoe_deals_composition():
+    rank_shoe = RankShoe(2, random.Random(4))
+    assert rank_shoe.composition() == Deck(2).composition()
+    dealt_values = Counter(upcard_value(rank_shoe.deal_card()) for _ in range(104))
+    assert len(rank_shoe) == 0
+    assert dealt_values[10] == 32 and dealt_values[11] == 8 and dealt_values[5] == 8
+    rank_shoe.new_deck()
+    assert rank_shoe.composition_hash() == Deck(2).composition_hash()
+
+
+def test_rank_shoe_plays_rounds():
+    rank_shoe = RankShoe(6, random.Random(5))
+    round_statistics = run_simulation(rank_shoe, 500, BasicStrategy())
+    assert len(round_statistics) == 500
+
+
+def test_deck_from_shoe_buffer_and_release():
+    shoe_buffer = bytearray(bytes((0, 0, 12, 1, 4, 2)))
+    live_deck = Deck(1, shoe_buffer=shoe_buffer)
+    assert live_deck._live_deck == []  # No card objects are created
+    assert len(live_deck) == 3
+    assert live_deck.deal_card().short_card_details() == "A-S"
+    live_deck.release_shoe()
+    assert len(live_deck) == 0
+    assert live_deck.composition() == (0,) * 10
+    shoe_buffer.append(0)  # The buffer can be resized once no view of it is held
+    live_deck.new_deck()
+    assert len(live_deck) == 52
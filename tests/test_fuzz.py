@@ -0,0 +1,65 @@
+"""Tests for the differential fuzz harness. Run using: python -m pytest."""
+
+import random
+from fractions import Fraction
+from blackjack.fuzz import (
+    check_ev,
+    check_hand,
+    check_rank_shoe,
+    check_round,
+    check_side_bet,
+    check_statistics,
+    random_round_case,
+    run_fuzz,
+    shrink_case,
+)
+from blackjack.rules import Rules
+from blackjack.side_bets import perfect_pairs
+
+
+def test_fast_paths_match_reference():
+    assert run_fuzz(300, seed=11) == []
+
+
+def test_round_check_plays_generated_cases():
+    rng = random.Random(3)
+    for _ in range(50):
+        assert check_round(*random_round_case(rng)) is None
+    assert check_round(b"\x00\x00", (0, 17, 100)) is None  # Too few cards for the reference to play
+    assert check_hand(b"\x00\x00\x0c\x01") is None
+
+
+def test_round_reference_is_independent_of_settlement(monkeypatch):
+    # A natural paid at 1:1 by the shared settlement code must still disagree with the literal rules
+    monkeypatch.setattr(Rules, "natural_multiplier", lambda self: Fraction(2))
+    failures = run_fuzz(300, ["round"], seed=9, max_failures=1)
+    assert len(failures) == 1
+    assert "(natural)" in failures[0].get_message()
+
+
+def test_shrink_finds_minimal_case():
+    def check_no_aces(card_bytes, options):
+        ranks = card_bytes[::2]
+        if 0 in ranks and len(ranks) >= options[0]:
+            return "found an ace"
+        return None
+
+    card_bytes = bytes((5, 2, 9, 3, 0, 3, 12, 1, 0, 2))
+    shrunk_bytes, message = shrink_case(check_no_aces, card_bytes, (2,))
+    assert shrunk_bytes == b"\x00\x00\x00\x00"
+    assert message == "found an ace"
+
+
+def test_fast_path_checks(monkeypatch):
+    assert check_rank_shoe(b"\x00\x00" * 52, (1,)) is None  # Deals the whole shoe
+    assert check_ev(b"\x09\x00\x04\x01\x0a\x00\x0c\x01\x04\x01", (1, 12)) is None  # Every deal is playable
+    assert check_side_bet(b"\x00\x00\x00\x01\x00\x00", (0, 100)) is None
+    assert check_statistics(b"\xff\x00\x00\x06" * 8, (3, 10**15, True)) is None
+
+    wrong_table = perfect_pairs._outcome_table.copy()
+    wrong_table[0, 1] = 1  # Ace of spades, ace of hearts: a mixed pair scored as a perfect pair
+    monkeypatch.setattr(perfect_pairs, "_outcome_table", wrong_table)
+    assert "batch net 2500 != 600" in check_side_bet(b"\x00\x00\x00\x01\x00\x00", (0, 100))
+
+    monkeypatch.setattr(Rules, "natural_multiplier", lambda self: Fraction(2))
+    assert "initial_ev" in check_ev(b"\x00\x00\x05\x00\x09\x00\x09\x00", (2, 13))
@@ -1,5 +1,7 @@
 """Tests for hand objects. Run using: python -m pytest."""
 
+from blackjack.hand import Hand, HandPool
+
 
 def test_hand_value_three_ten(hand_13_fixture):
     assert hand_13_fixture.hand_value() == [13]
@@ -37,3 +39,32 @@ def test_best_hand_value_multiple_values(hand_4ace_fixture):
 
 def test_best_hand_value_bust(hand_bust_fixture):
     assert hand_bust_fixture.best_hand_value() is None
+
+
+def test_is_soft_single_ace(hand_1ace_fixture):
+    assert hand_1ace_fixture.is_soft()
+
+
+def test_is_soft_hard_hand(hand_13_fixture):
+    assert not hand_13_fixture.is_soft()
+
+
+def test_is_soft_bust(hand_bust_fixture):
+    assert not hand_bust_fixture.is_soft()
+
+
+def test_reset_clears_hand(hand_bust_fixture):
+    hand_bust_fixture._verify_hand_status()
+    hand_storage = hand_bust_fixture._live_hand
+    hand_bust_fixture.reset()
+    assert len(hand_bust_fixture) == 0
+    assert hand_bust_fixture.is_active()
+    assert not hand_bust_fixture.is_bust()
+    assert hand_bust_fixture._live_hand is hand_storage
+
+
+def test_hand_pool_cycles():
+    hand_pool = HandPool(Hand, pool_size=2)
+    first_hand, second_hand, third_hand = (hand_pool.acquire() for _ in range(3))
+    assert first_hand is not second_hand
+    assert third_hand is first_hand
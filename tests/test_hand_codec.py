@@ -0,0 +1,49 @@
+"""Tests for packing hands into 64-bit integers. Run using: python -m pytest."""
+
+import random
+import numpy as np
+from blackjack.deck import Deck
+from blackjack.hand import PlayerHand
+from blackjack.hand_codec import decode_hand, decode_hands, encode_hand, encode_hands, hand_values
+from blackjack.player import Player
+from blackjack.strategy import ThresholdStrategy
+
+
+def played_hands(hand_count, seed):
+    live_deck = Deck(6, rng=random.Random(seed))
+    strategy = ThresholdStrategy(stand_on=19)
+    hands = []
+    for _ in range(hand_count):
+        if len(live_deck) < 20:
+            live_deck.new_deck()
+        players_hand = PlayerHand(Player("Ann"))
+        players_hand.draw_card(live_deck)
+        players_hand.draw_card(live_deck)
+        while players_hand.is_active():
+            if strategy.should_hit(players_hand.best_hand_value(), players_hand.is_soft(), 10):
+                players_hand.draw_card(live_deck)
+            else:
+                players_hand.stand()
+        hands.append(players_hand)
+    return hands
+
+
+def test_hand_round_trip(hand_13_fixture):
+    for hand in [hand_13_fixture] + played_hands(200, 1):
+        cards, status = decode_hand(encode_hand(hand))
+        assert [card._rank for card in cards] == [card._rank for card in hand]
+        assert status == hand.get_status()
+
+
+def test_vectorised_codec_matches_hands():
+    hands = played_hands(500, 2)
+    packed_hands = np.array([encode_hand(hand) for hand in hands], dtype=np.uint64)
+    rank_codes, bust, natural, stood = decode_hands(packed_hands)
+    assert bust.tolist() == [hand.is_bust() for hand in hands]
+    assert natural.tolist() == [hand.is_natural() for hand in hands]
+    assert stood.all()
+    assert (encode_hands(rank_codes, bust, natural, stood) == packed_hands).all()
+
+    best_values, card_counts = hand_values(packed_hands)
+    assert best_values.tolist() == [hand.best_hand_value() or 0 for hand in hands]
+    assert card_counts.tolist() == [len(hand) for hand in hands]
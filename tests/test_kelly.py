@@ -0,0 +1,48 @@
+"""Tests for Kelly bet sizing from shoe composition. Run using: python -m pytest."""
+
+import random
+import pytest
+from blackjack.deck import Deck
+from blackjack.kelly import EdgeModel, KellyAdvisor, default_edge_model
+
+
+@pytest.fixture
+def edge_model_fixture():
+    removal_effects = (-0.006, 0.004, 0.005, 0.006, 0.008, 0.005, 0.003, 0.0, -0.002, -0.005)
+    return EdgeModel(-0.005, removal_effects, 1.25)
+
+
+def test_edge_model_linear_estimate(edge_model_fixture):
+    assert edge_model_fixture.edge((24,) * 9 + (96,)) == pytest.approx(-0.005)
+    low_cards_dealt = (24, 12, 12, 12, 12, 12, 24, 24, 24, 96)  # Sixty cards from two to six missing
+    assert edge_model_fixture.edge(low_cards_dealt) > 0.01
+    assert EdgeModel.from_dict(edge_model_fixture.to_dict()).edge(low_cards_dealt) == edge_model_fixture.edge(
+        low_cards_dealt
+    )
+
+
+def test_single_card_removal_matches_effect(edge_model_fixture):
+    ace_removed = (3,) + (4,) * 8 + (16,)
+    full_deck_model = EdgeModel(0.0, edge_model_fixture.get_removal_effects(), 1.25)
+    assert full_deck_model.edge(ace_removed) == pytest.approx(-0.006, abs=0.001)
+
+
+def test_advisor_recommends_within_limits(edge_model_fixture):
+    advisor = KellyAdvisor(edge_model_fixture, kelly_fraction=0.5, minimum_bet=100)
+    live_deck = Deck(6, rng=random.Random(1))
+    assert advisor.recommend_bet(live_deck, 50000) == 100  # No edge off the top of the shoe
+    assert advisor.recommend_bet(live_deck, 50) == 50
+
+    rich_shoe = [card for card in Deck(6) if card.card_value() not in (2, 3, 4, 5, 6)][:200]
+    live_deck.load_shoe(b"".join(Deck.encode_card(card) for card in rich_shoe))
+    edge, variance = advisor.estimate(live_deck)
+    assert edge == edge_model_fixture.edge(live_deck.composition()) > 0.05
+    assert advisor.recommend_bet(live_deck, 50000) == int(0.5 * edge / 1.25 * 50000)
+    assert advisor.recommend_bet(live_deck, 50000) == int(0.5 * edge / variance * 50000)  # Cached estimate
+
+
+def test_default_model_is_sensible():
+    assert -0.05 < default_edge_model.get_full_shoe_edge() < 0
+    removal_effects = default_edge_model.get_removal_effects()
+    assert removal_effects[0] < 0 < removal_effects[4]  # Removing an ace hurts the player; removing a five helps
+    assert sum(removal_effects[:9]) + 4 * removal_effects[9] == pytest.approx(0, abs=1e-3)
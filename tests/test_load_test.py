@@ -0,0 +1,46 @@
+"""Tests for the scripted load generator. Run using: python -m pytest."""
+
+import builtins
+import random
+import time
+from blackjack import hand as hand_module
+from blackjack.load_test import LoadTestReport, ScriptedBot, prompt_kinds, run_load_test, run_session
+
+
+def test_bot_follows_script():
+    bot = ScriptedBot("Ann", 2, bet_text="10", hit_probability=1.0, invalid_rate=0.0, rng=random.Random(1))
+    assert bot.respond("name") == "Ann"
+    assert bot.respond("bet") == "10"
+    assert bot.respond("action") == "h"
+    assert bot.respond("bet") == "10"
+    assert bot.respond("bet") == "quit"
+    assert bot.get_bets_placed() == 2
+
+
+def test_session_plays_rounds_through_input_path():
+    saved_input, saved_sleep = builtins.input, time.sleep
+    bot = ScriptedBot("Ann", 5, invalid_rate=0.3, rng=random.Random(4))
+    round_count, latencies = run_session(bot)
+    assert round_count == 5
+    assert set(latencies) == set(prompt_kinds)
+    assert len(latencies["name"]) >= 1
+    assert len(latencies["bet"]) >= 5  # Every valid bet is timed; invalid bets add more
+    assert all(latency >= 0 for kind_latencies in latencies.values() for latency in kind_latencies)
+    assert (builtins.input, time.sleep, hand_module.draw_delay) == (saved_input, saved_sleep, 1)
+
+
+def test_load_test_report():
+    report = run_load_test(3, rounds_per_session=4, processes=1, seed=7, rendered=True)
+    assert report.get_session_count() == 3
+    assert report.get_round_count() == 12
+    assert report.rounds_per_second() > 0
+    assert report.latency_percentile(50, "bet") <= report.latency_percentile(99, "bet")
+    assert "12 rounds" in report.summary()
+
+
+def test_latency_percentiles_nearest_rank():
+    report = LoadTestReport(1, 1, 1.0, {"bet": [0.4, 0.1, 0.3, 0.2], "action": []})
+    assert report.latency_percentile(50, "bet") == 0.2
+    assert report.latency_percentile(100) == 0.4
+    assert report.latency_percentile(0, "bet") == 0.1
+    assert report.latency_percentile(50, "action") is None
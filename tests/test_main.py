@@ -0,0 +1,46 @@
+"""Tests for the command-line entry point. Run using: python -m pytest."""
+
+import json
+import subprocess
+import sys
+from blackjack.__main__ import build_parser, main, play_command
+from blackjack.shoe_library import write_shoe_library
+
+
+def test_play_is_default_command():
+    args = build_parser().parse_args([])
+    assert args.command_function is play_command
+    assert not args.render and not args.advise
+
+
+def test_simulate_prints_statistics(capsys, tmp_path):
+    checkpoint_path = tmp_path / "job.json"
+    main(["simulate", "--rounds", "300", "--seed", "5", "--soft-17", "hit", "--checkpoint", str(checkpoint_path)])
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["rounds"] == 300
+    assert checkpoint_path.exists()
+
+
+def test_replay_plays_library_shoes(capsys, tmp_path):
+    library_path = tmp_path / "shoes.bin"
+    write_shoe_library(library_path, 4, 2, seed=3)
+    main(["replay", str(library_path), "--first-shoe", "1", "--natural-payout", "6:5"])
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["shoes"] == 3
+    assert summary["rounds"] > 0
+
+
+def test_simulate_defers_heavy_imports():
+    script = (
+        "import sys; from blackjack.__main__ import main; main(['simulate', '--rounds', '10']); "
+        "print('numpy' in sys.modules, 'multiprocessing' in sys.modules, file=sys.stderr)"
+    )
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert completed.stderr.split() == ["False", "False"]
+
+
+def test_profile_option_writes_folded_stacks(capsys, tmp_path):
+    folded_path = tmp_path / "profile.folded"
+    main(["--profile", str(folded_path), "--profile-interval", "5", "simulate", "--rounds", "100"])
+    assert "Deck.deal_card" in capsys.readouterr().err
+    assert "blackjack.deck.Deck.deal_card" in folded_path.read_text()
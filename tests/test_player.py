@@ -0,0 +1,41 @@
+"""Tests for player balances and integer money accounting. Run using: python -m pytest."""
+
+import pytest
+from blackjack.card import Card
+from blackjack.hand import DealerHand, PlayerHand
+from blackjack.player import Player
+from blackjack.rules import Rules, payout_amount
+
+
+@pytest.fixture
+def player_fixture():
+    return Player("Ann")
+
+
+def test_amounts_in_minor_units(player_fixture):
+    assert player_fixture.get_balance() == 50000
+    assert player_fixture.format_amount(1250) == "£12.50"
+    assert player_fixture.to_minor_units("£12.5") == 1250
+    assert player_fixture.to_minor_units("0.125") == 12
+    for invalid_amount in ("ten", "nan", "inf"):
+        with pytest.raises(ValueError):
+            player_fixture.to_minor_units(invalid_amount)
+
+
+def test_exact_payouts():
+    assert payout_amount(1000, Rules().natural_multiplier()) == 2500
+    assert payout_amount(1001, Rules().natural_multiplier()) == 2502
+    assert payout_amount(1000, Rules(natural_payout=(6, 5)).natural_multiplier()) == 2200
+    assert sum(payout_amount(10, Rules().natural_multiplier()) for _ in range(10 ** 5)) == 25 * 10 ** 5
+
+
+def test_natural_settles_exactly(player_fixture, ace_spades_fixture, queen_spades_fixture, three_clubs_fixture):
+    players_hand = PlayerHand(player_fixture)
+    players_hand._live_hand.extend([ace_spades_fixture, queen_spades_fixture])
+    players_hand._natural = True
+    players_hand.add_bet(1001)
+    player_fixture.update_balance(-1001)
+    dealers_hand = DealerHand(Rules())
+    dealers_hand._live_hand.extend([three_clubs_fixture, Card("Hearts", "Nine", "9", 9, 0)])
+    dealers_hand.settle_naturals(players_hand, player_fixture)
+    assert player_fixture.get_balance() == 50000 + 1501
@@ -0,0 +1,56 @@
+"""Tests for exact outcome probabilities and round EV. Run using: python -m pytest."""
+
+import itertools
+import pytest
+from blackjack.card import Card
+from blackjack.deck import Deck
+from blackjack.probability import OutcomeCalculator, shoe_composition
+from blackjack.simulation import play_round
+from blackjack.strategy import BasicStrategy
+
+
+def make_card(value):
+    if value == 1:
+        return Card("Hearts", "Ace", "A", (1, 11), 0)
+    rank_name = ("Two", "Three", "Four", "Five", "Six", "Seven", "Eight", "Nine", "Ten")[value - 2]
+    return Card("Clubs", rank_name, str(value), value, 0)
+
+
+def test_distributions_sum_to_one():
+    composition = shoe_composition(Deck(1))
+    calculator = OutcomeCalculator()
+    dealer_outcomes = calculator.dealer_distribution([make_card(6)], composition)
+    assert sum(dealer_outcomes.values()) == pytest.approx(1)
+    assert set(dealer_outcomes) == {17, 18, 19, 20, 21, "bust"}
+    assert 0.4 < dealer_outcomes["bust"] < 0.45
+    player_outcomes = calculator.player_distribution([make_card(10)], make_card(10), composition)
+    assert sum(player_outcomes.values()) == pytest.approx(1)
+    assert player_outcomes["natural"] == pytest.approx(4 / 52)
+
+
+def test_round_ev_matches_every_deal():
+    player_cards, dealer_upcard = [make_card(10), make_card(2)], make_card(10)
+    shoe_values = (1, 5, 6, 7, 8, 9, 10)
+    ev = OutcomeCalculator().round_ev(
+        player_cards, dealer_upcard, shoe_composition(make_card(value) for value in shoe_values)
+    )
+    net_total = 0
+    orderings = list(itertools.permutations(shoe_values))
+    for ordering in orderings:
+        dealt_cards = [player_cards[0], dealer_upcard, player_cards[1]] + [make_card(value) for value in ordering]
+        live_deck = Deck(1)
+        live_deck.load_shoe(b"".join(Deck.encode_card(card) for card in dealt_cards))
+        net_total += play_round(live_deck, BasicStrategy(), bet=100)[0]
+    assert ev == pytest.approx(net_total / len(orderings) / 100)
+
+
+def test_initial_ev_matches_every_shuffle():
+    shoe_values = (10, 10, 10, 9, 8, 7, 6, 5)
+    ev = OutcomeCalculator().initial_ev(shoe_composition(make_card(value) for value in shoe_values))
+    orderings = set(itertools.permutations(shoe_values))
+    net_total = 0
+    for ordering in orderings:
+        live_deck = Deck(1)
+        live_deck.load_shoe(b"".join(Deck.encode_card(make_card(value)) for value in ordering))
+        net_total += play_round(live_deck, BasicStrategy(), bet=100)[0]
+    assert ev == pytest.approx(net_total / len(orderings) / 100)
@@ -0,0 +1,48 @@
+"""Tests for the hot-path profiler. Run using: python -m pytest."""
+
+import random
+from blackjack import Deck, Hand
+from blackjack.profiling import HotPathProfiler
+from blackjack.simulation import play_round
+from blackjack.strategy import BasicStrategy
+
+
+def play_rounds(round_count):
+    live_deck = Deck(6, rng=random.Random(8))
+    strategy = BasicStrategy()
+    for _ in range(round_count):
+        play_round(live_deck, strategy)
+
+
+def test_profiler_counts_and_restores():
+    original_deal_card = Deck.deal_card
+    with HotPathProfiler(sample_interval=1) as profiler:
+        assert Deck.deal_card is not original_deal_card
+        play_rounds(50)
+    assert Deck.deal_card is original_deal_card
+    assert not profiler.is_installed()
+    function_statistics = {statistics[0]: statistics[1:] for statistics in profiler.function_statistics()}
+    call_count, sampled_calls, cumulative_time = function_statistics["Deck.deal_card"]
+    assert call_count == sampled_calls >= 200
+    assert cumulative_time > 0
+    assert function_statistics["Hand.draw_card"][0] == call_count  # Every card dealt is drawn into a hand
+    assert function_statistics["DealerHand.resolve_hand"] == (0, 0, None)  # Only the interactive game resolves hands
+
+
+def test_profiler_samples_every_nth_call():
+    with HotPathProfiler(sample_interval=7) as profiler:
+        play_rounds(50)
+    for function_name, call_count, sampled_calls, _ in profiler.function_statistics():
+        assert sampled_calls == call_count // 7, function_name
+
+
+def test_folded_stacks():
+    with HotPathProfiler(sample_interval=3, functions=[(Hand, "draw_card"), (Deck, "deal_card")]) as profiler:
+        play_rounds(50)
+    folded_lines = profiler.folded_stacks()
+    assert folded_lines
+    for line in folded_lines:
+        stack, stack_time = line.rsplit(" ", 1)
+        assert int(stack_time) > 0
+        assert "blackjack.simulation.play_round" in stack
+    assert any(line.split(" ")[0].endswith("Hand.draw_card;blackjack.deck.Deck.deal_card") for line in folded_lines)
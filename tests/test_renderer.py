@@ -0,0 +1,51 @@
+"""Tests for incremental terminal rendering. Run using: python -m pytest."""
+
+import io
+import pytest
+from blackjack.card import Card
+from blackjack.hand import DealerHand, PlayerHand
+from blackjack.player import Player
+from blackjack.renderer import TableRenderer
+
+
+@pytest.fixture
+def table_fixture(ace_spades_fixture, three_clubs_fixture, queen_spades_fixture):
+    player_obj = Player("Ann")
+    players_hand = PlayerHand(player_obj)
+    players_hand._live_hand.extend([three_clubs_fixture, queen_spades_fixture])
+    dealers_hand = DealerHand()
+    dealers_hand._live_hand.append(ace_spades_fixture)
+    stream = io.StringIO()
+    renderer = TableRenderer(stream=stream)
+    renderer.open()
+    renderer.show_hands(dealers_hand, players_hand)
+    renderer.show_balance(player_obj, 1000)
+    return renderer, stream, players_hand, dealers_hand, player_obj
+
+
+def test_unchanged_cells_write_nothing(table_fixture):
+    renderer, stream, players_hand, dealers_hand, player_obj = table_fixture
+    written = stream.getvalue()
+    renderer.show_hands(dealers_hand, players_hand)
+    renderer.show_balance(player_obj, 1000)
+    assert stream.getvalue() == written
+
+
+def test_new_card_rewrites_only_its_cells(table_fixture):
+    renderer, stream, players_hand, dealers_hand, player_obj = table_fixture
+    written_length = len(stream.getvalue())
+    players_hand._live_hand.append(Card("Hearts", "Five", "5", 5, 0))
+    renderer.show_hands(dealers_hand, players_hand)
+    update = stream.getvalue()[written_length:]
+    assert "5-H" in update and "Value: 18" in update
+    assert "Ann" not in update and "Q-S" not in update and "A-S" not in update
+
+
+def test_prompt_reads_response():
+    stream = io.StringIO()
+    renderer = TableRenderer(stream=stream, input_function=lambda text: "h")
+    renderer.open()
+    assert renderer.prompt("Hit [h] or Stand [s]: ") == "h"
+    renderer.close()
+    assert not renderer.is_open()
+    assert renderer.get_characters_written() == len(stream.getvalue())
@@ -0,0 +1,76 @@
+"""Tests for running round statistics and early stopping. Run using: python -m pytest."""
+
+import statistics
+import pytest
+from blackjack.deck import Deck
+from blackjack.running_stats import RoundStatistics
+from blackjack.simulation import run_simulation
+
+round_results = [(-100, "loss"), (100, "win"), (150, "natural"), (0, "push"), (-100, "bust"), (100, "win")]
+
+
+@pytest.fixture
+def round_statistics_fixture():
+    round_statistics = RoundStatistics()
+    for net_result, outcome in round_results:
+        round_statistics.update(net_result, outcome)
+    return round_statistics
+
+
+def test_running_mean_variance(round_statistics_fixture):
+    net_results = [net_result for net_result, _ in round_results]
+    assert round_statistics_fixture.mean() == pytest.approx(statistics.mean(net_results))
+    assert round_statistics_fixture.variance() == pytest.approx(statistics.variance(net_results))
+
+
+def test_histogram_and_rates(round_statistics_fixture):
+    assert round_statistics_fixture.get_histogram() == {-100: 2, 0: 1, 100: 2, 150: 1}
+    assert round_statistics_fixture.outcome_rate("win") == pytest.approx(2 / 6)
+    assert round_statistics_fixture.outcome_rate("stand_off") == 0.0
+
+
+def test_merge_matches_single_pass(round_statistics_fixture):
+    first_half, second_half = RoundStatistics(), RoundStatistics()
+    for net_result, outcome in round_results[:2]:
+        first_half.update(net_result, outcome)
+    for net_result, outcome in round_results[2:]:
+        second_half.update(net_result, outcome)
+    first_half.merge(second_half)
+    assert len(first_half) == len(round_statistics_fixture)
+    assert first_half.mean() == pytest.approx(round_statistics_fixture.mean())
+    assert first_half.variance() == pytest.approx(round_statistics_fixture.variance())
+    assert first_half.get_histogram() == round_statistics_fixture.get_histogram()
+    assert first_half.get_net_total() == round_statistics_fixture.get_net_total() == 150
+
+
+def test_update_batch_matches_single_pass(round_statistics_fixture):
+    batch_statistics = RoundStatistics()
+    batch_statistics.update(*round_results[0])
+    batch_statistics.update_batch(
+        [net_result for net_result, _ in round_results[1:]], [outcome for _, outcome in round_results[1:]]
+    )
+    assert batch_statistics.get_net_total() == round_statistics_fixture.get_net_total()
+    assert batch_statistics.mean() == pytest.approx(round_statistics_fixture.mean())
+    assert batch_statistics.variance() == pytest.approx(round_statistics_fixture.variance())
+    assert batch_statistics.get_histogram() == round_statistics_fixture.get_histogram()
+    assert batch_statistics.get_outcome_counts() == round_statistics_fixture.get_outcome_counts()
+
+
+def test_update_batch_large_results_are_exact():
+    large_result = 4 * 10 ** 9  # Squares overflow int64 once summed over a few rounds
+    batch_statistics = RoundStatistics()
+    batch_statistics.update_batch([large_result] * 3 + [-large_result], {"win": 3, "loss": 1, "push": 0})
+    single_statistics = RoundStatistics()
+    for net_result, outcome in [(large_result, "win")] * 3 + [(-large_result, "loss")]:
+        single_statistics.update(net_result, outcome)
+    assert batch_statistics.get_net_total() == single_statistics.get_net_total() == 2 * large_result
+    assert batch_statistics.variance() == pytest.approx(single_statistics.variance())
+    assert batch_statistics.get_outcome_counts() == single_statistics.get_outcome_counts()
+
+
+def test_simulation_stops_early():
+    round_statistics = run_simulation(
+        Deck(6), 100000, target_half_width=10, min_rounds=100, check_interval=100
+    )
+    assert len(round_statistics) < 100000
+    assert round_statistics.is_precise(10)
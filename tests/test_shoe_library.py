@@ -0,0 +1,72 @@
+"""Tests for shoe libraries and decks dealing from pre-shuffled shoes. Run using: python -m pytest."""
+
+import mmap
+import pytest
+from collections import Counter
+from blackjack.deck import Deck
+from blackjack.shoe_library import ShoeLibrary, write_shoe_library
+
+
+@pytest.fixture
+def library_path_fixture(tmp_path):
+    library_path = tmp_path / "shoes.bin"
+    write_shoe_library(library_path, 3, 1, seed=7)
+    return library_path
+
+
+def test_library_length(library_path_fixture):
+    with ShoeLibrary(library_path_fixture) as library:
+        assert len(library) == 3
+        assert library.get_deck_count() == 1
+
+
+def test_library_seed_reproducible(tmp_path, library_path_fixture):
+    repeat_path = tmp_path / "repeat.bin"
+    write_shoe_library(repeat_path, 3, 1, seed=7)
+    assert repeat_path.read_bytes() == library_path_fixture.read_bytes()
+
+
+def test_attached_deck_deals_full_shoe(library_path_fixture):
+    with ShoeLibrary(library_path_fixture) as library:
+        library_deck = Deck(1)
+        library_deck.attach_shoe_library(library)
+        dealt = Counter()
+        while len(library_deck) > 0:
+            card = library_deck.deal_card()
+            dealt[(card._rank, card._suit)] += 1
+        library_deck.detach_shoe_library()
+    assert len(dealt) == 52
+    assert set(dealt.values()) == {1}
+
+
+def test_attached_deck_matches_library_order(library_path_fixture):
+    with ShoeLibrary(library_path_fixture) as library:
+        library_deck = Deck(1)
+        library_deck.attach_shoe_library(library, shoe_index=2)
+        expected_codes = bytes(library.shoe(2))
+        dealt_codes = b"".join(Deck.encode_card(card) for card in library_deck)
+        library_deck.detach_shoe_library()
+    assert dealt_codes == expected_codes
+
+
+def test_mismatched_deck_count(library_path_fixture):
+    with ShoeLibrary(library_path_fixture) as library:
+        with pytest.raises(AssertionError):
+            Deck(6).attach_shoe_library(library)
+
+
+def test_invalid_library_is_unmapped(tmp_path, library_path_fixture, monkeypatch):
+    opened_maps = []
+    real_mmap = mmap.mmap
+
+    def recording_mmap(*args, **kwargs):
+        opened_maps.append(real_mmap(*args, **kwargs))
+        return opened_maps[-1]
+
+    monkeypatch.setattr(mmap, "mmap", recording_mmap)
+    for bad_bytes in (b"not a shoe library!", library_path_fixture.read_bytes()[:-1]):
+        bad_path = tmp_path / "bad.bin"
+        bad_path.write_bytes(bad_bytes)
+        with pytest.raises(AssertionError):
+            ShoeLibrary(bad_path)
+        assert opened_maps[-1].closed
@@ -0,0 +1,82 @@
+"""Tests for side bet settlement and pricing. Run using: python -m pytest."""
+
+import numpy as np
+import pytest
+from blackjack.card import Card
+from blackjack.deck import Deck
+from blackjack.hand import DealerHand, PlayerHand
+from blackjack.player import Player
+from blackjack.side_bets import (
+    card_counts,
+    card_type,
+    initial_deal_cards,
+    perfect_pairs,
+    price_side_bets,
+    simulate_initial_deals,
+    twenty_one_three,
+)
+
+
+def test_perfect_pairs_outcomes(ace_spades_fixture, ace_diamonds_fixture, queen_spades_fixture):
+    ace_clubs = Card("Clubs", "Ace", "A", (1, 11), 0)
+    assert perfect_pairs.outcome([ace_spades_fixture, ace_spades_fixture]) == "perfect pair"
+    assert perfect_pairs.outcome([ace_spades_fixture, ace_clubs]) == "coloured pair"
+    assert perfect_pairs.outcome([ace_spades_fixture, ace_diamonds_fixture]) == "mixed pair"
+    assert perfect_pairs.outcome([ace_spades_fixture, queen_spades_fixture]) == "lose"
+    assert perfect_pairs.payout([ace_spades_fixture, ace_diamonds_fixture], 100) == 700
+    assert perfect_pairs.payout([ace_spades_fixture, queen_spades_fixture], 100) == 0
+
+
+def test_twenty_one_three_outcomes(ace_spades_fixture, queen_spades_fixture, three_clubs_fixture):
+    king_spades = Card("Spades", "King", "K", 10, 0)
+    king_hearts = Card("Hearts", "King", "K", 10, 0)
+    two_spades = Card("Spades", "Two", "2", 2, 0)
+    assert twenty_one_three.outcome([king_spades, ace_spades_fixture, queen_spades_fixture]) == "straight flush"
+    assert twenty_one_three.outcome([king_hearts, ace_spades_fixture, queen_spades_fixture]) == "straight"
+    assert twenty_one_three.outcome([ace_spades_fixture, two_spades, three_clubs_fixture]) == "straight"
+    assert twenty_one_three.outcome([king_spades, ace_spades_fixture, two_spades]) == "flush"
+    assert twenty_one_three.outcome([king_spades, king_spades, king_spades]) == "suited trips"
+    assert twenty_one_three.outcome([king_spades, king_hearts, king_spades]) == "three of a kind"
+    assert twenty_one_three.outcome([king_hearts, ace_spades_fixture, two_spades]) == "lose"
+
+
+def test_exact_house_edges():
+    six_deck_counts = card_counts(Deck(6))
+    assert perfect_pairs.house_edge(six_deck_counts) == pytest.approx(0.0611, abs=1e-4)
+    assert twenty_one_three.house_edge(np.full(52, 8)) == pytest.approx(0.0370, abs=1e-4)
+    assert sum(twenty_one_three.outcome_probabilities(six_deck_counts).values()) == pytest.approx(1)
+    assert perfect_pairs.outcome_probabilities(card_counts(Deck(1)))["perfect pair"] == 0
+
+
+def test_batch_matches_single_settlement():
+    card_types = simulate_initial_deals(500, 2, np.random.default_rng(3))
+    decoded = [[Deck.decode_card(*divmod(int(type_idx), 4)) for type_idx in deal] for deal in card_types]
+    assert [card_type(card) for card in decoded[0]] == card_types[0].tolist()
+    for side_bet in (perfect_pairs, twenty_one_three):
+        batch_nets = side_bet.batch_net_results(card_types, 100)
+        assert batch_nets.tolist() == [side_bet.payout(deal, 100) - 100 for deal in decoded]
+
+
+def test_simulated_deals_match_exact_edge():
+    side_bet_statistics = price_side_bets(400_000, 6, seed=5)
+    for side_bet in (perfect_pairs, twenty_one_three):
+        lower_bound, upper_bound = side_bet_statistics[side_bet.get_name()].confidence_interval(4)
+        assert lower_bound <= -100 * side_bet.house_edge(np.full(52, 6)) <= upper_bound
+        outcome_counts = side_bet_statistics[side_bet.get_name()].get_outcome_counts()
+        assert set(outcome_counts) <= set(side_bet.get_outcome_names())
+        assert sum(outcome_counts.values()) == 400_000
+
+
+def test_deal_never_repeats_a_single_deck_card():
+    card_types = simulate_initial_deals(10_000, 1, np.random.default_rng(9))
+    assert not (card_types[:, 0] == card_types[:, 1]).any()
+    assert not (card_types[:, 1] == card_types[:, 2]).any()
+
+
+def test_initial_deal_cards(ace_spades_fixture, queen_spades_fixture, three_clubs_fixture):
+    players_hand = PlayerHand(Player("Ann"))
+    players_hand._live_hand.extend([ace_spades_fixture, queen_spades_fixture])
+    dealers_hand = DealerHand()
+    dealers_hand._live_hand.append(three_clubs_fixture)
+    deal_cards = initial_deal_cards(players_hand, dealers_hand)
+    assert deal_cards == [ace_spades_fixture, queen_spades_fixture, three_clubs_fixture]
@@ -0,0 +1,41 @@
+"""Tests for headless play and shared-memory simulation. Run using: python -m pytest."""
+
+import pytest
+from blackjack.deck import Deck
+from blackjack.rules import Rules
+from blackjack.shared_shoes import run_shared_simulation
+from blackjack.simulation import outcome_names, play_round, play_shoe
+from blackjack.strategy import BasicStrategy, ThresholdStrategy
+
+
+@pytest.mark.parametrize("player_total,is_soft,dealer_upcard,expected", [
+    (16, False, 10, True),
+    (16, False, 6, False),
+    (12, False, 3, True),
+    (18, True, 9, True),
+    (18, True, 8, False),
+    (17, False, 11, False),
+])
+def test_basic_strategy_decisions(player_total, is_soft, dealer_upcard, expected):
+    assert BasicStrategy().should_hit(player_total, is_soft, dealer_upcard) == expected
+
+
+def test_play_round_result():
+    net_result, outcome = play_round(Deck(1), ThresholdStrategy(), bet=200)
+    assert outcome in outcome_names
+    assert net_result in (-200, 0, 200, 300)
+
+
+def test_play_shoe_stops_at_limit():
+    live_deck = Deck(1)
+    rounds = list(play_shoe(live_deck, rules=Rules(deck_count=1, deck_length_limit=20)))
+    assert len(rounds) > 0
+    assert len(live_deck) < 20
+
+
+def test_shared_simulation_totals():
+    totals = run_shared_simulation(
+        4, rules=Rules(deck_count=1, deck_length_limit=15), worker_count=2, seed=11
+    )
+    assert totals["rounds"] > 0
+    assert sum(totals[outcome] for outcome in outcome_names) == totals["rounds"]
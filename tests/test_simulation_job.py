@@ -0,0 +1,41 @@
+"""Tests for checkpointed simulation jobs. Run using: python -m pytest."""
+
+import random
+import pytest
+from blackjack.deck import Deck
+from blackjack.simulation_job import SimulationJob
+from blackjack.strategy import ThresholdStrategy
+
+
+def test_restore_shoe_state():
+    live_deck = Deck(1, rng=random.Random(5))
+    for _ in range(10):
+        live_deck.deal_card()
+    shoe_state = live_deck.get_shoe_state()
+    expected_codes = [Deck.encode_card(card) for card in live_deck]
+
+    restored_deck = Deck(1, rng=random.Random(99))
+    restored_deck.restore_shoe_state(shoe_state)
+    assert [Deck.encode_card(card) for card in restored_deck] == expected_codes
+
+
+def test_resumed_job_matches_uninterrupted(tmp_path):
+    uninterrupted = SimulationJob(2500, seed=3).run()
+
+    checkpoint_path = tmp_path / "job.json"
+    SimulationJob(2500, seed=3, checkpoint_path=checkpoint_path, checkpoint_interval=100).run(max_rounds=1234)
+    resumed_job = SimulationJob(2500, seed=3, checkpoint_path=checkpoint_path, checkpoint_interval=100)
+    assert resumed_job.get_round_index() == 1234
+    resumed = resumed_job.run()
+
+    assert resumed_job.is_complete()
+    assert resumed.to_dict() == uninterrupted.to_dict()
+
+
+def test_resume_rejects_different_strategy_parameters(tmp_path):
+    checkpoint_path = tmp_path / "job.json"
+    SimulationJob(500, seed=3, checkpoint_path=checkpoint_path, strategy=ThresholdStrategy(15)).run(max_rounds=100)
+    resumed_job = SimulationJob(500, seed=3, checkpoint_path=checkpoint_path, strategy=ThresholdStrategy(15))
+    assert resumed_job.get_round_index() == 100
+    with pytest.raises(AssertionError):
+        SimulationJob(500, seed=3, checkpoint_path=checkpoint_path, strategy=ThresholdStrategy(17))
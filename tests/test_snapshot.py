@@ -0,0 +1,59 @@
+"""Tests for round snapshots and forks. Run using: python -m pytest."""
+
+import random
+from blackjack.deck import Deck
+from blackjack.hand import DealerHand, PlayerHand
+from blackjack.player import Player
+from blackjack.snapshot import RoundFork, RoundSnapshot
+
+
+def captured_round():
+    live_deck = Deck(2, rng=random.Random(8))
+    player_obj = Player("Ann")
+    players_hand, dealers_hand = PlayerHand(player_obj), DealerHand()
+    players_hand.add_bet(1000)
+    player_obj.update_balance(-1000)
+    players_hand.draw_card(live_deck)
+    dealers_hand.draw_card(live_deck, "up")
+    players_hand.draw_card(live_deck)
+    dealers_hand.draw_card(live_deck, "down")
+    return live_deck, RoundSnapshot.capture(live_deck, players_hand, dealers_hand, player_obj)
+
+
+def test_restore_round_state():
+    live_deck, snapshot = captured_round()
+    fork = RoundFork(2).restore(snapshot)
+    assert len(snapshot) == len(fork.live_deck) == len(live_deck) == 100
+    assert [card.short_card_details() for card in fork.live_deck] == [
+        card.short_card_details() for card in live_deck
+    ]
+    assert fork.player_obj.get_balance() == 49000 and fork.player_hand.get_bet() == 1000
+    assert [card.is_face_up() for card in fork.dealer_hand] == [True, False]
+    assert RoundSnapshot.capture(fork.live_deck, fork.player_hand, fork.dealer_hand, fork.player_obj) == snapshot
+
+
+def test_forks_are_independent():
+    _, snapshot = captured_round()
+    fork = RoundFork(2)
+    hit_net = fork.restore(snapshot).what_if(True)
+    stand_net = fork.restore(snapshot).what_if(False)
+    assert fork.restore(snapshot).what_if(True) == hit_net
+    assert fork.restore(snapshot).what_if(False) == stand_net
+    assert len(fork.restore(snapshot, rng=random.Random(1)).live_deck) == len(snapshot)
+    assert len(fork.player_hand) == 2
+
+
+def test_rollouts_redeal_the_hole_card():
+    _, snapshot = captured_round()
+    fork, rng = RoundFork(2), random.Random(5)
+    captured_hole = snapshot.get_hand_states()[1][0][2:]
+    hole_cards = set()
+    for _ in range(50):
+        fork.restore(snapshot, rng)
+        hole_card = fork.dealer_hand._live_hand[1]
+        assert not hole_card.is_face_up()
+        assert not fork.dealer_hand.is_natural() and fork.dealer_hand.is_active()
+        hole_cards.add(Deck.encode_card(hole_card))
+        assert len(fork.live_deck) == len(snapshot)
+    assert len(hole_cards) > 10
+    assert Deck.encode_card(fork.restore(snapshot).dealer_hand._live_hand[1]) == captured_hole
@@ -0,0 +1,52 @@
+"""Tests for composition-dependent strategy indexes. Run using: python -m pytest."""
+
+import pytest
+from blackjack.bet_spread import HiLoCounter
+from blackjack.deck import Deck
+from blackjack.probability import OutcomeCalculator
+from blackjack.strategy import BasicStrategy
+from blackjack.strategy_index import IndexedStrategy, shoe_state_composition, write_strategy_index
+
+
+@pytest.fixture(scope="module")
+def index_path_fixture(tmp_path_factory):
+    index_path = tmp_path_factory.mktemp("index") / "strategy.bin"
+    write_strategy_index(
+        index_path, deck_count=1, decks_remaining=(1,), true_counts=(0,), max_hand_cards=2, upcard_classes=(9,),
+        processes=1,
+    )
+    return index_path
+
+
+def test_shoe_state_composition():
+    assert shoe_state_composition(1, 0) == (4, 4, 4, 4, 4, 4, 4, 4, 4, 16)
+    rich_shoe = shoe_state_composition(2, 5)
+    assert sum(rich_shoe) == 104
+    assert rich_shoe[0] == 9 and rich_shoe[1] == 7 and rich_shoe[-1] == 36
+
+
+def test_index_matches_exact_decisions(index_path_fixture):
+    calculator = OutcomeCalculator()
+    with IndexedStrategy(index_path_fixture) as strategy:
+        assert len(strategy) == 54  # Two-card hands of every class pair but ace-ten
+        for player_classes, upcard_class in (((5, 9), 9), ((0, 6), 9), ((1, 9), 9), ((0, 4), 9), ((3, 3), 9)):
+            unseen = list(shoe_state_composition(1, 0))
+            for class_idx in player_classes + (upcard_class,):
+                unseen[class_idx] -= 1
+            stand_ev, hit_ev = calculator.decision_evs(player_classes, upcard_class, unseen)
+            assert strategy.lookup(player_classes, upcard_class) == (hit_ev > stand_ev)
+
+
+def test_unindexed_hand_falls_back(index_path_fixture):
+    with IndexedStrategy(index_path_fixture) as strategy:
+        assert strategy.lookup((1, 2, 3), 9) is None
+        assert strategy.lookup((5, 9), 5) is None
+        assert strategy.should_hit(12, False, 2) == BasicStrategy().should_hit(12, False, 2)
+
+
+def test_counter_selects_bucket(index_path_fixture):
+    counter = HiLoCounter(Deck(1))
+    with IndexedStrategy(index_path_fixture, counter) as strategy:
+        for _ in range(20):
+            counter.deal_card()
+        assert strategy.lookup((5, 9), 9) is not None
@@ -0,0 +1,57 @@
+"""Tests for table rules and rule-variant sweeps. Run using: python -m pytest."""
+
+import os
+from fractions import Fraction
+from blackjack.card import Card
+from blackjack.hand import DealerHand
+from blackjack.rules import Rules
+from blackjack.strategy import BasicStrategy, ThresholdStrategy
+from blackjack.sweep import cell_key, rules_grid, run_sweep
+
+
+def test_rules_grid_combinations():
+    grid = rules_grid(deck_count=[1, 6], natural_payout=[(3, 2), (6, 5)])
+    assert len(grid) == 4
+    assert Rules(deck_count=6, natural_payout=(6, 5)) in grid
+
+
+def test_natural_multiplier():
+    assert Rules().natural_multiplier() == 2.5
+    assert Rules(natural_payout=(6, 5)).natural_multiplier() == Fraction(11, 5)
+
+
+def test_equal_rules_hash_equally():
+    assert hash(Rules()) == hash(Rules(natural_payout=[3, 2]))
+    rules_results = {Rules(): "S17", Rules(dealer_hits_soft_17=True): "H17"}
+    assert rules_results[Rules()] == "S17"
+    assert rules_results[Rules(dealer_hits_soft_17=True)] == "H17"
+    assert len({Rules(), Rules(), Rules(natural_payout=(6, 5))}) == 2
+
+
+def test_dealer_hits_soft_17(ace_spades_fixture):
+    six_hearts = Card("Hearts", "Six", "6", 6, 0)
+    for hits_soft_17 in (False, True):
+        dealer_hand = DealerHand(Rules(dealer_hits_soft_17=hits_soft_17))
+        dealer_hand._live_hand.extend([ace_spades_fixture, six_hearts])
+        assert dealer_hand._must_hit() == hits_soft_17
+
+
+def test_cell_key_depends_on_rules_and_seed():
+    assert cell_key(Rules(), 1, 100) == cell_key(Rules(), 1, 100)
+    assert cell_key(Rules(), 1, 100) != cell_key(Rules(), 2, 100)
+    assert cell_key(Rules(), 1, 100) != cell_key(Rules(dealer_hits_soft_17=True), 1, 100)
+
+
+def test_cell_key_depends_on_strategy_parameters():
+    assert cell_key(Rules(), 1, 100) == cell_key(Rules(), 1, 100, BasicStrategy())
+    assert cell_key(Rules(), 1, 100, ThresholdStrategy(12)) != cell_key(Rules(), 1, 100, ThresholdStrategy(17))
+    assert cell_key(Rules(), 1, 100, ThresholdStrategy(17)) == cell_key(Rules(), 1, 100, ThresholdStrategy(17))
+
+
+def test_sweep_uses_cache(tmp_path):
+    grid = rules_grid(dealer_hits_soft_17=[False, True])
+    first_results = run_sweep(grid, 200, seed=4, cache_dir=tmp_path, processes=2)
+    assert len(os.listdir(tmp_path)) == 2
+    repeat_results = run_sweep(grid, 200, seed=4, cache_dir=tmp_path, processes=2)
+    for (_, first_stats), (_, repeat_stats) in zip(first_results, repeat_results):
+        assert first_stats.to_dict() == repeat_stats.to_dict()